@@ -415,72 +415,6 @@ def health(request):
     return (503 if status["status"] != "ok" else 200), status
 
 
-# Headlines shown per card in the framing switcher.
-CARD_FRAMINGS = 3
-# Outlet names listed under a card.
-CARD_SOURCES = 5
-
-
-def _card_articles(story_ids: list[int]) -> dict[int, dict]:
-    """
-    Fetch just the article fields the feed cards render, for one page of stories.
-
-    A single values() query over the page's stories, returning five columns and
-    no model instances. It replaces a prefetch that hydrated every publishable
-    article of every story — with its Source joined — to use three of them.
-
-    Ordered by (story, published_date, id) so the first row per story is the
-    earliest report, which is what should supply the image and lead attribution.
-    """
-    if not story_ids:
-        return {}
-
-    rows = (
-        Article.objects
-        .filter(
-            story_id__in=story_ids,
-            source__trust_tier=Source.TrustTier.AUTO_PUBLISH,
-        )
-        .order_by('story_id', 'published_date', 'id')
-        .values(
-            'story_id', 'title', 'url', 'image_url',
-            'source__name', 'source__publisher_domain', 'source__url',
-        )
-    )
-
-    cards: dict[int, dict] = {}
-    for row in rows.iterator(chunk_size=500):
-        card = cards.setdefault(row['story_id'], {
-            'image_url': None,
-            'sources': [],
-            'framing_preview': [],
-            '_seen': set(),
-        })
-
-        # First image encountered wins — rows arrive oldest-first, so this is the
-        # image from whichever outlet broke the story.
-        if card['image_url'] is None and row['image_url']:
-            card['image_url'] = row['image_url']
-
-        name = row['source__name']
-        if name in card['_seen']:
-            continue
-        card['_seen'].add(name)
-
-        if len(card['sources']) < CARD_SOURCES:
-            card['sources'].append(name)
-        if len(card['framing_preview']) < CARD_FRAMINGS:
-            card['framing_preview'].append({
-                'source': name,
-                'title': row['title'],
-                'url': row['url'],
-            })
-
-    for card in cards.values():
-        card.pop('_seen', None)
-    return cards
-
-
 # ==========================================================================
 # Public API — Stories (V3 primary entity)
 # ==========================================================================
@@ -514,40 +448,71 @@ def list_stories(
     if sort not in ("latest", "velocity", "momentum", "significance"):
         sort = "latest"
 
+    # The first pages the frontend actually requests are pre-rendered by
+    # clustering as compressed JSON, once per generation, and served as bytes
+    # with an ETag — no query, no serialisation, and a 304 for a reader who
+    # already has them (api/editions.py).
+    from api.editions import SNAPSHOT_EDITIONS, serve_snapshot
+
+    if not cursor and not status and (sort, min_sources or 1, limit) in SNAPSHOT_EDITIONS:
+        return serve_snapshot(
+            request, sort=sort, min_sources=min_sources or 1, limit=limit, category=category,
+        )
+
     # Response cache for the feed.
     #
     # This is the most-requested endpoint in the product and had no cache at
     # all, while story *detail* had 300s — backwards. The contents only change
-    # when clustering runs, so the key carries the same generation counter that
-    # ingestion bumps: a new batch of stories invalidates every page at once,
-    # and nothing is served stale across it.
+    # when clustering runs, so the key carries the generation of the page's
+    # edition and category, which clustering advances when it changes a story
+    # in them (core/generations.py). No page outlives that beyond the one
+    # rebuild described below.
     #
     # The ranking editions benefit most. `momentum` runs a filtered
     # COUNT(DISTINCT) grouped across articles — 326ms warm — and recomputing
     # that per reader is pure waste when every reader gets the same answer.
-    from core.services.answer_cache import current_generation
+    from core.generations import feed_scope, token
 
-    feed_cache_key = (
-        f"feed:{current_generation()}:{sort}:{category or 'all'}:"
+    feed_filters = (
+        f"{sort}:{category or 'all'}:"
         f"{status or 'all'}:{min_sources or 1}:{limit}:{cursor or 'start'}"
     )
-    cached_feed = cache.get(feed_cache_key)
-    if cached_feed is not None:
-        return cached_feed
+    # Misses are coalesced (core/single_flight.py): a bump makes every reader
+    # miss at once, and only one of them needs to build the page. The others
+    # get the previous generation's page meanwhile, kept under a key without
+    # the generation.
+    from core.single_flight import get_or_build
+
+    return get_or_build(
+        f"feed:{token(feed_scope(sort, category))}:{feed_filters}",
+        lambda: build_feed_page(
+            sort=sort, category=category, status=status, min_sources=min_sources,
+            limit=limit, cursor=cursor,
+        ),
+        # Generation-keyed, so this TTL is only a backstop for a quiet corpus —
+        # new reporting invalidates by changing the key, not by waiting this out.
+        timeout=120,
+        stale_key=f"feed:stale:{feed_filters}",
+        name="feed",
+    )
+
 
-    # Articles are NOT prefetched here.
+def build_feed_page(*, sort: str, category: Optional[str], status: Optional[str],
+                    min_sources: Optional[int], limit: int, cursor: Optional[str]) -> dict:
+    """
+    One page of the story feed, exactly as `/stories` returns it. Uncached:
+    `list_stories` caches it per generation, and api/editions.py pre-renders
+    the hot editions from it.
+    """
+    # Articles are NOT prefetched here, and nothing is aggregated per request.
     #
     # This used to hydrate every publishable article of every story on the page
     # — full model instances, with their Source joined — purely to (a) count
     # publishers and (b) take three headlines and one image. Both counts are
-    # already denormalised onto the Story row, so a 30-article cluster loaded 30
-    # objects to use three. Measured at 81ms of a 148ms request, and it grew
-    # with cluster size, so the best-covered stories were the most expensive to
-    # list.
-    #
-    # The few article fields the card needs are fetched afterwards in one
-    # values() query over just the stories on this page. See _card_articles().
-    qs = Story.objects.prefetch_related('categories')
+    # already denormalised onto the Story row, and the image, outlets, headlines
+    # and category slugs are on the story's StoryCard, maintained by clustering
+    # (core/story_cards.py). A page is one query: stories joined to their cards.
+    qs = Story.objects.select_related('card')
 
     # Build filtered queryset (before cursor application)
     if category:
@@ -593,7 +558,7 @@ def list_stories(
         # the page — 326ms warm, growing with cluster size, recomputed per
         # request even though every reader gets the same answer.
         #
-        # The column is maintained by core/momentum.py: refreshed when an
+        # The column is maintained by core/momentum.py: updated when an
         # article joins a cluster, and swept every 5 minutes so it DECAYS as the
         # window slides. Momentum falls with the clock rather than with writes,
         # so without that sweep yesterday's news would stay pinned here.
@@ -659,13 +624,19 @@ def list_stories(
         has_next = len(stories) > limit
         stories = stories[:limit]
 
-    # One values() query for the handful of article fields the cards need,
-    # across every story on this page.
-    cards = _card_articles([s.pk for s in stories])
+    from core.story_cards import compute_cards
+
+    # hasattr: a missing one-to-one raises an AttributeError subclass.
+    cards = {story.pk: story.card for story in stories if hasattr(story, 'card')}
+    # A story clustered before cards existed has none until it next changes (or
+    # `manage.py rebuild_story_cards` runs); derive those few from articles.
+    missing = [story.pk for story in stories if story.pk not in cards]
+    if missing:
+        cards.update(compute_cards(missing))
 
     items = []
     for story in stories:
-        card = cards.get(story.pk, {})
+        card = cards[story.pk]
 
         items.append({
             "id": story.id,
@@ -681,10 +652,10 @@ def list_stories(
             "independent_count": story.independent_count,
             "velocity_score": story.velocity_score,
             "status": story.status,
-            "image_url": card.get("image_url"),
-            "categories": [cat.slug for cat in story.categories.all()],
-            "sources": card.get("sources", []),
-            "framing_preview": card.get("framing_preview", []),
+            "image_url": card.image_url,
+            "categories": card.category_slugs,
+            "sources": card.sources,
+            "framing_preview": card.framing_preview,
             # Present only for the momentum edition — outlets that picked the
             # story up inside the window. Lets the UI say "4 new outlets in the
             # last 12 hours" rather than showing an abstract score.
@@ -704,10 +675,6 @@ def list_stories(
         "count": filtered_count if filtered_count is not None else len(items),
         "sort": sort,
     }
-
-    # Generation-keyed, so this TTL is only a backstop for a quiet corpus —
-    # new reporting invalidates by changing the key, not by waiting this out.
-    cache.set(feed_cache_key, payload, timeout=120)
     return payload
 
 
@@ -719,12 +686,19 @@ def get_story(request, story_slug: str):
     This is the page that 'sells the product' (V3 UI spec §4.2).
     """
     from core.invalidation import story_cache_key
+    from core.single_flight import get_or_build
 
+    # Coalesced: `invalidate_story` purges a story just as clustering makes it
+    # worth reading, so its readers miss together. One rebuilds it; the rest
+    # are given the version from before the purge meanwhile.
     cache_key = story_cache_key(story_slug)
-    cached = cache.get(cache_key)
-    if cached:
-        return cached
+    return get_or_build(
+        cache_key, lambda: _story_detail(story_slug),
+        timeout=300, stale_key=f"{cache_key}:stale", name="story",
+    )
 
+
+def _story_detail(story_slug: str) -> dict:
     story = get_object_or_404(Story.objects.prefetch_related('categories'), slug=story_slug)
 
     articles = []
@@ -778,7 +752,6 @@ def get_story(request, story_slug: str):
         "articles": articles,
     }
 
-    cache.set(cache_key, result, timeout=300)
     return result
 
 
@@ -906,11 +879,12 @@ def get_article(request, slug: str):
     if len(slug) > 500:
         slug = slug[:500]
 
-    cache_key = f"article:{slug}"
-    cached = cache.get(cache_key)
-    if cached:
-        return cached
+    from core.single_flight import get_or_build
+
+    return get_or_build(f"article:{slug}", lambda: _article_detail(slug), timeout=300, name="article")
 
+
+def _article_detail(slug: str) -> dict:
     article = get_object_or_404(
         Article.objects.select_related('source', 'story'),
         slug=slug,
@@ -931,7 +905,6 @@ def get_article(request, slug: str):
         "categories": list(article.categories.values_list('slug', flat=True)),
     }
 
-    cache.set(cache_key, result, timeout=300)
     return result
 
 
@@ -1111,14 +1084,13 @@ def ask_the_wire_room(request, payload: AskRequest):
         raise HttpError(503, "Daily Ask-the-Wire-Room AI synthesis quota reached. Please try again tomorrow.")
 
 
-    from core.clustering import get_embedding_model
-    
-    model = get_embedding_model()
-    if not model:
-        return {"answer": "Semantic embeddings are offline. Please try again later.", "context_sources": [], "synthesis_type": "extractive"}
+    # Through the shared embedding server when one is configured, so an API
+    # process never has to load the model itself.
+    from core.clustering import embed_text
 
-    embeddings = list(model.embed([query]))
-    query_vector = [float(x) for x in embeddings[0]]
+    query_vector = embed_text(query)
+    if query_vector is None:
+        return {"answer": "Semantic embeddings are offline. Please try again later.", "context_sources": [], "synthesis_type": "extractive"}
 
     import json
 
@@ -1154,6 +1126,13 @@ def ask_the_wire_room(request, payload: AskRequest):
     sources = sorted({outlet for story in stories for outlet in story.outlets})
     context_text = build_context(stories)
 
+    # The generations the answer is grounded on, read before it is generated:
+    # a clustering run landing mid-answer then retires it, rather than the
+    # answer being filed under the newer generation.
+    from core import generations
+
+    scopes = generations.tokens(generations.answer_scopes([s.story_id for s in stories]))
+
     from core.services.llm import get_provider
     provider = get_provider()
 
@@ -1193,7 +1172,7 @@ def ask_the_wire_room(request, payload: AskRequest):
                 with observe(llm_duration, "ask"):
                     result = provider.generate(prompt, max_tokens=450)
                 yield f"data: {json.dumps({'type': 'chunk', 'text': result.text})}\n\n"
-                answer_cache.store(query, query_vector, result.text, sources, "llm")
+                answer_cache.store(query, query_vector, result.text, sources, "llm", scopes)
 
             except Exception:
                 # Detail goes to the log, never the browser — provider SDK errors
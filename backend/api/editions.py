@@ -0,0 +1,178 @@
+"""
+Pre-rendered feed editions.
+
+The feed cache is keyed on generations that clustering advances whenever it
+changes a story (core/generations.py), and the first readers after each
+advance all missed together and rebuilt the same few pages concurrently. The
+pages they rebuild are not spread evenly: nearly every request is the first
+page of one of a handful of editions the frontend asks for.
+
+Those first pages are now rendered by clustering itself, for the generations
+it is about to publish and before publishing them, so readers arriving after
+the advance find them already built. A snapshot is the page serialised once and
+compressed once:
+
+    {"etag", "identity", "gzip", "br"}   br is None without the brotli package
+
+`serve_snapshot` returns the stored bytes in whichever encoding the client
+accepts, with no query and no JSON encoding, and a 304 when the client's
+If-None-Match already names the page. The ETag is a hash of the page itself,
+not of the generation, so a page clustering did not change keeps its ETag
+across an advance and revalidating readers still get their 304.
+
+A snapshot missing at read time — a quiet corpus outliving the TTL, a category
+clustering has not seen — is rendered by one of the requests that found it
+missing (core/single_flight.py).
+"""
+import gzip
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.http import HttpResponse, HttpResponseNotModified
+
+# (sort, min_sources, limit) of the first pages the frontend requests
+# (frontend/lib/editions.ts and lib/api.ts): The Wire, Developing, The Record,
+# the Developing sidebar and the corroborated lead. Each is rendered site-wide
+# and for every category. `velocity` is not read by the frontend, so it stays
+# on the ordinary feed cache.
+SNAPSHOT_EDITIONS = frozenset({
+    ("latest", 1, 20),
+    ("momentum", 1, 20),
+    ("significance", 3, 20),
+    ("momentum", 1, 8),
+    ("latest", 2, 5),
+})
+
+# Same backstop as the feed cache: generation-keyed, so new reporting replaces
+# a snapshot by changing its key, and this only bounds how long a quiet corpus
+# serves one — momentum decays with the clock, not with writes.
+SNAPSHOT_TTL_SECONDS = 120
+
+# Rendered once and served many times, so compression is paid for once too.
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+def snapshot_key(generation: str, sort: str, min_sources: int, limit: int,
+                 category: str | None) -> str:
+    return (
+        f"feed:snapshot:{generation}:{sort}:{min_sources}:{limit}:"
+        f"{(category or 'all').lower()}"
+    )
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def render_snapshot(payload: dict) -> dict:
+    """Serialise and compress one feed page."""
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    brotli = _brotli()
+    return {
+        "etag": f'W/"{hashlib.sha256(body).hexdigest()[:32]}"',
+        "identity": body,
+        # mtime=0: identical pages compress to identical bytes.
+        "gzip": gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0),
+        "br": brotli.compress(body, quality=BROTLI_QUALITY) if brotli else None,
+    }
+
+
+def _build(sort: str, min_sources: int, limit: int, category: str | None) -> dict:
+    from api.api import build_feed_page
+
+    return render_snapshot(build_feed_page(
+        sort=sort, category=category, status=None, min_sources=min_sources,
+        limit=limit, cursor=None,
+    ))
+
+
+def render_editions(advanced: dict[str, str]) -> int:
+    """
+    Render the snapshot editions, site-wide and per category, whose feed scope
+    is in `advanced`, under its new token (`generations.advance`). Returns how
+    many were stored.
+    """
+    from core.generations import feed_scope
+    from core.models import Category
+
+    categories = [None, *Category.objects.order_by("slug").values_list("slug", flat=True)]
+    snapshots = {
+        snapshot_key(advanced[scope], sort, min_sources, limit, category):
+            _build(sort, min_sources, limit, category)
+        for sort, min_sources, limit in sorted(SNAPSHOT_EDITIONS)
+        for category in categories
+        if (scope := feed_scope(sort, category)) in advanced
+    }
+    cache.set_many(snapshots, timeout=SNAPSHOT_TTL_SECONDS)
+    return len(snapshots)
+
+
+def _accepted_encodings(request) -> set[str]:
+    accepted = set()
+    for part in request.headers.get("Accept-Encoding", "").split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = params.strip().removeprefix("q=")
+        try:
+            if params and float(quality) == 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    # Weak comparison (RFC 9110 §13.1.2): the W/ prefix is ignored.
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag == "*" or tag.removeprefix("W/") == opaque
+        for tag in (t.strip() for t in if_none_match.split(","))
+    )
+
+
+def serve_snapshot(request, *, sort: str, min_sources: int, limit: int,
+                   category: str | None) -> HttpResponse:
+    """The edition page as stored bytes, rendering it first if it is missing."""
+    from core import cache_tiers
+    from core.generations import feed_scope, token
+    from core.observability import feed_snapshot_requests
+    from core.single_flight import get_or_build
+
+    key = snapshot_key(token(feed_scope(sort, category)), sort, min_sources, limit, category)
+    snapshot, result = cache_tiers.get(key), "hit"
+    if snapshot is None:
+        # Coalesced, like the feed cache: one reader renders, the rest wait for
+        # it or get the previous generation's snapshot.
+        snapshot, result = get_or_build(
+            key, lambda: _build(sort, min_sources, limit, category),
+            timeout=SNAPSHOT_TTL_SECONDS,
+            stale_key=snapshot_key("stale", sort, min_sources, limit, category),
+            name="edition",
+        ), "rendered"
+
+    if _matches(request.headers.get("If-None-Match", ""), snapshot["etag"]):
+        result = "not_modified"
+        response = HttpResponseNotModified()
+    else:
+        accepted = _accepted_encodings(request)
+        if snapshot["br"] is not None and "br" in accepted:
+            encoding = "br"
+        elif "gzip" in accepted:
+            encoding = "gzip"
+        else:
+            encoding = "identity"
+        response = HttpResponse(snapshot[encoding], content_type="application/json")
+        if encoding != "identity":
+            # Also tells GZipMiddleware the body is already compressed.
+            response["Content-Encoding"] = encoding
+
+    feed_snapshot_requests.labels(result).inc()
+    response["ETag"] = snapshot["etag"]
+    response["Vary"] = "Accept-Encoding"
+    return response
@@ -38,6 +38,13 @@ def _warm_embedding_model() -> None:
     threading.Thread(target=_load, name="embedding-warmup", daemon=True).start()
 
 
-# Only the server warms the model. Management commands import settings too, and
-# paying 11.5s on every `migrate` or `shell` would be intolerable.
-_warm_embedding_model()
+# Only the server warms the model, and only when asked to. Management commands
+# import settings too, and paying 11.5s on every `migrate` or `shell` would be
+# intolerable. Off by default: with an embedding server there is nothing to
+# load, and an API process that only serves feed pages should boot without the
+# numeric stack at all (see `manage.py importtime`). Operators who would rather
+# the first /ask after a deploy not pay the load set EMBEDDING_WARMUP=1.
+from django.conf import settings  # noqa: E402 - after get_asgi_application() configured Django
+
+if getattr(settings, 'EMBEDDING_WARMUP', False):
+    _warm_embedding_model()
@@ -250,6 +250,13 @@ else:
         }
     }
 
+# Per-process cache in front of the shared one for the keys every reader hits —
+# the generation counter, edition pages, story pages (core/cache_tiers.py).
+# Invalidations reach other processes by Redis pub/sub; the TTL bounds how long
+# a process can serve a copy whose message it missed. 0 entries disables it.
+LOCAL_CACHE_MAX_ENTRIES = int(os.environ.get('LOCAL_CACHE_MAX_ENTRIES', 512))
+LOCAL_CACHE_TTL_SECONDS = float(os.environ.get('LOCAL_CACHE_TTL_SECONDS', 5))
+
 # Celery Configuration
 CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL", "redis://redis:6379/1")
 
@@ -266,14 +273,29 @@ CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL", "redis://redis:6379/1")
 # `run_pipeline` disables this for itself, since it synthesises in-process.
 CELERY_DISPATCH_ENABLED = os.environ.get("CELERY_DISPATCH_ENABLED", "1") == "1"
 
-# Whether clustering refreshes a story's momentum the moment it gains an outlet.
-#
-# Worth it when clustering is a long-lived worker: the story ranks in Developing
-# immediately instead of waiting for the next periodic pass. Pure waste in a
-# batch run that ends with a full refresh anyway — measured at ~1.3s per matched
-# story against a small Postgres tier, paid once per article, to compute a value
-# that is recomputed minutes later.
+# Whether clustering records a story's new publishers for momentum as articles
+# join (core/momentum.py). The periodic pass only expires publishers, so with
+# this off momentum sees new coverage at the hourly reconciliation — fine for a
+# batch run that ends with a full refresh anyway.
 MOMENTUM_REFRESH_ON_CLUSTER = os.environ.get("MOMENTUM_REFRESH_ON_CLUSTER", "1") == "1"
+# Whether a clustering run matches articles against an in-memory matrix of the
+# candidate window's story centroids instead of one pgvector query per article.
+#
+# Same answers — the matrix search is exact and is kept current as centroids
+# move — without 500 round-trips to the HNSW index per run. Switch off to fall
+# back to pgvector if memory on the clustering worker is tight; the matrix is
+# 3 KB per story in the last week.
+CLUSTER_CENTROID_INDEX = os.environ.get("CLUSTER_CENTROID_INDEX", "1") == "1"
+# Whether a clustering run writes its assignments a chunk at a time — one bulk
+# article update, one recount and one story update per chunk — instead of the
+# full per-article write sequence. Needs the centroid index above; with it off
+# this falls back to per-article writes.
+CLUSTER_BATCH_COMMIT = os.environ.get("CLUSTER_BATCH_COMMIT", "1") == "1"
+# Threads a clustering run may split its pending queue across. Above 1, articles
+# are grouped into partitions no match can cross (core/partitioning.py) and the
+# partitions are clustered concurrently. Each thread holds a database connection,
+# so size this against the connection limit. 1 keeps the sequential run.
+CLUSTER_PARTITION_WORKERS = max(1, int(os.environ.get("CLUSTER_PARTITION_WORKERS", "1")))
 CELERY_RESULT_BACKEND = os.environ.get("CELERY_RESULT_BACKEND", "redis://redis:6379/1")
 CELERY_TIMEZONE = "UTC"
 
@@ -293,6 +315,67 @@ from celery.schedules import crontab
 # not double the cost; it mostly doubles the number of cheap 304s.
 INGEST_INTERVAL_SECONDS = int(os.environ.get('INGEST_INTERVAL_SECONDS', 15 * 60))
 
+# Adaptive scheduling (core/scheduling.py). Each source is polled on its own
+# interval, learned from its publish rate and how often fetches come back empty
+# — minutes for a wire service, hours for a weekly feed. Beat then only ticks,
+# every INGEST_TICK_SECONDS, and dispatches the sources that are due. Turned
+# off, every source is fetched every INGEST_INTERVAL_SECONDS as before.
+ADAPTIVE_FETCH_SCHEDULING = os.environ.get('ADAPTIVE_FETCH_SCHEDULING', '1') == '1'
+INGEST_TICK_SECONDS = int(os.environ.get('INGEST_TICK_SECONDS', 60))
+
+# How a sweep fetches its sources. "async" runs every feed from one task on one
+# event loop with a shared HTTP/2 keep-alive client (core/ingest_engine.py);
+# "celery" fans out one scrape_single_source task per source, as before.
+INGEST_ENGINE = os.environ.get('INGEST_ENGINE', 'async')
+
+# On-disk cache of article-page extractions (core/services/page_cache.py), so an
+# unchanged page is a conditional GET answered 304 and identical page bytes are
+# never run through trafilatura twice. Shared by every worker on the host.
+# An empty directory or a size of 0 disables it.
+DEEP_FETCH_CACHE_DIR = os.environ.get(
+    'DEEP_FETCH_CACHE_DIR', str(Path.home() / '.cache' / 'ultranews' / 'pages')
+)
+DEEP_FETCH_CACHE_MAX_MB = int(os.environ.get('DEEP_FETCH_CACHE_MAX_MB', 256))
+
+# Shared embedding server (core/services/embedding_server.py, run with
+# `manage.py serve_embeddings`). Set, every process embeds through it instead of
+# loading its own copy of the model; unreachable, each falls back to loading it.
+# unix:///path/to.sock or http://127.0.0.1:8765. Empty embeds in-process.
+EMBEDDING_SERVER_URL = os.environ.get('EMBEDDING_SERVER_URL', '')
+
+# Load the embedding model on a background thread as the ASGI server starts
+# (config/asgi.py), rather than on the first /ask. Costs every web process the
+# model's memory and import time whether or not it ever embeds.
+EMBEDDING_WARMUP = os.environ.get('EMBEDDING_WARMUP', '0') == '1'
+
+# Which embedding model, and how it runs (core/embedding_backends.py).
+# `fastembed:<name>` or `onnx:<dir or .onnx file>` — e.g. an int8 export. Must
+# produce 384-dimensional vectors; compare candidates with
+# `manage.py benchmark_embeddings` before switching.
+EMBEDDING_MODEL = os.environ.get('EMBEDDING_MODEL', 'fastembed:BAAI/bge-small-en-v1.5')
+# ONNX Runtime intra-op threads per process. 0 lets the runtime take every core,
+# which oversubscribes the CPU as soon as several workers embed at once; set it
+# to cores / worker processes.
+EMBEDDING_THREADS = int(os.environ.get('EMBEDDING_THREADS', 0))
+# For onnx: backends. disabled | basic | extended | all, and cls | mean pooling.
+EMBEDDING_GRAPH_OPTIMIZATION = os.environ.get('EMBEDDING_GRAPH_OPTIMIZATION', 'all')
+EMBEDDING_POOLING = os.environ.get('EMBEDDING_POOLING', 'cls')
+
+# Embedded topic prototypes (core/topics.py), saved as .npy keyed by the
+# prototype sentences and the model, so a new process loads them in
+# milliseconds instead of re-embedding them. Empty rebuilds them in every process.
+TOPIC_PROTOTYPE_CACHE_DIR = os.environ.get(
+    'TOPIC_PROTOTYPE_CACHE_DIR', str(Path.home() / '.cache' / 'ultranews' / 'topics')
+)
+
+# Worker processes that extract article text while fetch threads keep
+# downloading (core/services/extraction.py). Defaults to all cores but one;
+# 0 extracts on the fetch threads. Unavailable inside prefork Celery children,
+# which may not start processes of their own.
+EXTRACTION_WORKERS = int(
+    os.environ.get('EXTRACTION_WORKERS', max(1, (os.cpu_count() or 2) - 1))
+)
+
 # Clustering is the freshness bottleneck, not scraping — an article is invisible
 # until it has been clustered. Kept tight, and cheap because it no-ops when
 # nothing is pending.
@@ -301,7 +384,7 @@ CLUSTER_INTERVAL_SECONDS = int(os.environ.get('CLUSTER_INTERVAL_SECONDS', 3 * 60
 CELERY_BEAT_SCHEDULE = {
     'scrape-all-sources': {
         'task': 'core.tasks.scrape_all_sources',
-        'schedule': INGEST_INTERVAL_SECONDS,
+        'schedule': INGEST_TICK_SECONDS if ADAPTIVE_FETCH_SCHEDULING else INGEST_INTERVAL_SECONDS,
         'options': {'queue': 'celery'},
     },
     'cluster-pending-articles': {
@@ -310,12 +393,20 @@ CELERY_BEAT_SCHEDULE = {
         'options': {'queue': 'cluster'},
     },
     # Momentum decays with the clock, not with writes, so it needs its own
-    # sweep. Cheap: one aggregate over a bounded window plus one bulk UPDATE.
+    # sweep. Cheap: it deletes the publishers that aged out of the window and
+    # recounts only the stories that lost one.
     'refresh-momentum': {
         'task': 'core.tasks.refresh_momentum_scores',
         'schedule': 5 * 60,
         'options': {'queue': 'cluster'},
     },
+    # The exact recomputation from articles, for what the incremental path
+    # cannot see (a source moved between trust tiers).
+    'reconcile-momentum': {
+        'task': 'core.tasks.reconcile_momentum',
+        'schedule': crontab(minute=40),
+        'options': {'queue': 'cluster'},
+    },
     'compute-trust-metrics-daily': {
         'task': 'core.tasks.compute_trust_metrics',
         'schedule': crontab(hour=3, minute=0),  # Daily at 03:00 UTC
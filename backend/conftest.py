@@ -46,6 +46,40 @@ def no_outbound_network(request, monkeypatch):
     monkeypatch.setattr(socket, "create_connection", guarded)
 
 
+@pytest.fixture(autouse=True)
+def no_extraction_processes(settings):
+    """
+    Extract article pages on the calling thread.
+
+    A process pool per test run is seconds of interpreter start-up for no
+    coverage: the pipelined path is tested with a thread pool standing in.
+    """
+    settings.EXTRACTION_WORKERS = 0
+
+
+@pytest.fixture(autouse=True)
+def no_persisted_prototypes(settings):
+    """
+    Build topic prototypes in memory only.
+
+    Tests embed with stand-in models; persisted under the real model's key,
+    their vectors would be loaded by the next real process on the host.
+    """
+    settings.TOPIC_PROTOTYPE_CACHE_DIR = ""
+
+
+@pytest.fixture(autouse=True)
+def no_local_cache(settings):
+    """
+    Read the shared cache directly.
+
+    Tests clear the shared cache between cases; a process-local copy in front
+    of it (core/cache_tiers.py) would survive that and leak one test's pages
+    into the next.
+    """
+    settings.LOCAL_CACHE_MAX_ENTRIES = 0
+
+
 def pytest_configure(config):
     config.addinivalue_line(
         "markers", "allow_network: test may open outbound network connections"
@@ -0,0 +1,169 @@
+"""
+A per-process cache in front of Redis, for the few keys every reader hits.
+
+Every feed page, story page and generation read was a network round trip to
+Redis, even though a handful of keys — the cache generations, the first page
+of each edition, the stories on the front page — answer most requests, and
+every process asked Redis for the same bytes again. Keeping those in process
+memory takes the round trip off the common request.
+
+A process-local copy is only safe if it is dropped when Redis's copy is:
+
+  - Keys read through here are deleted through here too (`delete`), which
+    deletes from Redis, drops this process's copy, and publishes the key on
+    CHANNEL. Every web process runs one listener thread that drops its own
+    copy on each message.
+  - Entries live LOCAL_CACHE_TTL_SECONDS at most. That bound holds even if a
+    message is missed — a listener reconnecting — and it is all there is on
+    a backend without pub/sub; locmem is one process anyway.
+
+Generation-keyed keys never need a message: a bump changes the key. Only the
+generation keys themselves (core/generations.py) and purged story pages do.
+
+The local tier holds LOCAL_CACHE_MAX_ENTRIES values, least recently used
+evicted first. 0 disables it, and every call goes straight to Redis.
+"""
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "cache:invalidate"
+# Published to drop every local copy, not one key.
+_ALL = "*"
+
+_lock = threading.Lock()
+_entries: OrderedDict = OrderedDict()  # key -> (expires_at, value)
+# Process that started the invalidation listener. A forked child inherits
+# the value but not the thread, so it starts its own.
+_listener_pid: int | None = None
+
+
+def _capacity() -> int:
+    return getattr(settings, "LOCAL_CACHE_MAX_ENTRIES", 0)
+
+
+def _local_get(key):
+    with _lock:
+        entry = _entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _entries[key]
+            return None
+        _entries.move_to_end(key)
+        return entry[1]
+
+
+def _local_set(key, value, timeout) -> None:
+    capacity = _capacity()
+    if capacity <= 0:
+        return
+    ttl = getattr(settings, "LOCAL_CACHE_TTL_SECONDS", 5)
+    if timeout is not None:
+        ttl = min(ttl, timeout)
+    with _lock:
+        _entries[key] = (time.monotonic() + ttl, value)
+        _entries.move_to_end(key)
+        while len(_entries) > capacity:
+            _entries.popitem(last=False)
+
+
+def _local_drop(key: str) -> None:
+    with _lock:
+        if key == _ALL:
+            _entries.clear()
+        else:
+            _entries.pop(key, None)
+
+
+def clear_local() -> None:
+    """Drop this process's copies. Redis is untouched."""
+    _local_drop(_ALL)
+
+
+def get(key: str):
+    """`cache.get(key)`, answered from process memory when it holds the key."""
+    from core.observability import cache_tier_reads
+
+    if _capacity() <= 0:
+        return cache.get(key)
+
+    _ensure_listener()
+    value = _local_get(key)
+    if value is not None:
+        cache_tier_reads.labels("local", "hit").inc()
+        return value
+    cache_tier_reads.labels("local", "miss").inc()
+
+    value = cache.get(key)
+    cache_tier_reads.labels("redis", "hit" if value is not None else "miss").inc()
+    if value is not None:
+        # Redis does not say how long the key has left, so the local copy
+        # gets the local TTL alone.
+        _local_set(key, value, None)
+    return value
+
+
+def put(key: str, value, timeout) -> None:
+    """`cache.set`, keeping a copy in this process too."""
+    cache.set(key, value, timeout=timeout)
+    _local_set(key, value, timeout)
+
+
+def invalidate(key: str) -> None:
+    """Drop every process's copy of `key`, after Redis's has changed."""
+    _local_drop(key)
+    try:
+        cache.client.get_client(write=True).publish(CHANNEL, key)
+    except AttributeError:
+        pass  # Not django-redis: a single-process backend, nothing to tell.
+    except Exception as e:
+        # The TTL still bounds how long the others serve it.
+        logger.debug("Could not publish cache invalidation for %s: %s", key, e)
+
+
+def delete(key: str) -> None:
+    """`cache.delete`, dropping every process's copy with it."""
+    cache.delete(key)
+    invalidate(key)
+
+
+def _listen() -> None:
+    backoff = 1
+    while True:
+        try:
+            pubsub = cache.client.get_client(write=False).pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(CHANNEL)
+            # Anything published while this was not subscribed was missed.
+            clear_local()
+            backoff = 1
+            for message in pubsub.listen():
+                data = message.get("data")
+                _local_drop(data.decode() if isinstance(data, bytes) else str(data))
+        except Exception as e:
+            logger.warning("Cache invalidation listener lost Redis (%s); retrying in %ss", e, backoff)
+            clear_local()
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 60)
+
+
+def _ensure_listener() -> None:
+    """Start this process's listener, once, on first use."""
+    global _listener_pid
+    if _listener_pid == os.getpid():
+        return
+    with _lock:
+        if _listener_pid == os.getpid():
+            return
+        _listener_pid = os.getpid()
+        # Without django-redis (locmem) there is one process, and deletes made
+        # through here are already local.
+        if hasattr(cache, "client") and hasattr(cache.client, "get_client"):
+            threading.Thread(target=_listen, name="cache-invalidation", daemon=True).start()
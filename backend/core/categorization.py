@@ -17,9 +17,15 @@ What remains here:
   assign_categories...()  calls them any more, and the slugs they name
                           ("art", "entertainment") no longer exist as
                           Category rows.
+
+  KeywordAutomaton        The matcher behind match_category_slugs(): every
+                          keyword in one pass over the text rather than one
+                          regex scan per keyword. `manage.py
+                          benchmark_keywords` compares the two.
 """
 import logging
 import re
+from collections import deque
 from typing import List, Tuple
 
 from core.models import Category
@@ -126,6 +132,155 @@ def _get_compiled_patterns() -> dict[str, list[re.Pattern]]:
     return _COMPILED_PATTERNS
 
 
+def _regex_hit_counts(text: str) -> dict[str, int]:
+    """
+    Hits per category by one regex search per keyword — a full scan of the text
+    each, ~230 of them per article. Superseded by KeywordAutomaton; kept as the
+    baseline `manage.py benchmark_keywords` measures and checks it against.
+    """
+    counts = {}
+    for slug, slug_patterns in _get_compiled_patterns().items():
+        hits = sum(1 for pattern in slug_patterns if pattern.search(text))
+        if hits:
+            counts[slug] = hits
+    return counts
+
+
+def _is_word_char(ch: str) -> bool:
+    # What \b considers a word character in a str pattern.
+    return ch.isalnum() or ch == '_'
+
+
+# Characters re.IGNORECASE equates that their case mappings alone do not.
+_FOLD_FIXES = {"\u1fd3": "\u0390", "\u1fe3": "\u03b0", "\ufb05": "\ufb06"}
+
+_fold_table: dict[int, str] | None = None
+
+
+def _case_fold_table() -> dict[int, str]:
+    """
+    A `str.translate` table folding each character to one character that
+    re.IGNORECASE treats as equal to it.
+
+    `str.lower` is not that: "İ".lower() is "i" plus a combining dot, which
+    shifts every later position and puts a non-word character where the regex
+    saw a word one; "ſ" and "ı" stay as they are, though the regex matches
+    them to "s" and "i". Mapping through the uppercase keeps one character per
+    character and merges those.
+    """
+    global _fold_table
+    if _fold_table is None:
+        table = {}
+        for codepoint in range(0x1F000):  # Past the last cased script.
+            ch = chr(codepoint)
+            upper = ch.upper()
+            folded = (upper if len(upper) == 1 else ch).lower()[0]
+            folded = _FOLD_FIXES.get(folded, folded)
+            if folded != ch:
+                table[codepoint] = folded
+        _fold_table = table
+    return _fold_table
+
+
+class KeywordAutomaton:
+    """
+    Every keyword of every category, matched in one pass over the text.
+
+    An Aho-Corasick automaton: a trie of the case-folded keywords with failure
+    links, so each character of the text advances one state and every keyword
+    ending there is reported, however many keywords share a prefix or overlap.
+    A match counts only where the regex's word boundaries would have held at
+    both ends.
+
+    `hit_counts` returns what the per-keyword regex scan did: for each
+    category, how many of its distinct keywords occur at least once.
+    """
+
+    def __init__(self, keywords: dict[str, list[str]]):
+        self._fold = _case_fold_table()
+        # Keyword id -> (length, word char at start, word char at end, slugs).
+        self._keywords: list[tuple[int, bool, bool, list[str]]] = []
+        ids: dict[str, int] = {}
+        self._goto: list[dict[str, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+
+        for slug, words in keywords.items():
+            for word in words:
+                word = word.translate(self._fold)
+                if word in ids:
+                    # Shared by two categories ("startup"): one match, both count.
+                    self._keywords[ids[word]][3].append(slug)
+                    continue
+                ids[word] = len(self._keywords)
+                self._keywords.append(
+                    (len(word), _is_word_char(word[0]), _is_word_char(word[-1]), [slug])
+                )
+                state = 0
+                for ch in word:
+                    if ch not in self._goto[state]:
+                        self._goto.append({})
+                        outputs.append([])
+                        self._goto[state][ch] = len(self._goto) - 1
+                    state = self._goto[state][ch]
+                outputs[state].append(ids[word])
+
+        # Failure links, breadth first: the longest proper suffix of each state
+        # that is also in the trie. A state inherits its suffix's outputs.
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                suffix = self._goto[fallback].get(ch, 0)
+                self._fail[child] = suffix if suffix != child else 0
+                outputs[child].extend(outputs[self._fail[child]])
+        self._outputs = [tuple(out) for out in outputs]
+
+    def hit_counts(self, text: str) -> dict[str, int]:
+        # Folded character for character, so positions match `text`, whose
+        # own characters decide the word boundaries.
+        folded = text.translate(self._fold)
+        goto, fail, outputs, keywords = self._goto, self._fail, self._outputs, self._keywords
+        found: set[int] = set()
+        state = 0
+        last = len(text) - 1
+        for end, ch in enumerate(folded):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for keyword in outputs[state]:
+                if keyword in found:
+                    continue
+                length, word_start, word_end, _slugs = keywords[keyword]
+                start = end - length + 1
+                before = start > 0 and _is_word_char(text[start - 1])
+                after = end < last and _is_word_char(text[end + 1])
+                # \b: a word/non-word change, with the text's edges as non-word.
+                if before != word_start and after != word_end:
+                    found.add(keyword)
+
+        counts: dict[str, int] = {}
+        for keyword in found:
+            for slug in keywords[keyword][3]:
+                counts[slug] = counts.get(slug, 0) + 1
+        return counts
+
+
+_automaton: KeywordAutomaton | None = None
+
+
+def keyword_hit_counts(text: str) -> dict[str, int]:
+    """Distinct keywords found per category, in one scan of `text`."""
+    global _automaton
+    if _automaton is None:
+        _automaton = KeywordAutomaton(CATEGORY_KEYWORDS)
+    return _automaton.hit_counts(text)
+
+
 # All category names used during seeding, keyed by slug
 # The taxonomy lives in core/topics.py → TOPICS, which is where the
 # classifier's prototypes are defined and where Category rows are seeded
@@ -139,16 +294,11 @@ def match_category_slugs(title: str, content: str) -> List[Tuple[str, int]]:
     Sorted by hit count descending. Pure logic — no database access.
     """
     text = f"{title} {content}"
-    patterns = _get_compiled_patterns()
-    scored: list[Tuple[str, int]] = []
-
-    for slug, slug_patterns in patterns.items():
-        hits = 0
-        for pattern in slug_patterns:
-            if pattern.search(text):
-                hits += 1
-        if hits >= MIN_HITS_THRESHOLD:
-            scored.append((slug, hits))
+    counts = keyword_hit_counts(text)
+    scored: list[Tuple[str, int]] = [
+        (slug, counts[slug]) for slug in CATEGORY_KEYWORDS
+        if counts.get(slug, 0) >= MIN_HITS_THRESHOLD
+    ]
 
     # Sort by score descending, then limit
     scored.sort(key=lambda x: x[1], reverse=True)
@@ -9,14 +9,13 @@ from django.db import transaction
 from django.utils import timezone
 from django.utils.text import slugify
 
+from core.lazy import LazyModule, module_available
 from core.models import Article, Story
 
-try:
-    import numpy as np
-    from fastembed import TextEmbedding
-except ImportError:
-    TextEmbedding = None
-    np = None
+# Imported on first use: most processes that import this module — API workers
+# above all — never compare a vector.
+np = LazyModule("numpy")
+HAS_NUMPY = module_available("numpy")
 
 logger = logging.getLogger(__name__)
 
@@ -63,25 +62,103 @@ TOKEN_MATCH_THRESHOLD = 0.50
 # Clustering only ever compares against stories this recent.
 CANDIDATE_WINDOW = timedelta(days=7)
 
+# An article only joins a story first seen within this distance of its own
+# publication, however similar the headlines.
+MATCH_WINDOW = timedelta(hours=72)
+
+# Texts per ONNX inference call. fastembed's own default, stated here because
+# the clustering pre-pass depends on it: one call per article ran ~500 separate
+# single-row inferences per run, and batching is where the runtime gets its
+# throughput.
+EMBED_BATCH_SIZE = 256
+
 _embedding_model = None
 
-def get_embedding_model():
+
+def load_embedding_model():
+    """
+    This process's own model, loaded on first use from EMBEDDING_MODEL
+    (core/embedding_backends.py). A model that fails to load is not retried.
+    """
     global _embedding_model
-    if _embedding_model is None and TextEmbedding is not None:
-        # 384-dimensional efficient model
-        _embedding_model = TextEmbedding(model_name="BAAI/bge-small-en-v1.5")
-    return _embedding_model
+    if _embedding_model is None:
+        from core.embedding_backends import load_configured_model
+
+        _embedding_model = load_configured_model() or False
+    return _embedding_model or None
+
+
+def get_embedding_model():
+    """
+    Whatever should embed for this process: the shared embedding server's
+    client when EMBEDDING_SERVER_URL is set and it answers, otherwise the
+    in-process model. Both have the same `embed(texts)`.
+    """
+    from core.services.embedding_server import get_remote_model
+
+    return get_remote_model() or load_embedding_model()
+
+
+def embed_texts(texts: list[str]) -> list[list[float] | None]:
+    """
+    Embed many strings in as few model calls as possible.
+
+    Returns one vector per input, in order. Blank strings, and every string when
+    embeddings are unavailable, map to None rather than being dropped, so the
+    result always lines up with `texts`.
+    """
+    results: list[list[float] | None] = [None] * len(texts)
+    model = get_embedding_model()
+    if not model:
+        return results
+
+    indexed = [(i, text) for i, text in enumerate(texts) if text and text.strip()]
+    if not indexed:
+        return results
+
+    from core.services.embedding_server import EmbeddingUnavailable
+
+    try:
+        vectors = model.embed([text for _i, text in indexed], batch_size=EMBED_BATCH_SIZE)
+    except EmbeddingUnavailable as e:
+        # The server went down with no local model behind it: unavailable, as
+        # far as callers are concerned, not an error.
+        logger.warning("%s", e)
+        return results
+    for (i, _text), vector in zip(indexed, vectors, strict=True):
+        results[i] = [float(x) for x in vector]
+    return results
 
 
 def embed_text(text: str) -> list[float] | None:
     """Embed a single string, or return None when embeddings are unavailable."""
-    model = get_embedding_model()
-    if not model or not text or not text.strip():
-        return None
-    embeddings = list(model.embed([text]))
-    if not embeddings:
-        return None
-    return [float(x) for x in embeddings[0]]
+    return embed_texts([text])[0]
+
+
+def article_embedding_text(article: Article) -> str:
+    """The text an article is embedded from. One definition for every caller."""
+    return f"{article.title} {article.excerpt}"
+
+
+def embed_articles(articles: list[Article]) -> int:
+    """
+    Embed every article that lacks a vector, in batches, before clustering.
+
+    `cluster_article` embeds only when `article.embedding` is None, so vectors
+    set here are simply reused — and persisted by the same save that assigns
+    the story. Returns how many articles received a vector.
+    """
+    missing = [a for a in articles if a.embedding is None]
+    if not missing:
+        return 0
+
+    vectors = embed_texts([article_embedding_text(a) for a in missing])
+    embedded = 0
+    for article, vector in zip(missing, vectors, strict=True):
+        if vector is not None:
+            article.embedding = vector
+            embedded += 1
+    return embedded
 
 
 def compute_velocity(independent_count: int, first_seen_at) -> float:
@@ -213,6 +290,14 @@ def compute_tier(independent_count: int, velocity: float, has_primary_source: bo
     # Single source — always Wire, regardless of velocity
     return Story.Status.WIRE
 
+# Fields the matching and update paths read from a candidate story. Deferring
+# the rest keeps ai_summary and friends off the clustering hot path.
+_CANDIDATE_FIELDS = (
+    'id', 'title', 'slug', 'first_seen_at', 'source_count', 'independent_count',
+    'synthesis_status', 'synthesis_source_count', 'status', 'embedding',
+)
+
+
 def _candidate_stories(article: Article, use_ann: bool):
     """
     Shortlist the stories worth scoring against this article.
@@ -238,9 +323,7 @@ def _candidate_stories(article: Article, use_ann: bool):
         return (
             qs.filter(embedding__isnull=False)
             .annotate(_distance=CosineDistance('embedding', article.embedding))
-            .only('id', 'title', 'slug', 'first_seen_at', 'source_count',
-                  'independent_count', 'synthesis_status', 'synthesis_source_count',
-                  'status', 'embedding')
+            .only(*_CANDIDATE_FIELDS)
             .order_by('_distance')[:ANN_CANDIDATE_LIMIT]
         )
 
@@ -248,6 +331,152 @@ def _candidate_stories(article: Article, use_ann: bool):
     return qs.only('id', 'title', 'first_seen_at', 'embedding')
 
 
+class CentroidIndex:
+    """
+    The centroids of every story inside the candidate window, held in memory
+    for the length of one clustering run.
+
+    `_candidate_stories` asks pgvector for an article's nearest stories one
+    query at a time, so a 500-article run is 500 round-trips to the HNSW index.
+    The set of stories those queries can return is small and known up front —
+    everything first seen within CANDIDATE_WINDOW of the batch — so it is loaded
+    once as a normalised matrix and each article is matched with one
+    matrix-vector product.
+
+    It is an exact search, and returns the same shortlist the ANN query would:
+    the ANN_CANDIDATE_LIMIT nearest stories inside the article's window, ordered
+    by cosine distance. Clustering keeps it current as it goes — every centroid
+    `_update_centroid` moves and every story the run creates is upserted — so an
+    article is scored against exactly the state the database would show it.
+    """
+
+    def __init__(self, since=None):
+        self._ids: list[int] = []
+        self._first_seen: list = []
+        self._rows: dict[int, int] = {}
+        self._epochs = np.empty(0, dtype=float)
+        self._matrix = np.empty((0, 0), dtype=float)
+        if since is None:
+            return
+
+        rows = (
+            Story.objects
+            .filter(first_seen_at__gte=since, embedding__isnull=False)
+            .values_list('id', 'first_seen_at', 'embedding')
+        )
+        for story_id, first_seen_at, embedding in rows.iterator(chunk_size=1000):
+            self.upsert(story_id, first_seen_at, embedding)
+
+    @classmethod
+    def for_articles(cls, articles: list[Article]) -> "CentroidIndex":
+        """Load every story any of `articles` could be matched against."""
+        earliest = min(a.published_date for a in articles)
+        return cls(earliest - CANDIDATE_WINDOW)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, story_id) -> bool:
+        return story_id in self._rows
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def subset(self, story_ids) -> "CentroidIndex":
+        """An independent index over just `story_ids`, for one partition of a run."""
+        part = CentroidIndex()
+        for story_id in sorted(set(story_ids) & self._rows.keys()):
+            row = self._rows[story_id]
+            part.upsert(story_id, self._first_seen[row], self._matrix[row])
+        return part
+
+    def upsert(self, story_id: int, first_seen_at, embedding) -> None:
+        """Add a story's centroid, or replace it after the centroid moved."""
+        if embedding is None:
+            return
+        vector = np.asarray(embedding, dtype=float)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector = vector / norm
+
+        row = self._rows.get(story_id)
+        if row is None:
+            row = len(self._ids)
+            if row >= len(self._matrix):
+                self._grow(vector.shape[0])
+            self._rows[story_id] = row
+            self._ids.append(story_id)
+            self._first_seen.append(first_seen_at)
+
+        self._matrix[row] = vector
+        self._epochs[row] = first_seen_at.timestamp()
+        self._first_seen[row] = first_seen_at
+
+    def _grow(self, dim: int) -> None:
+        # Doubling, so a run that creates hundreds of stories does not copy the
+        # matrix once per story.
+        capacity = max(64, len(self._matrix) * 2)
+        matrix = np.zeros((capacity, dim), dtype=float)
+        epochs = np.zeros(capacity, dtype=float)
+        used = len(self._ids)
+        if used:
+            matrix[:used] = self._matrix[:used]
+            epochs[:used] = self._epochs[:used]
+        self._matrix, self._epochs = matrix, epochs
+
+    def candidates(self, embedding, published_date, limit: int = ANN_CANDIDATE_LIMIT):
+        """
+        The `limit` nearest stories inside the article's window, nearest first.
+
+        Yields (story_id, first_seen_at, cosine_distance) — the same three facts
+        the pgvector shortlist supplies.
+        """
+        used = len(self._ids)
+        if not used or embedding is None:
+            return []
+
+        query = np.asarray(embedding, dtype=float)
+        norm = np.linalg.norm(query)
+        if norm == 0 or query.shape[0] != self._matrix.shape[1]:
+            return []
+
+        similarities = self._matrix[:used] @ (query / norm)
+        in_window = self._epochs[:used] >= (published_date - CANDIDATE_WINDOW).timestamp()
+        eligible = int(in_window.sum())
+        if not eligible:
+            return []
+        similarities[~in_window] = -np.inf
+
+        k = min(limit, eligible)
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top], kind='stable')]
+        return [
+            (self._ids[row], self._first_seen[row], 1.0 - float(similarities[row]))
+            for row in top
+        ]
+
+
+def build_centroid_index(articles: list[Article]) -> CentroidIndex | None:
+    """
+    The in-memory index for a clustering run, or None to use pgvector per article.
+
+    None when the mode is switched off, when there is nothing to cluster, and
+    when embeddings are unavailable — the lexical scorer never consults it.
+    """
+    if not articles or not getattr(settings, "CLUSTER_CENTROID_INDEX", True):
+        return None
+    if not HAS_NUMPY or get_embedding_model() is None:
+        return None
+    try:
+        index = CentroidIndex.for_articles(articles)
+    except Exception:
+        # Losing the index costs speed, not correctness: pgvector still answers.
+        logger.exception("Could not load the centroid index; using pgvector per article")
+        return None
+    logger.info("Centroid index loaded with %d stories.", len(index))
+    return index
+
+
 def _recount_cluster(story: Story) -> tuple[int, int, bool]:
     """
     Recompute (source_count, independent_count, has_primary_source) from the DB.
@@ -270,6 +499,40 @@ def _recount_cluster(story: Story) -> tuple[int, int, bool]:
     return total, len(publishers), has_primary
 
 
+def _recount_clusters(story_ids) -> dict[int, tuple[int, int, bool]]:
+    """
+    `_recount_cluster` for many stories in one aggregate query.
+
+    Publisher identity is the resolved domain falling back to the feed URL —
+    the same rule as `_recount_cluster` and `Source.independence_key`, so a
+    story counts the same number of independent outlets by either route.
+    """
+    from django.db.models import CharField, Count, Q, Value
+    from django.db.models.functions import Coalesce, NullIf
+
+    rows = (
+        Article.objects.filter(story_id__in=list(story_ids))
+        .values('story_id')
+        .annotate(
+            total=Count('id'),
+            publishers=Count(
+                Coalesce(
+                    NullIf('source__publisher_domain', Value('', output_field=CharField())),
+                    'source__url',
+                    output_field=CharField(),
+                ),
+                distinct=True,
+            ),
+            primaries=Count('id', filter=Q(source__source_type='primary')),
+        )
+        .order_by()
+    )
+    return {
+        row['story_id']: (row['total'], row['publishers'], row['primaries'] > 0)
+        for row in rows
+    }
+
+
 def _update_centroid(story: Story, article: Article) -> None:
     """
     Fold the new article into the story's centroid as a running mean.
@@ -278,7 +541,7 @@ def _update_centroid(story: Story, article: Article) -> None:
     so as a cluster grew its stored vector drifted away from what the cluster
     actually covered — degrading both future matching and /related.
     """
-    if np is None or article.embedding is None:
+    if not HAS_NUMPY or article.embedding is None:
         return
     if story.embedding is None:
         story.embedding = article.embedding
@@ -324,6 +587,54 @@ def _assign_topics(article: Article) -> None:
         logger.warning("Topic classification failed for article %s: %s", article.pk, e)
 
 
+def assign_topics_batch(articles: list[Article]) -> int:
+    """
+    `_assign_topics` for every embedded article at once: one classification
+    matrix product, one category lookup, one delete and one bulk insert on the
+    article–category table. Returns how many articles were tagged.
+
+    Per article this was a classification, a Category query and a
+    `categories.set` — three round trips each. Articles handled here are
+    marked `topics_assigned`, so `cluster_article` does not classify them
+    again; on failure none are, and each falls back to the per-article path.
+    """
+    embedded = [a for a in articles if a.embedding is not None and a.pk is not None]
+    if not embedded:
+        return 0
+
+    try:
+        from core.models import Category
+        from core.topics import classify_batch
+
+        chosen = classify_batch([a.embedding for a in embedded])
+        slugs = {slug for topics in chosen for slug, _score in topics}
+        category_ids = (
+            dict(Category.objects.filter(slug__in=slugs).values_list('slug', 'id'))
+            if slugs else {}
+        )
+
+        through = Article.categories.through
+        tagged, rows = [], []
+        for article, topics in zip(embedded, chosen, strict=True):
+            ids = [category_ids[slug] for slug, _score in topics if slug in category_ids]
+            if ids:
+                tagged.append(article.pk)
+                rows.extend(through(article_id=article.pk, category_id=i) for i in ids)
+
+        # Same replace-not-merge semantics as categories.set(), for the articles
+        # that got a topic; the rest keep whatever they had.
+        with transaction.atomic():
+            through.objects.filter(article_id__in=tagged).delete()
+            through.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+    except Exception as e:
+        logger.warning("Batch topic classification failed; classifying per article: %s", e)
+        return 0
+
+    for article in embedded:
+        article.topics_assigned = True
+    return len(tagged)
+
+
 # A brief is only worth regenerating once this many NEW independent publishers
 # have joined. Another article from an outlet already in the cluster changes the
 # multi-source picture very little, and each regeneration is a full-price call.
@@ -387,58 +698,341 @@ def _dispatch_synthesis(story_id: int) -> None:
     transaction.on_commit(_send)
 
 
-def cluster_article(article: Article, scorer: ClusterScorer = None) -> Story:
+def _best_embedding_candidate(article: Article, shortlist) -> tuple[object, float]:
+    """
+    Pick the best match from a nearest-first shortlist of (key, first_seen_at,
+    cosine distance). Shared by the pgvector and in-memory paths so the two
+    cannot drift apart in how they apply the window and the threshold.
+    """
+    best, best_score = None, 0.0
+    for key, first_seen_at, distance in shortlist:
+        # pgvector ordered by this distance; reuse it rather than recomputing
+        # the same number in Python.
+        if abs(article.published_date - first_seen_at) > MATCH_WINDOW:
+            continue
+        score = 1.0 - float(distance)
+        if score < EMBEDDING_MATCH_THRESHOLD:
+            # Candidates arrive nearest-first, so similarity decreases
+            # monotonically — nothing after this can clear the threshold.
+            break
+        if score > best_score:
+            best, best_score = key, score
+    return best, best_score
+
+
+class AssignmentBatch:
+    """
+    Cluster assignments for a chunk of articles, written in one commit phase.
+
+    Joining a story used to cost, per article: an article save, a recount, a
+    story save, a primary-source fix-up, a category merge, a momentum refresh
+    and a cache purge. A story that picked up fifteen syndicated copies in one
+    run paid all of that fifteen times to arrive at the state the last one
+    produced.
+
+    Matching still happens article by article, because each assignment can move
+    a centroid the next article is scored against — so the in-memory side stays
+    exact: the story's article count and centroid are advanced as each article
+    joins, by the same running mean `cluster_article` has always used. What is
+    deferred is everything the database only needs to know once. `flush()`
+    writes the chunk as one bulk article update, one aggregate recount and one
+    story update across every touched story, one primary-source fix-up, one
+    category merge, one momentum upsert, and one invalidation per slug.
+
+    Needs the run's CentroidIndex. Deferred centroids are invisible to pgvector,
+    so without the index later articles in the chunk would be matched against
+    stale vectors.
+    """
+
+    def __init__(self):
+        self.articles: list[Article] = []
+        self._stories: dict[int, Story] = {}
+        self._joined: set[int] = set()
+        # Status before this chunk touched the story, so a promotion out of
+        # Wire is still announced when it happens across several articles.
+        self._previous_status: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    def story(self, story_id: int) -> Story | None:
+        """The instance this chunk is already mutating, if it touched the story."""
+        return self._stories.get(story_id)
+
+    def _track(self, story: Story) -> Story:
+        story = self._stories.setdefault(story.pk, story)
+        self._previous_status.setdefault(story.pk, story.status)
+        return story
+
+    def join(self, article: Article, story: Story) -> Story:
+        """Record `article` joining an existing story."""
+        story = self._track(story)
+        article.story = story
+        # Counted before the centroid moves, as the recount-then-update order in
+        # cluster_article does, so the running mean weights identically.
+        story.source_count += 1
+        _update_centroid(story, article)
+        self._joined.add(story.pk)
+        self.articles.append(article)
+        return story
+
+    def add_new(self, article: Article, story: Story) -> None:
+        """Record `article` founding a story that has just been created."""
+        self._track(story)
+        article.story = story
+        article.is_primary_source = True  # Sole article in a new cluster.
+        self.articles.append(article)
+
+    def discard(self) -> None:
+        """Forget everything collected, after the enclosing transaction rolled back."""
+        for article in self.articles:
+            article.story = None
+            article.is_primary_source = False
+        self.__init__()
+
+    def flush(self) -> None:
+        """Write the chunk. Call inside the transaction that created its stories."""
+        if not self.articles:
+            return
+
+        Article.objects.bulk_update(
+            self.articles, ['story', 'embedding', 'is_primary_source'], batch_size=500
+        )
+
+        # Every article of the chunk, founders of new stories included: the
+        # periodic momentum pass only expires publishers, it never finds them.
+        # Before the joined stories' pages are invalidated below.
+        if getattr(settings, "MOMENTUM_REFRESH_ON_CLUSTER", True):
+            from core.momentum import record_publishers
+            record_publishers(self.articles)
+
+        joined = [self._stories[pk] for pk in sorted(self._joined)]
+        if joined:
+            self._commit_joined(joined)
+
+        # After the category merge above, which the cards' slugs reflect.
+        from core.story_cards import refresh_story_cards
+        refresh_story_cards(self._stories, self.articles)
+
+        self.__init__()
+
+    def _commit_joined(self, joined: list[Story]) -> None:
+        ids = [story.pk for story in joined]
+        counts = _recount_clusters(ids)
+        # bulk_update bypasses auto_now, so the timestamp is stamped explicitly.
+        now = timezone.now()
+
+        for story in joined:
+            source_count, independent_count, primary_found = counts.get(
+                story.pk, (story.source_count, story.independent_count, False)
+            )
+            story.source_count = source_count
+            story.independent_count = independent_count
+            story.velocity_score = compute_velocity(independent_count, story.first_seen_at)
+            # Compute Tier (independent_count is the ONLY promotion signal)
+            story.status = compute_tier(independent_count, story.velocity_score, primary_found)
+            story.last_updated_at = now
+
+        # Same narrow column list as the per-article save, for the same reason:
+        # synthesis writes ai_summary and synthesis_status concurrently.
+        Story.objects.bulk_update(joined, [
+            'source_count', 'independent_count', 'velocity_score',
+            'status', 'embedding', 'last_updated_at',
+        ])
+        Story.update_primary_sources(ids)
+
+        # Merge article categories into story categories. The articles were
+        # assigned above, so the join through Article.story sees them.
+        article_ids = [a.pk for a in self.articles if a.story_id in self._joined]
+        pairs = set(
+            Article.categories.through.objects
+            .filter(article_id__in=article_ids)
+            .values_list('article__story_id', 'category_id')
+        )
+        if pairs:
+            through = Story.categories.through
+            through.objects.bulk_create(
+                [through(story_id=story_id, category_id=category_id)
+                 for story_id, category_id in sorted(pairs)],
+                ignore_conflicts=True,
+            )
+
+        from core.invalidation import invalidate_story, publish_promotion
+
+        for story in joined:
+            invalidate_story(story.slug)
+            if (
+                self._previous_status.get(story.pk) == Story.Status.WIRE
+                and story.status != Story.Status.WIRE
+            ):
+                publish_promotion(story)
+            if _should_resynthesize(story):
+                _dispatch_synthesis(story.id)
+
+
+def merge_stories(keep: Story, drop: Story) -> Story:
+    """
+    Fold `drop` into `keep`: move its articles, merge its categories and
+    centroid, recount, and delete it.
+
+    Used by the partitioned clustering run, whose partitions cannot see each
+    other's new stories and can therefore each open one for the same event.
+    """
+    with transaction.atomic():
+        previous_status = keep.status
+        Article.objects.filter(story=drop).update(story=keep, is_primary_source=False)
+        keep.categories.add(*drop.categories.values_list('id', flat=True))
+
+        # The centroid of the union is the count-weighted mean of the two.
+        if HAS_NUMPY and keep.embedding is not None and drop.embedding is not None:
+            merged = (
+                np.asarray(keep.embedding, dtype=float) * max(keep.source_count, 1)
+                + np.asarray(drop.embedding, dtype=float) * max(drop.source_count, 1)
+            )
+            norm = np.linalg.norm(merged)
+            if norm > 0:
+                merged = merged / norm
+            keep.embedding = [float(x) for x in merged]
+
+        source_count, independent_count, primary_found = _recount_cluster(keep)
+        keep.source_count = source_count
+        keep.independent_count = independent_count
+        keep.velocity_score = compute_velocity(independent_count, keep.first_seen_at)
+        keep.status = compute_tier(independent_count, keep.velocity_score, primary_found)
+        keep.save(update_fields=[
+            'source_count', 'independent_count', 'velocity_score',
+            'status', 'embedding', 'last_updated_at',
+        ])
+        keep.update_primary_source()
+
+        drop_slug = drop.slug
+        drop.delete()
+
+        from core.story_cards import refresh_story_cards
+        refresh_story_cards([keep.pk], rebuild=True)
+
+        if getattr(settings, "MOMENTUM_REFRESH_ON_CLUSTER", True):
+            from core.momentum import refresh_momentum
+            refresh_momentum([keep.pk])
+
+        from core.invalidation import invalidate_story, publish_promotion
+        invalidate_story(keep.slug)
+        invalidate_story(drop_slug)
+        if previous_status == Story.Status.WIRE and keep.status != Story.Status.WIRE:
+            publish_promotion(keep)
+        if _should_resynthesize(keep):
+            _dispatch_synthesis(keep.id)
+
+    return keep
+
+
+def _find_best_match(
+    article: Article,
+    scorer: ClusterScorer,
+    index: CentroidIndex | None = None,
+    batch: AssignmentBatch | None = None,
+) -> tuple[Story | None, float]:
+    """Find the story this article belongs to, if any, and its score."""
+    # A near-duplicate joins its twin's story outright: the texts are the same
+    # report, whatever their vectors would score against drifting centroids.
+    # Outside the index means another partition's thread owns that story; the
+    # article is matched normally instead.
+    twin = getattr(article, 'near_duplicate_of', None)
+    if twin is not None and twin.story_id is not None and (index is None or twin.story_id in index):
+        story = batch.story(twin.story_id) if batch is not None else None
+        if story is None:
+            story = Story.objects.only(*_CANDIDATE_FIELDS).filter(pk=twin.story_id).first()
+        if story is not None:
+            return story, 1.0
+
+    use_ann = isinstance(scorer, EmbeddingScorer)
+
+    if use_ann and index is not None and article.embedding is not None:
+        story_id, score = _best_embedding_candidate(
+            article, index.candidates(article.embedding, article.published_date)
+        )
+        if story_id is None:
+            return None, 0.0
+        # A story this chunk already touched must be the same instance, carrying
+        # its uncommitted count and centroid.
+        story = batch.story(story_id) if batch is not None else None
+        if story is None:
+            # One primary-key read, and only when there is a match.
+            story = Story.objects.only(*_CANDIDATE_FIELDS).get(pk=story_id)
+        return story, score
+
+    candidate_stories = _candidate_stories(article, use_ann)
+
+    if use_ann:
+        return _best_embedding_candidate(
+            article,
+            ((story, story.first_seen_at, story._distance) for story in candidate_stories),
+        )
+
+    best_match, best_score = None, 0.0
+    for story in candidate_stories:
+        score = scorer.similarity(article, story)
+        if score > best_score and score >= TOKEN_MATCH_THRESHOLD:
+            best_score = score
+            best_match = story
+    return best_match, best_score
+
+
+def cluster_article(
+    article: Article,
+    scorer: ClusterScorer = None,
+    index: CentroidIndex | None = None,
+    batch: AssignmentBatch | None = None,
+) -> Story:
     """
     Assign an Article to an existing Story cluster or create a new one.
+
+    With `index`, candidates come from the run's in-memory CentroidIndex rather
+    than one pgvector query per article, and the index is kept current with any
+    centroid this call moves or creates.
+
+    With `batch`, the assignment is recorded rather than written: the article
+    row and every per-story consequence are left for `batch.flush()`. Only the
+    creation of a new story happens immediately, since later articles in the
+    chunk may need to join it.
     """
+    if batch is not None and index is None:
+        raise ValueError("Batched assignment needs the centroid index to see deferred centroids.")
+
     model = get_embedding_model()
 
-    # Generate embedding for candidate article if not present
+    # Generate embedding for candidate article if not present. A near-duplicate
+    # borrows its twin's, which may only exist now that the twin was clustered.
+    twin = getattr(article, 'near_duplicate_of', None)
+    if article.embedding is None and twin is not None and twin.embedding is not None:
+        article.embedding = twin.embedding
     if model and article.embedding is None:
-        article.embedding = embed_text(f"{article.title} {article.excerpt}")
+        article.embedding = embed_text(article_embedding_text(article))
 
     # Topics are assigned here rather than at ingest time because classification
     # is semantic and needs the embedding. Keyword matching used to run during
     # scraping over the full article body, which is why a single passing mention
-    # of a company could file a politics story under Technology.
-    _assign_topics(article)
+    # of a company could file a politics story under Technology. A clustering
+    # run classifies its whole batch up front (assign_topics_batch).
+    if not getattr(article, 'topics_assigned', False):
+        _assign_topics(article)
 
     if scorer is None:
         scorer = EmbeddingScorer() if model else TokenOverlapScorer()
 
     with transaction.atomic():
-        use_ann = isinstance(scorer, EmbeddingScorer)
-        candidate_stories = _candidate_stories(article, use_ann)
-
-        best_match = None
-        best_score = 0.0
-        threshold = EMBEDDING_MATCH_THRESHOLD if use_ann else TOKEN_MATCH_THRESHOLD
-        window = timedelta(hours=72)
-
-        for story in candidate_stories:
-            if use_ann:
-                # pgvector ordered by this distance; reuse it rather than
-                # recomputing the same number in Python.
-                if abs(article.published_date - story.first_seen_at) > window:
-                    continue
-                score = 1.0 - float(story._distance)
-            else:
-                score = scorer.similarity(article, story)
-
-            if use_ann and score < threshold:
-                # Candidates arrive nearest-first, so similarity decreases
-                # monotonically — nothing after this can clear the threshold.
-                break
-
-            if score > best_score and score >= threshold:
-                best_score = score
-                best_match = story
+        best_match, best_score = _find_best_match(article, scorer, index, batch)
 
         if best_match:
             logger.info(
                 "Cluster match: article='%.60s' → story='%.60s' (score=%.3f, scorer=%s)",
                 article.title, best_match.title, best_score, type(scorer).__name__,
             )
+            if batch is not None:
+                best_match = batch.join(article, best_match)
+                index.upsert(best_match.pk, best_match.first_seen_at, best_match.embedding)
+                return best_match
+
             # Add to existing cluster
             if not best_match.articles.filter(id=article.id).exists():
                 article.story = best_match
@@ -479,16 +1073,19 @@ def cluster_article(article: Article, scorer: ClusterScorer = None) -> Story:
                 ])
                 best_match.update_primary_source()
 
-                # Materialised momentum for the Developing edition. Refreshed
-                # here so a story that just gained an outlet ranks immediately,
-                # rather than waiting for the periodic decay pass.
+                from core.story_cards import refresh_story_cards
+                refresh_story_cards([best_match.pk], [article])
+                if index is not None:
+                    index.upsert(best_match.pk, best_match.first_seen_at, best_match.embedding)
+
+                # Materialised momentum for the Developing edition. Recorded
+                # here so a story that just gained an outlet ranks immediately;
+                # the periodic pass only lets it decay.
                 #
-                # Skipped in a batch run that ends with a full refresh — there it
-                # costs ~1.3s per matched story to compute a number that gets
-                # recomputed minutes later.
+                # Skipped in a batch run that ends with a full refresh.
                 if getattr(settings, "MOMENTUM_REFRESH_ON_CLUSTER", True):
-                    from core.momentum import refresh_momentum
-                    refresh_momentum([best_match.pk])
+                    from core.momentum import record_publishers
+                    record_publishers([article])
 
                 # The story page is cached; purge it now that the cluster has
                 # actually changed.
@@ -533,8 +1130,19 @@ def cluster_article(article: Article, scorer: ClusterScorer = None) -> Story:
             )
             story.categories.set(article.categories.all())
 
-            article.story = story
-            article.is_primary_source = True  # Sole article in a new cluster.
-            article.save(update_fields=['story', 'embedding', 'is_primary_source'])
+            if batch is not None:
+                batch.add_new(article, story)
+            else:
+                article.story = story
+                article.is_primary_source = True  # Sole article in a new cluster.
+                article.save(update_fields=['story', 'embedding', 'is_primary_source'])
+                if getattr(settings, "MOMENTUM_REFRESH_ON_CLUSTER", True):
+                    from core.momentum import record_publishers
+                    record_publishers([article])
+
+                from core.story_cards import refresh_story_cards
+                refresh_story_cards([story.pk], [article])
+            if index is not None:
+                index.upsert(story.pk, story.first_seen_at, story.embedding)
 
             return story
@@ -0,0 +1,119 @@
+"""
+Which of a feed's URLs are already stored — without loading the source's archive.
+
+Every scrape used to start by reading all of a source's stored URLs into a
+Python set, so that only new entries were deep-fetched. That set grows with the
+archive: a source with two years of history loads tens of thousands of URLs to
+compare against a feed of thirty.
+
+Instead each source keeps a small index in Redis: a sorted set of 64-bit URL
+digests, scored by when the URL was last seen. A feed's URLs are checked
+against it in one round-trip, and only the probable hits are confirmed against
+the database — an indexed `url IN (...)` over at most a feed's worth of rows.
+A digest collision therefore costs one row of that lookup, never a skipped
+article.
+
+The index is bounded twice: by age (URLs that have left the feed expire after
+URL_INDEX_DAYS, swept by retention) and by size (URL_INDEX_MAX_PER_SOURCE,
+trimmed on every write). An expired URL that reappears is simply a miss — it is
+deep-fetched once and then rejected by the insert, the same outcome as before.
+
+Without Redis (locmem in tests, a broken connection) every URL is treated as a
+probable hit, which degrades to the same bounded database check.
+"""
+import hashlib
+import logging
+import time
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "dedup:urls:"
+
+# How long a URL stays indexed after a feed last listed it. Feeds carry days of
+# items, not weeks, so this only has to outlast an item's time in the feed.
+URL_INDEX_DAYS = 30
+
+# Hard ceiling per source, newest kept. A few times the largest feed observed.
+URL_INDEX_MAX_PER_SOURCE = 5000
+
+
+def _digest(url: str) -> str:
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]  # noqa: S324 - an index key, not a signature
+
+
+def _client():
+    try:
+        return cache.client.get_client(write=True)
+    except Exception:
+        # locmem has no raw client; the database answers alone.
+        return None
+
+
+class SourceUrlIndex:
+    """The URL digest index for one source."""
+
+    def __init__(self, source_id: int):
+        self.key = f"{KEY_PREFIX}{source_id}"
+
+    def known(self, urls) -> set[str]:
+        """The subset of `urls` already stored as articles."""
+        from core.models import Article
+
+        urls = [url for url in dict.fromkeys(urls) if url]
+        if not urls:
+            return set()
+
+        probable = urls
+        client = _client()
+        if client is not None:
+            try:
+                # A missing key means the index has not seen this source yet:
+                # every URL is a candidate, and the confirmed ones seed it.
+                if client.exists(self.key):
+                    scores = client.zmscore(self.key, [_digest(url) for url in urls])
+                    probable = [url for url, score in zip(urls, scores, strict=True)
+                                if score is not None]
+            except Exception as e:
+                logger.debug("URL index lookup failed for %s: %s", self.key, e)
+
+        if not probable:
+            return set()
+
+        stored = set(Article.objects.filter(url__in=probable).values_list("url", flat=True))
+        # Refresh what the feed still lists, so it is not aged out while live.
+        self.add(stored)
+        return stored
+
+    def add(self, urls) -> None:
+        """Record `urls` as stored, seen now."""
+        urls = list(urls)
+        client = _client() if urls else None
+        if client is None:
+            return
+        try:
+            now = time.time()
+            pipe = client.pipeline(transaction=False)
+            pipe.zadd(self.key, {_digest(url): now for url in urls})
+            pipe.zremrangebyrank(self.key, 0, -(URL_INDEX_MAX_PER_SOURCE + 1))
+            pipe.expire(self.key, URL_INDEX_DAYS * 86400)
+            pipe.execute()
+        except Exception as e:
+            # The index is an optimisation; the database stays authoritative.
+            logger.debug("URL index update failed for %s: %s", self.key, e)
+
+
+def trim_url_indexes(days: int = URL_INDEX_DAYS) -> int:
+    """Drop digests not seen for `days`, across every source. Returns how many."""
+    client = _client()
+    if client is None:
+        return 0
+    cutoff = time.time() - days * 86400
+    removed = 0
+    try:
+        for key in client.scan_iter(match=f"{KEY_PREFIX}*", count=500):
+            removed += client.zremrangebyscore(key, "-inf", cutoff)
+    except Exception as e:
+        logger.warning("Could not trim URL indexes: %s", e)
+    return removed
@@ -0,0 +1,154 @@
+"""
+Where embedding vectors come from: a fastembed model, or an ONNX file run
+directly under ONNX Runtime.
+
+The model used to be hardcoded as fastembed's `BAAI/bge-small-en-v1.5` with the
+runtime's defaults. Two things that matter for throughput were out of reach:
+
+  - **Quantized variants.** An int8 export of the same model is a fraction of
+    the size and usually markedly faster on CPU. Whether it still separates
+    same-event from different-event headlines is an empirical question, which
+    is what `manage.py benchmark_embeddings` answers, backend by backend.
+  - **Thread counts.** ONNX Runtime sizes its intra-op pool to every core. Four
+    prefork workers on a four-core host each run four threads, and sixteen
+    threads thrash four cores. EMBEDDING_THREADS pins each process's share.
+
+Backends are named by a spec — `fastembed:<model name>` or
+`onnx:<directory or .onnx file>` — so settings, the benchmark and the embedding
+server all describe a model the same way. Every backend has fastembed's
+interface: `embed(texts, batch_size=...)` yields one vector per text.
+
+Clustering stores 384-dimensional vectors, so a configured model of any other
+width is refused at load rather than failing on the first insert.
+"""
+import logging
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_SPEC = "fastembed:BAAI/bge-small-en-v1.5"
+
+# Article.embedding and Story.embedding are VectorField(dimensions=384).
+EMBEDDING_DIMENSIONS = 384
+
+_OPTIMIZATION_LEVELS = {
+    "disabled": "ORT_DISABLE_ALL",
+    "basic": "ORT_ENABLE_BASIC",
+    "extended": "ORT_ENABLE_EXTENDED",
+    "all": "ORT_ENABLE_ALL",
+}
+
+
+class OnnxEmbedding:
+    """
+    A sentence-embedding ONNX export run directly: tokenizer.json beside the
+    model file, CLS or mean pooling, L2-normalised like fastembed's output.
+    """
+
+    def __init__(self, path: str, threads: int = 0, optimization: str = "all",
+                 pooling: str = "cls", max_length: int = 512):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        model_file = Path(path)
+        if model_file.is_dir():
+            model_file = model_file / "model.onnx"
+        tokenizer_file = next(
+            (p / "tokenizer.json" for p in (model_file.parent, model_file.parent.parent)
+             if (p / "tokenizer.json").exists()),
+            None,
+        )
+        if tokenizer_file is None:
+            raise FileNotFoundError(f"No tokenizer.json beside {model_file}")
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = getattr(
+            ort.GraphOptimizationLevel, _OPTIMIZATION_LEVELS[optimization]
+        )
+        if threads:
+            options.intra_op_num_threads = threads
+            # Parallelism within an operator is what helps a batch; between
+            # operators it only adds threads.
+            options.inter_op_num_threads = 1
+        self._session = ort.InferenceSession(
+            str(model_file), options, providers=["CPUExecutionProvider"]
+        )
+        self._inputs = {i.name for i in self._session.get_inputs()}
+
+        self._tokenizer = Tokenizer.from_file(str(tokenizer_file))
+        self._tokenizer.enable_truncation(max_length=max_length)
+        self._tokenizer.enable_padding()
+        self._pooling = pooling
+
+    def embed(self, texts, batch_size: int = 256):
+        import numpy as np
+
+        texts = list(texts)
+        for start in range(0, len(texts), batch_size):
+            encodings = self._tokenizer.encode_batch(texts[start:start + batch_size])
+            ids = np.array([e.ids for e in encodings], dtype=np.int64)
+            mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+            feed = {"input_ids": ids, "attention_mask": mask}
+            if "token_type_ids" in self._inputs:
+                feed["token_type_ids"] = np.zeros_like(ids)
+
+            hidden = self._session.run(None, feed)[0]
+            if self._pooling == "mean":
+                weights = mask[..., None].astype(hidden.dtype)
+                vectors = (hidden * weights).sum(axis=1) / np.maximum(weights.sum(axis=1), 1e-9)
+            else:
+                vectors = hidden[:, 0]
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            yield from vectors / np.maximum(norms, 1e-12)
+
+
+def build_embedding_model(spec: str, threads: int = 0, optimization: str = "all",
+                          pooling: str = "cls"):
+    """Load the model `spec` names. Raises if its backend is not installed."""
+    backend, _, target = spec.partition(":")
+    if not target:
+        # A bare model name, as the benchmark always accepted.
+        backend, target = "fastembed", spec
+
+    if backend == "fastembed":
+        from fastembed import TextEmbedding
+
+        return TextEmbedding(model_name=target, threads=threads or None)
+    if backend == "onnx":
+        return OnnxEmbedding(target, threads=threads, optimization=optimization, pooling=pooling)
+    raise ValueError(f"Unknown embedding backend '{backend}' in '{spec}'")
+
+
+def load_configured_model():
+    """
+    The model EMBEDDING_MODEL names, configured from settings, or None when it
+    cannot be loaded — the caller degrades to running without embeddings.
+    """
+    spec = getattr(settings, "EMBEDDING_MODEL", "") or DEFAULT_EMBEDDING_SPEC
+    try:
+        model = build_embedding_model(
+            spec,
+            threads=getattr(settings, "EMBEDDING_THREADS", 0),
+            optimization=getattr(settings, "EMBEDDING_GRAPH_OPTIMIZATION", "all"),
+            pooling=getattr(settings, "EMBEDDING_POOLING", "cls"),
+        )
+        # Also proves the model runs: an export that loads can still fail at
+        # inference (wrong input names, no pooling output).
+        width = len(next(iter(model.embed(["dimension probe"], batch_size=1))))
+    except ImportError:
+        logger.warning("Embedding backend for %s is not installed; embeddings disabled.", spec)
+        return None
+    except Exception:
+        logger.exception("Could not load embedding model %s; embeddings disabled.", spec)
+        return None
+
+    if width != EMBEDDING_DIMENSIONS:
+        logger.error(
+            "Embedding model %s produces %d-dimensional vectors; the schema stores %d. "
+            "Embeddings disabled.", spec, width, EMBEDDING_DIMENSIONS,
+        )
+        return None
+    logger.info("Loaded embedding model %s.", spec)
+    return model
@@ -0,0 +1,139 @@
+"""
+Scoped cache generations.
+
+The feed cache, the pre-rendered editions and the answer cache were all keyed
+on one corpus generation, bumped after every clustering run that processed
+anything. Ingestion never stops, so that was nearly every run: one wire article
+joining a Sport story retired the Politics momentum edition and every cached
+answer, none of which it could have changed, and hit rates stayed near zero
+under continuous ingest.
+
+Generations are now kept per scope, and clustering advances only the scopes
+whose contents its run changed (`scopes_changed_by`):
+
+  feed:{sort}:{category}  Feed pages of one edition in one category, or `all`.
+                          Advanced for the categories of every touched story —
+                          except momentum, which only lists stories with two
+                          or more recent outlets, and is advanced only when a
+                          touched story has them.
+  story:{id}              Answers that cite the story. Advanced when it is
+                          touched.
+  category:{slug}         Answers that cite a story in the category. Advanced
+                          when a story opens there, since retrieval could now
+                          pick it — a story joining an existing one is covered
+                          by that story's own scope.
+
+An uncategorised new story advances no category, so an answer it would have
+changed lives out its TTL — the price of not retiring every answer on every
+run.
+
+A scope's token is an opaque string: the time of its last advance, or "0" for
+a scope never advanced. Times rather than counters so that a scope key expiring
+can never walk a token back to a value some older cache entry still holds.
+"""
+import time
+
+from django.core.cache import cache
+
+from core import cache_tiers
+
+# Every sort `list_stories` serves; each is a separate feed scope.
+FEED_SORTS = ("latest", "velocity", "momentum", "significance")
+
+# Scope keys outlive anything cached under their tokens many times over; a
+# key expiring only costs that scope's next read a miss.
+SCOPE_TTL_SECONDS = 24 * 3600
+
+_PREFIX = "gen:"
+
+
+def feed_scope(sort: str, category: str | None) -> str:
+    return f"feed:{sort}:{(category or 'all').lower()}"
+
+
+def story_scope(story_id: int) -> str:
+    return f"story:{story_id}"
+
+
+def category_scope(slug: str) -> str:
+    return f"category:{slug}"
+
+
+def token(scope: str) -> str:
+    """The scope's current generation. Read per request, so held in process memory."""
+    return str(cache_tiers.get(_PREFIX + scope) or 0)
+
+
+def tokens(scopes) -> dict[str, str]:
+    return {scope: token(scope) for scope in scopes}
+
+
+def advance(scopes) -> dict[str, str]:
+    """
+    New tokens for `scopes`, not yet visible to readers. Anything that should
+    be ready when they are — pre-rendered editions — is built under these,
+    then `publish` makes them current.
+    """
+    new = str(time.time_ns())
+    return {scope: new for scope in scopes}
+
+
+def publish(advanced: dict[str, str]) -> None:
+    if not advanced:
+        return
+    cache.set_many(
+        {_PREFIX + scope: value for scope, value in advanced.items()},
+        timeout=SCOPE_TTL_SECONDS,
+    )
+    for scope in advanced:
+        cache_tiers.invalidate(_PREFIX + scope)
+
+
+def bump(scopes) -> None:
+    """Retire everything cached under `scopes`."""
+    publish(advance(scopes))
+
+
+def scopes_changed_by(story_ids, created_ids=()) -> set[str]:
+    """Scopes whose cached contents may differ after `story_ids` changed."""
+    from core.models import Story
+
+    story_ids, created_ids = set(story_ids), set(created_ids)
+    if not story_ids:
+        return set()
+
+    categories = list(
+        Story.categories.through.objects
+        .filter(story_id__in=story_ids)
+        .values_list('story_id', 'category__slug')
+    )
+    developing = set(
+        Story.objects.filter(id__in=story_ids, momentum_outlets__gte=2)
+        .values_list('id', flat=True)
+    )
+
+    scopes = {story_scope(story_id) for story_id in story_ids}
+    for sort in FEED_SORTS:
+        if sort != "momentum" or developing:
+            scopes.add(feed_scope(sort, None))
+    for story_id, slug in categories:
+        if story_id in created_ids:
+            scopes.add(category_scope(slug))
+        for sort in FEED_SORTS:
+            if sort != "momentum" or story_id in developing:
+                scopes.add(feed_scope(sort, slug))
+    return scopes
+
+
+def answer_scopes(story_ids) -> list[str]:
+    """Scopes an answer grounded on `story_ids` depends on."""
+    from core.models import Story
+
+    slugs = set(
+        Story.categories.through.objects
+        .filter(story_id__in=story_ids)
+        .values_list('category__slug', flat=True)
+    )
+    return [story_scope(story_id) for story_id in story_ids] + [
+        category_scope(slug) for slug in sorted(slugs)
+    ]
@@ -74,7 +74,11 @@ def invalidate_story(slug: str) -> None:
     if not slug:
         return
 
-    cache.delete(story_cache_key(slug))
+    from core import cache_tiers
+
+    # Story pages are also held in each API process's memory; this drops
+    # those copies too (core/cache_tiers.py).
+    cache_tiers.delete(story_cache_key(slug))
 
     # Feed counts are derived from story rows. delete_pattern is a django-redis
     # extension, so fall back silently on other backends (e.g. locmem in tests).
@@ -0,0 +1,45 @@
+"""
+Deferred imports for the heavy numeric stack.
+
+numpy, fastembed and ONNX Runtime are only needed once something is embedded
+or compared — clustering, /ask, topic classification. Imported at module level
+they were paid for by every process that so much as imported core.clustering,
+including API workers that only ever serve cached feed pages.
+
+`LazyModule("numpy")` is a stand-in that imports the real module on first
+attribute access, so `np.asarray(...)` reads as before. Whether a module is
+installed is answered by `module_available`, which finds it without importing
+it.
+
+`manage.py importtime` shows what a process actually imports at boot.
+"""
+import importlib
+import importlib.util
+from functools import cache
+
+
+class LazyModule:
+    """A module imported on first use."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            # importlib holds the import lock; concurrent first uses are safe.
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not yet imported"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+@cache
+def module_available(name: str) -> bool:
+    """Whether `name` can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
@@ -7,13 +7,18 @@ swinging to the opposite failure — tagging everything, which is just as useles
 
     python manage.py calibrate_topics
     python manage.py calibrate_topics --show tech --threshold 0.62
+    python manage.py calibrate_topics --rebuild-prototypes
+
+The embedded prototypes are persisted (TOPIC_PROTOTYPE_CACHE_DIR) and rebuilt
+on their own when TOPICS or the model changes; --rebuild-prototypes re-embeds
+them regardless, e.g. after replacing the files behind an onnx: model.
 """
 from collections import Counter
 
 from django.core.management.base import BaseCommand
 
 from core.models import Article
-from core.topics import TOPICS_BY_SLUG, classify, score_topics
+from core.topics import TOPICS_BY_SLUG, classify, rebuild_prototypes, score_topics
 
 
 class Command(BaseCommand):
@@ -25,8 +30,17 @@ class Command(BaseCommand):
         parser.add_argument("--limit", type=int, default=1000)
         parser.add_argument("--show", type=str, help="Print sample headlines for this topic slug.")
         parser.add_argument("--threshold", type=float, default=0.62, help="Threshold used by --show.")
+        parser.add_argument("--rebuild-prototypes", action="store_true",
+                            help="Re-embed and persist the topic prototypes first.")
 
     def handle(self, *args, **opts):
+        if opts["rebuild_prototypes"]:
+            matrix, slugs = rebuild_prototypes()
+            if matrix is None:
+                self.stderr.write("No embedding model available; prototypes not rebuilt.")
+                return
+            self.stdout.write(f"Rebuilt prototypes for {len(slugs)} topics.\n")
+
         articles = list(
             Article.objects.filter(embedding__isnull=False)
             .only("id", "title", "embedding")[: opts["limit"]]
@@ -0,0 +1,115 @@
+"""
+Profile what a process imports at boot, `python -X importtime` style.
+
+Boots a fresh interpreter the way the named process boots, with
+`-X importtime`, and summarises the report: total import time, the slowest
+top-level packages, and which heavy packages were pulled in at all.
+
+    python manage.py importtime                 # the ASGI API process
+    python manage.py importtime --target worker # a Celery worker's task modules
+    python manage.py importtime --fail-on fastembed onnxruntime
+
+--fail-on exits non-zero if any named package was imported, so CI can hold the
+line on an API process booting without the embedding stack. numpy is expected
+in every process: pgvector's field definitions import it when the models load.
+"""
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+
+# What each process imports before it serves anything. The URL resolver is
+# what the API's first request imports, so it counts as boot.
+BOOT_SCRIPTS = {
+    "api": (
+        "import config.asgi\n"
+        "from django.urls import get_resolver\n"
+        "get_resolver().url_patterns\n"
+    ),
+    "worker": (
+        "import django\n"
+        "django.setup()\n"
+        "import core.tasks\n"
+    ),
+}
+
+# Packages worth calling out whenever they appear.
+HEAVY_PACKAGES = ("numpy", "fastembed", "onnxruntime", "tokenizers", "trafilatura", "lxml")
+
+
+def parse_importtime(report: str) -> tuple[dict[str, int], dict[str, int]]:
+    """
+    Microseconds per top-level package, from `-X importtime` stderr, as
+    (boot, packages).
+
+    `boot` is the cumulative time of each unindented row: what the boot script
+    itself imported, ranked to show where boot time goes. `packages` sums the
+    self time of every row, nested ones included, by package — the rows a
+    package's modules appear under are whatever first imported them (everything
+    the API loads sits under `config.asgi`), so this is the only view that
+    answers whether a package was imported at all. Self time, so a package's
+    modules importing each other are not counted twice.
+    """
+    boot: dict[str, int] = defaultdict(int)
+    packages: dict[str, int] = defaultdict(int)
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            self_micros, cumulative, name = line[len("import time:"):].split("|")
+            self_micros, cumulative = int(self_micros), int(cumulative)
+        except ValueError:
+            continue  # The header row.
+        package = name.strip().split(".")[0]
+        packages[package] += self_micros
+        # Top-level entries are the ones not indented under a parent import.
+        if name.startswith(" ") and not name.startswith("  "):
+            boot[package] += cumulative
+    return dict(boot), dict(packages)
+
+
+class Command(BaseCommand):
+    help = "Report what a process imports at boot and how long it takes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--target", choices=sorted(BOOT_SCRIPTS), default="api")
+        parser.add_argument("--top", type=int, default=15)
+        parser.add_argument("--fail-on", nargs="*", default=[], metavar="PACKAGE",
+                            help="Exit non-zero if any of these packages is imported.")
+
+    def handle(self, *args, **opts):
+        env = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "config.settings"),
+            # Profile the boot itself, not a warm-up thread racing it.
+            "EMBEDDING_WARMUP": "0",
+        }
+        result = subprocess.run(  # noqa: S603 - our own interpreter and a fixed script
+            [sys.executable, "-X", "importtime", "-c", BOOT_SCRIPTS[opts["target"]]],
+            capture_output=True, text=True, env=env, check=False,
+        )
+        if result.returncode != 0:
+            raise CommandError(f"Boot failed:\n{result.stderr[-2000:]}")
+
+        boot, packages = parse_importtime(result.stderr)
+        total_ms = sum(boot.values()) / 1000
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f"{opts['target']} boot: {total_ms:.0f} ms of imports across {len(packages)} packages"
+        ))
+        for name, micros in sorted(boot.items(), key=lambda kv: -kv[1])[:opts["top"]]:
+            self.stdout.write(f"  {micros / 1000:8.1f} ms  {name}")
+
+        self.stdout.write("")
+        for name in HEAVY_PACKAGES:
+            if name in packages:
+                self.stdout.write(self.style.WARNING(
+                    f"  imported  {name:12} {packages[name] / 1000:8.1f} ms"
+                ))
+            else:
+                self.stdout.write(f"  deferred  {name}")
+
+        offenders = [name for name in opts["fail_on"] if name in packages]
+        if offenders:
+            raise CommandError(f"Imported at boot: {', '.join(offenders)}")
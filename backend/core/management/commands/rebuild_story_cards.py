@@ -0,0 +1,41 @@
+"""
+Recompute every story's feed card (core/story_cards.py) from its articles.
+
+Clustering keeps cards current as articles join. Run this once after deploying
+cards, so stories clustered before then stop being derived per request, and
+after anything that changes a card without clustering — a source moved between
+trust tiers, a bulk re-categorisation.
+
+    python manage.py rebuild_story_cards
+    python manage.py rebuild_story_cards --days 7
+"""
+from datetime import timedelta
+from itertools import islice
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.models import Story
+from core.story_cards import refresh_story_cards
+
+
+class Command(BaseCommand):
+    help = "Rebuild story feed cards from their articles."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=0,
+                            help="Only stories first seen in the last N days. 0 = all.")
+        parser.add_argument("--batch", type=int, default=500)
+
+    def handle(self, *args, **opts):
+        stories = Story.objects.order_by('id')
+        if opts["days"]:
+            stories = stories.filter(first_seen_at__gte=timezone.now() - timedelta(days=opts["days"]))
+
+        ids = stories.values_list('id', flat=True).iterator(chunk_size=opts["batch"])
+        seen = written = 0
+        while chunk := list(islice(ids, opts["batch"])):
+            written += refresh_story_cards(chunk, rebuild=True)
+            seen += len(chunk)
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt cards for {seen} stories; {written} changed."))
@@ -9,6 +9,7 @@ embedding, so articles without one are skipped — clustering computes them.
     python manage.py recategorize_all --apply
 """
 from collections import Counter
+from itertools import islice
 
 from django.core.management.base import BaseCommand
 
@@ -23,10 +24,10 @@ class Command(BaseCommand):
         parser.add_argument("--batch", type=int, default=500)
 
     def handle(self, *args, **opts):
-        from core.clustering import _assign_topics
-        from core.topics import classify
+        from core.clustering import assign_topics_batch
+        from core.topics import classify_batch
 
-        queryset = Article.objects.filter(embedding__isnull=False)
+        queryset = Article.objects.filter(embedding__isnull=False).only('id', 'embedding')
         total = queryset.count()
         if not total:
             self.stderr.write(
@@ -41,17 +42,19 @@ class Command(BaseCommand):
         untagged = 0
         processed = 0
 
-        for article in queryset.iterator(chunk_size=opts["batch"]):
-            chosen = classify(article.embedding)
-            if chosen:
-                for slug, _score in chosen:
-                    counts[slug] += 1
-            else:
-                untagged += 1
-
+        # A chunk at a time: one matrix product to classify it and, with
+        # --apply, one bulk insert to write it.
+        articles = queryset.order_by('id').iterator(chunk_size=opts["batch"])
+        while chunk := list(islice(articles, opts["batch"])):
+            for chosen in classify_batch([a.embedding for a in chunk]):
+                if chosen:
+                    for slug, _score in chosen:
+                        counts[slug] += 1
+                else:
+                    untagged += 1
             if opts["apply"]:
-                _assign_topics(article)
-            processed += 1
+                assign_topics_batch(chunk)
+            processed += len(chunk)
 
         self.stdout.write("")
         for slug, count in counts.most_common():
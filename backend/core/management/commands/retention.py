@@ -35,6 +35,7 @@ class Command(BaseCommand):
             "raw_documents_purged",
             "article_payloads_cleared",
             "uncorroborated_stories_deleted",
+            "url_index_entries_trimmed",
         ):
             self.stdout.write(f"  {key:32} {result[key]}")
 
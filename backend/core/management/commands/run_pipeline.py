@@ -41,6 +41,12 @@ class Command(BaseCommand):
                  'and the next run resumes — far better than being killed by a '
                  'job timeout, which loses the run without keeping the progress.',
         )
+        parser.add_argument(
+            '--cluster-workers', type=int, default=None, metavar='N',
+            help='Cluster independent partitions of the queue on N threads. '
+                 'Defaults to CLUSTER_PARTITION_WORKERS. Each thread holds a '
+                 'database connection.',
+        )
         parser.add_argument(
             '--synthesize', type=int, default=10, metavar='N',
             help='Generate briefs for up to N stories, most-corroborated first. '
@@ -64,6 +70,9 @@ class Command(BaseCommand):
         # matched story on the way there recomputes the same values repeatedly.
         settings.MOMENTUM_REFRESH_ON_CLUSTER = False
 
+        if options['cluster_workers'] is not None:
+            settings.CLUSTER_PARTITION_WORKERS = max(1, options['cluster_workers'])
+
         started = time.monotonic()
         ingested = 0
         failed_sources = []
@@ -177,6 +186,21 @@ class Command(BaseCommand):
         return written
 
     def _ingest(self, source_ids, workers):
+        from django.conf import settings
+
+        if getattr(settings, "INGEST_ENGINE", "async") == "async":
+            # One event loop over a shared client; --workers stays the cap on
+            # feeds in flight, which on this path costs sockets, not threads.
+            from core.ingest_engine import ingest_sources
+
+            outcomes = ingest_sources(source_ids, concurrency=max(1, workers))
+            failures = []
+            for source_id, (_count, error) in sorted(outcomes.items()):
+                if error is not None:
+                    failures.append(source_id)
+                    self.stderr.write(f"  source {source_id}: {error[:120]}")
+            return sum(count for count, _ in outcomes.values()), failures
+
         from core.tasks import scrape_single_source
 
         def scrape(source_id):
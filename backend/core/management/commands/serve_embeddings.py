@@ -0,0 +1,42 @@
+"""
+Run the shared embedding server (core/services/embedding_server.py).
+
+    python manage.py serve_embeddings                          # EMBEDDING_SERVER_URL
+    python manage.py serve_embeddings --url unix:///run/ultranews/embeddings.sock
+    python manage.py serve_embeddings --url http://127.0.0.1:8765 --window-ms 10
+
+Point every worker and API process at the same address with
+EMBEDDING_SERVER_URL. Any of them that cannot reach it loads the model itself.
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.services.embedding_server import BATCH_WINDOW_SECONDS, create_app, parse_server_url
+
+
+class Command(BaseCommand):
+    help = "Serve embeddings for every process on this host from one model."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--url", default="",
+            help="unix:///path/to.sock or http://127.0.0.1:PORT (default: EMBEDDING_SERVER_URL).",
+        )
+        parser.add_argument(
+            "--window-ms", type=float, default=BATCH_WINDOW_SECONDS * 1000,
+            help="How long a batch waits for more requests to join it.",
+        )
+
+    def handle(self, *args, **opts):
+        import uvicorn
+
+        url = opts["url"] or getattr(settings, "EMBEDDING_SERVER_URL", "") or "http://127.0.0.1:8765"
+        uds, host, port = parse_server_url(url)
+        app = create_app(window=opts["window_ms"] / 1000)
+
+        self.stdout.write(f"Embedding server on {url}")
+        # One process: the point is one copy of the model.
+        if uds:
+            uvicorn.run(app, uds=uds, lifespan="on", log_level="info")
+        else:
+            uvicorn.run(app, host=host, port=port, lifespan="on", log_level="info")
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.17 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_story_momentum'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='source',
+            name='empty_fetch_rate',
+            field=models.FloatField(default=0.0, help_text='Weighted share of recent fetches that brought no new articles (304s included).'),
+        ),
+        migrations.AddField(
+            model_name='source',
+            name='next_fetch_at',
+            field=models.DateTimeField(blank=True, help_text='When this source is next due. Empty means due now.', null=True),
+        ),
+        migrations.AlterField(
+            model_name='source',
+            name='fetch_interval_minutes',
+            field=models.PositiveIntegerField(default=30, help_text='Learned poll interval, from the publish rate and the empty-fetch rate.'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-10-18 10:05
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_source_adaptive_schedule'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='minhash',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.IntegerField(), blank=True, default=list, help_text="MinHash signature of the text's word shingles. Empty for texts too short to sign.", size=None),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='minhash_bands',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.IntegerField(), blank=True, default=list, help_text='LSH bands of the MinHash signature; articles sharing a band are near-duplicate candidates.', size=None),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['minhash_bands'], name='article_minhash_bands_idx'),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.17 on 2026-10-18 14:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_story_publishers(apps, schema_editor):
+    """
+    Seed the side table from the articles already inside the momentum window.
+
+    The periodic pass only recounts stories whose rows expire, so without this a
+    story ranked before the deploy would keep its momentum until the next full
+    reconciliation.
+    """
+    from datetime import timedelta
+
+    from django.db.models import CharField, Max, Value
+    from django.db.models.functions import Coalesce, NullIf
+    from django.utils import timezone
+
+    Article = apps.get_model('core', 'Article')
+    StoryPublisher = apps.get_model('core', 'StoryPublisher')
+
+    # core.momentum.MOMENTUM_WINDOW_HOURS at the time of writing.
+    window_start = timezone.now() - timedelta(hours=12)
+    publisher = Coalesce(
+        NullIf('source__publisher_domain', Value('', output_field=CharField())),
+        'source__url',
+        output_field=CharField(),
+    )
+    rows = (
+        Article.objects
+        .filter(
+            story__isnull=False,
+            published_date__gte=window_start,
+            source__trust_tier='auto_publish',
+        )
+        .values('story_id', publisher=publisher)
+        .annotate(latest=Max('published_date'))
+        .values_list('story_id', 'publisher', 'latest')
+    )
+    StoryPublisher.objects.bulk_create(
+        [StoryPublisher(story_id=story_id, publisher=name, last_published_at=latest)
+         for story_id, name, latest in rows],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0022_article_minhash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoryPublisher',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('publisher', models.CharField(max_length=1000)),
+                ('last_published_at', models.DateTimeField()),
+                ('story', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='momentum_publishers', to='core.story')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['last_published_at'], name='story_publisher_expiry_idx')],
+                'constraints': [models.UniqueConstraint(fields=('story', 'publisher'), name='story_publisher_unique')],
+            },
+        ),
+        migrations.RunPython(backfill_story_publishers, migrations.RunPython.noop),
+    ]
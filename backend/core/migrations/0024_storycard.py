@@ -0,0 +1,27 @@
+# Generated by Django 5.2.17 on 2026-10-18 15:05
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0023_storypublisher'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StoryCard',
+            fields=[
+                ('story', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='card', serialize=False, to='core.story')),
+                ('image_url', models.URLField(blank=True, max_length=1000, null=True)),
+                ('sources', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=255), blank=True, default=list, size=None)),
+                ('framing_preview', models.JSONField(blank=True, default=list)),
+                ('category_slugs', django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=50), blank=True, default=list, size=None)),
+                ('last_article_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
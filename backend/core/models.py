@@ -1,6 +1,7 @@
 import uuid
 from urllib.parse import urlparse
 
+from django.contrib.postgres.fields import ArrayField
 from django.contrib.postgres.indexes import GinIndex
 from django.contrib.postgres.search import SearchVectorField
 from django.db import models
@@ -94,7 +95,20 @@ class Source(models.Model):
     )
     # Health tracking for the source dashboard and the circuit breaker.
     is_active = models.BooleanField(default=True)
-    fetch_interval_minutes = models.PositiveIntegerField(default=30)
+    # Adaptive scheduling (core/scheduling.py): each source is fetched on its
+    # own learned interval rather than one global cadence.
+    fetch_interval_minutes = models.PositiveIntegerField(
+        default=30,
+        help_text="Learned poll interval, from the publish rate and the empty-fetch rate.",
+    )
+    next_fetch_at = models.DateTimeField(
+        null=True, blank=True,
+        help_text="When this source is next due. Empty means due now.",
+    )
+    empty_fetch_rate = models.FloatField(
+        default=0.0,
+        help_text="Weighted share of recent fetches that brought no new articles (304s included).",
+    )
     last_fetched_at = models.DateTimeField(
         null=True, blank=True,
         help_text="Last time a fetch was ATTEMPTED (success or failure).",
@@ -308,6 +322,88 @@ class Story(models.Model):
             self.articles.filter(pk=earliest_article.pk).update(is_primary_source=True)
             earliest_article.is_primary_source = True
 
+    @staticmethod
+    def update_primary_sources(story_ids) -> None:
+        """
+        `update_primary_source` for many stories at once: three statements
+        however many stories changed, rather than three per story.
+
+        Same (published_date, id) ordering, so the credit lands on the same
+        article either way.
+        """
+        story_ids = list(story_ids)
+        if not story_ids:
+            return
+
+        earliest = list(
+            Article.objects.filter(story_id__in=story_ids)
+            .order_by('story_id', 'published_date', 'id')
+            .distinct('story_id')
+            .values_list('id', flat=True)
+        )
+        Article.objects.filter(story_id__in=story_ids, is_primary_source=True).exclude(
+            pk__in=earliest
+        ).update(is_primary_source=False)
+        Article.objects.filter(pk__in=earliest, is_primary_source=False).update(
+            is_primary_source=True
+        )
+
+
+
+class StoryPublisher(models.Model):
+    """
+    The latest article each publisher filed on a story inside the momentum
+    window: the working set behind `Story.momentum_outlets`.
+
+    Maintained incrementally by core/momentum.py — upserted as articles join a
+    story, deleted as they age out of the window — so momentum is a count of
+    this story's rows rather than a COUNT(DISTINCT) over its articles.
+    """
+    story = models.ForeignKey(Story, on_delete=models.CASCADE, related_name='momentum_publishers')
+    # Source.publisher_domain, or the feed URL when that is blank.
+    publisher = models.CharField(max_length=1000)
+    last_published_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['story', 'publisher'], name='story_publisher_unique'),
+        ]
+        indexes = [
+            # Serves the expiry sweep: everything older than the window start.
+            models.Index(fields=['last_published_at'], name='story_publisher_expiry_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.publisher} on story {self.story_id}"
+
+
+class StoryCard(models.Model):
+    """
+    What a feed card shows beyond the Story row itself, precomputed.
+
+    The feed used to derive these per request: a query over every publishable
+    article of the page's stories, a Python pass to pick the image, outlets and
+    headlines, and a categories prefetch. Clustering maintains this row as
+    articles join (core/story_cards.py), so a feed page is one read of stories
+    joined to their cards.
+    """
+    story = models.OneToOneField(
+        Story, on_delete=models.CASCADE, primary_key=True, related_name='card'
+    )
+    image_url = models.URLField(max_length=1000, null=True, blank=True)
+    # Distinct outlet names, earliest report first, capped for the card.
+    sources = ArrayField(models.CharField(max_length=255), default=list, blank=True)
+    # [{"source", "title", "url"}] — the framing switcher's headlines.
+    framing_preview = models.JSONField(default=list, blank=True)
+    category_slugs = ArrayField(models.CharField(max_length=50), default=list, blank=True)
+    # Newest publishable article that changed the card, so a later one can be
+    # appended without re-reading the story's coverage.
+    last_article_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Card for story {self.story_id}"
+
 
 class Article(models.Model):
     title = models.CharField(max_length=500)
@@ -327,6 +423,16 @@ class Article(models.Model):
         max_length=64, blank=True, db_index=True,
         help_text="SHA-256 hash of normalized content for deduplication.",
     )
+    # Near-duplicate detection (core/near_duplicates.py). Catches the wire copy
+    # content_hash misses: same story, different byline or closing sentence.
+    minhash = ArrayField(
+        models.IntegerField(), default=list, blank=True,
+        help_text="MinHash signature of the text's word shingles. Empty for texts too short to sign.",
+    )
+    minhash_bands = ArrayField(
+        models.IntegerField(), default=list, blank=True,
+        help_text="LSH bands of the MinHash signature; articles sharing a band are near-duplicate candidates.",
+    )
     published_date = models.DateTimeField()
     created_at = models.DateTimeField(auto_now_add=True)
     categories = models.ManyToManyField(Category, related_name='articles', blank=True)
@@ -356,6 +462,7 @@ class Article(models.Model):
                 condition=models.Q(story__isnull=True),
             ),
             GinIndex(fields=['search_vector'], name='article_search_gin_idx'),
+            GinIndex(fields=['minhash_bands'], name='article_minhash_bands_idx'),
             # Serves the "Developing" edition, which counts distinct publishers
             # whose article landed inside a recent window.
             models.Index(fields=['-created_at', 'story'], name='article_recent_idx'),
@@ -386,8 +493,34 @@ class Article(models.Model):
                 kwargs['update_fields'] = list(update_fields) + ['slug']
         super().save(*args, **kwargs)
 
+    @staticmethod
+    def _slug_base(title: str) -> str:
+        return slugify(title)[:180] or f"article-{uuid.uuid4().hex[:8]}"
+
+    @classmethod
+    def unique_slugs(cls, titles) -> list[str]:
+        """
+        Slugs for a batch of new articles, with one query for the whole batch.
+
+        `_build_unique_slug` checks candidates one query at a time, which is
+        fine for a single save and up to five round-trips per row on a bulk
+        insert. Here every base slug is checked in one `IN` lookup; a base that
+        is taken, or repeats within the batch, gets a random suffix. Suffixed
+        slugs are not re-checked — a collision at 16^6 is not worth a query.
+        A bulk insert that ignores conflicts must retry what a slug conflict
+        skipped (see `core.tasks._store_feed_result`).
+        """
+        bases = [cls._slug_base(title) for title in titles]
+        taken = set(cls.objects.filter(slug__in=set(bases)).values_list('slug', flat=True))
+        slugs = []
+        for base in bases:
+            slug = base if base not in taken else f"{base}-{uuid.uuid4().hex[:6]}"
+            taken.add(slug)
+            slugs.append(slug)
+        return slugs
+
     def _build_unique_slug(self) -> str:
-        base = slugify(self.title)[:180] or f"article-{uuid.uuid4().hex[:8]}"
+        base = self._slug_base(self.title)
         candidate = base
         # Bounded retries, then fall back to a guaranteed-unique suffix rather
         # than looping against a hot table.
@@ -12,17 +12,27 @@ outlets thirteen hours ago has zero momentum now, but nothing touched its row to
 say so. Refreshing only when an article joins would leave yesterday's news
 permanently pinned to the top of Developing.
 
-So the refresh has two halves:
+Momentum is maintained incrementally, from a side table of (story, publisher,
+latest publish time) rows — `StoryPublisher`:
 
-  1. Recompute stories that could still be inside the window.
-  2. Zero everything that has aged out — one bulk UPDATE, no per-row work.
+  1. `record_publishers` — as articles join stories, upsert their publishers'
+     rows and recount just those stories. A few rows per article, not an
+     aggregate over the story's coverage.
+  2. `expire_momentum` — the periodic pass. Delete rows that have slid out of
+     the window and recount only the stories that lost one.
 
-Both are bounded: the first by the window, the second by an indexed predicate.
+Either way a story is written back only when its count changed.
+
+`refresh_momentum` is the exact recomputation from articles that this replaced.
+It rebuilds the side table as it goes, so it doubles as the reconciliation pass
+for anything the incremental path cannot see — a source changing trust tier, a
+publisher domain re-derived.
 """
 import logging
 from datetime import timedelta
 
-from django.db.models import Count, Q
+from django.db import transaction
+from django.db.models import Count, Max
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
@@ -31,19 +41,15 @@ logger = logging.getLogger(__name__)
 # the computation; the API imports the value rather than restating it.
 MOMENTUM_WINDOW_HOURS = 12
 
-# Margin beyond the window when selecting candidates to recompute. A story whose
-# newest article just fell out still needs one final pass to be zeroed correctly
-# rather than left at its last non-zero value.
-REFRESH_MARGIN_HOURS = 2
-
 
 def _window_start():
     return timezone.now() - timedelta(hours=MOMENTUM_WINDOW_HOURS)
 
 
-def _publisher_identity():
+def _publisher_identity(prefix='articles__'):
     """
-    SQL expression for a source's publisher identity.
+    SQL expression for a source's publisher identity, reached from a Story
+    (the default) or, with `prefix=''`, from an Article.
 
     Mirrors `Source.independence_key`: the resolved domain, falling back to the
     feed URL when it is blank. Without the fallback every unresolvable source
@@ -54,77 +60,189 @@ def _publisher_identity():
     from django.db.models.functions import Coalesce, NullIf
 
     return Coalesce(
-        NullIf('articles__source__publisher_domain', Value('', output_field=CharField())),
-        'articles__source__url',
+        NullIf(f'{prefix}source__publisher_domain', Value('', output_field=CharField())),
+        f'{prefix}source__url',
         output_field=CharField(),
     )
 
 
-def refresh_momentum(story_ids=None) -> dict:
+def _publisher_key(source) -> str:
+    """`_publisher_identity`, for a Source instance in hand."""
+    return source.publisher_domain or source.url
+
+
+def _write_counts(story_ids, now) -> tuple[int, int]:
+    """
+    Set momentum_outlets for `story_ids` from their in-window StoryPublisher
+    rows, writing only the stories whose count changed. Returns (updated, zeroed).
+    """
+    from core.models import Story, StoryPublisher
+
+    story_ids = list(story_ids)
+    if not story_ids:
+        return 0, 0
+
+    counts = dict(
+        StoryPublisher.objects
+        .filter(story_id__in=story_ids, last_published_at__gte=_window_start())
+        .values('story_id')
+        .annotate(n=Count('id'))
+        .values_list('story_id', 'n')
+    )
+    updated = []
+    for story in Story.objects.filter(pk__in=story_ids).only('id', 'momentum_outlets'):
+        count = counts.get(story.pk, 0)
+        if story.momentum_outlets != count:
+            story.momentum_outlets = count
+            story.momentum_computed_at = now
+            updated.append(story)
+
+    if updated:
+        Story.objects.bulk_update(
+            updated, ['momentum_outlets', 'momentum_computed_at'], batch_size=500
+        )
+    return len(updated), sum(1 for story in updated if story.momentum_outlets == 0)
+
+
+def record_publishers(articles) -> dict:
     """
-    Recompute `momentum_outlets`.
+    Count the publishers of articles that have just joined stories.
 
-    With `story_ids`, refreshes exactly those (used by clustering when a story
-    changes). Without, refreshes every story that could plausibly be inside the
-    window and zeroes the rest.
+    One row per (story, publisher) holds the publisher's latest article there;
+    an article only creates a row or moves its timestamp forward. Then only the
+    touched stories are recounted.
     """
-    from core.models import Source, Story
+    from core.models import Source, StoryPublisher
 
     window_start = _window_start()
+    latest: dict[tuple[int, str], object] = {}
+    for article in articles:
+        if (
+            article.story_id is None
+            or article.published_date < window_start
+            or article.source.trust_tier != Source.TrustTier.AUTO_PUBLISH
+        ):
+            continue
+        key = (article.story_id, _publisher_key(article.source))
+        if key not in latest or article.published_date > latest[key]:
+            latest[key] = article.published_date
+    if not latest:
+        return {"updated": 0}
+
+    story_ids = {story_id for story_id, _publisher in latest}
+    # Never move a row backwards: a late-arriving older article must not make
+    # the publisher look staler than it is.
+    for story_id, publisher, published in StoryPublisher.objects.filter(
+        story_id__in=story_ids, publisher__in={p for _s, p in latest}
+    ).values_list('story_id', 'publisher', 'last_published_at'):
+        if (story_id, publisher) in latest and latest[(story_id, publisher)] <= published:
+            del latest[(story_id, publisher)]
+
+    if latest:
+        StoryPublisher.objects.bulk_create(
+            [StoryPublisher(story_id=story_id, publisher=publisher, last_published_at=published)
+             for (story_id, publisher), published in latest.items()],
+            update_conflicts=True,
+            unique_fields=['story', 'publisher'],
+            update_fields=['last_published_at'],
+        )
+    updated, _zeroed = _write_counts({story_id for story_id, _p in latest}, timezone.now())
+    return {"updated": updated}
+
+
+def expire_momentum() -> dict:
+    """
+    Slide the window: drop publisher rows that aged out of it and recount the
+    stories that lost one. Bounded by what expired since the last pass, not by
+    how much coverage the window holds.
+    """
+    from core.models import StoryPublisher
+
     now = timezone.now()
+    with transaction.atomic():
+        expired = StoryPublisher.objects.filter(last_published_at__lt=_window_start())
+        story_ids = set(expired.values_list('story_id', flat=True))
+        removed, _by_model = expired.delete()
+        updated, zeroed = _write_counts(story_ids, now)
+
+    result = {"expired": removed, "updated": updated, "zeroed": zeroed}
+    logger.info("Momentum expiry: %s", result)
+    return result
+
+
+def _rebuild_publishers(story_ids, window_start) -> set:
+    """
+    Replace the StoryPublisher rows of `story_ids` (None: of every story) with
+    what their articles say. Returns the stories that have rows afterwards.
 
+    Rows are upserted and only pairs the articles no longer support are
+    deleted: `record_publishers`, in a concurrent clustering run, may write a
+    pair between the aggregate below and the insert, and a plain insert would
+    then fail on the unique (story, publisher) and roll back the whole pass.
+    """
+    from core.models import Article, Source, StoryPublisher
+
+    articles = Article.objects.filter(
+        story__isnull=False,
+        # published_date, not created_at: created_at is when WE scraped, so on a
+        # fresh database every article looks newly arrived and momentum
+        # collapses into "total outlets".
+        published_date__gte=window_start,
+        source__trust_tier=Source.TrustTier.AUTO_PUBLISH,
+    )
+    existing = StoryPublisher.objects.all()
     if story_ids is not None:
-        candidates = Story.objects.filter(pk__in=list(story_ids))
-        zeroed = 0
-    else:
-        # Anything with an article recent enough to count, plus anything
-        # currently showing momentum (so it can be re-checked and dropped).
-        candidates = Story.objects.filter(
-            Q(articles__published_date__gte=window_start) | Q(momentum_outlets__gt=0)
-        ).distinct()
-
-        # Stories with no article in the window and no chance of one: zero them
-        # in a single UPDATE rather than recomputing each.
-        stale_cutoff = now - timedelta(hours=MOMENTUM_WINDOW_HOURS + REFRESH_MARGIN_HOURS)
-        zeroed = (
-            Story.objects
-            .filter(momentum_outlets__gt=0, last_updated_at__lt=stale_cutoff)
-            .update(momentum_outlets=0, momentum_computed_at=now)
+        articles = articles.filter(story_id__in=story_ids)
+        existing = existing.filter(story_id__in=story_ids)
+
+    rows = [
+        StoryPublisher(story_id=story_id, publisher=publisher, last_published_at=latest)
+        for story_id, publisher, latest in (
+            articles
+            .values('story_id', publisher=_publisher_identity(prefix=''))
+            .annotate(latest=Max('published_date'))
+            .values_list('story_id', 'publisher', 'latest')
         )
+    ]
+    current = {(row.story_id, row.publisher) for row in rows}
+    stale = [
+        pk for pk, story_id, publisher in existing.values_list('pk', 'story_id', 'publisher')
+        if (story_id, publisher) not in current
+    ]
+    for start in range(0, len(stale), 1000):
+        StoryPublisher.objects.filter(pk__in=stale[start:start + 1000]).delete()
+    StoryPublisher.objects.bulk_create(
+        rows,
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=['story', 'publisher'],
+        update_fields=['last_published_at'],
+    )
+    return {row.story_id for row in rows}
 
-    scored = candidates.annotate(
-        _recent=Count(
-            # Falls back to the feed URL when the domain could not be resolved.
-            #
-            # Counting `publisher_domain` directly collapsed every unresolvable
-            # source into ONE publisher, because they all share the empty
-            # string — silently understating corroboration and suppressing
-            # affected stories from this edition. `Source.independence_key`
-            # already had this fallback; the SQL aggregate bypassed it.
-            _publisher_identity(),
-            filter=Q(
-                # published_date, not created_at: created_at is when WE scraped,
-                # so on a fresh database every article looks newly arrived and
-                # momentum collapses into "total outlets".
-                articles__published_date__gte=window_start,
-                articles__source__trust_tier=Source.TrustTier.AUTO_PUBLISH,
-            ),
-            distinct=True,
-        )
-    ).only('id', 'momentum_outlets')
 
-    updated = []
-    for story in scored.iterator(chunk_size=500):
-        if story.momentum_outlets != story._recent:
-            story.momentum_outlets = story._recent
-            story.momentum_computed_at = now
-            updated.append(story)
+def refresh_momentum(story_ids=None) -> dict:
+    """
+    Recompute `momentum_outlets` from articles, rebuilding the StoryPublisher
+    rows the incremental path maintains.
 
-    if updated:
-        Story.objects.bulk_update(
-            updated, ['momentum_outlets', 'momentum_computed_at'], batch_size=500
-        )
+    With `story_ids`, exactly those (used when a merge moves articles between
+    stories). Without, every story — the reconciliation pass.
+    """
+    from core.models import Story
 
-    result = {"updated": len(updated), "zeroed": zeroed}
+    now = timezone.now()
+    with transaction.atomic():
+        story_ids = list(story_ids) if story_ids is not None else None
+        with_publishers = _rebuild_publishers(story_ids, _window_start())
+        if story_ids is None:
+            # Anything with a publisher in the window, plus anything currently
+            # showing momentum (so it can be re-checked and dropped).
+            story_ids = with_publishers | set(
+                Story.objects.filter(momentum_outlets__gt=0).values_list('id', flat=True)
+            )
+        updated, zeroed = _write_counts(story_ids, now)
+
+    result = {"updated": updated, "zeroed": zeroed}
     logger.info("Momentum refresh: %s", result)
     return result
@@ -141,18 +141,87 @@ clustering_duration = _histogram(
     buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
 )
 
+clustering_embed_duration = _histogram(
+    "ultranews_clustering_embed_seconds",
+    "Time to embed one clustering run's pending articles in batch.",
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
 clustering_outcomes = _counter(
     "ultranews_clustering_outcomes_total",
     "Whether an article joined an existing story or created a new one.",
     ("outcome",),  # matched | created | failed
 )
 
+# Stories a partitioned clustering run opened twice for one event and merged.
+# Persistently non-zero means the partition link margin is too tight.
+clustering_partition_merges = _counter(
+    "ultranews_clustering_partition_merges_total",
+    "Duplicate stories merged after a partitioned clustering run.",
+)
+
+# Embedding calls that found the shared embedding server down and loaded the
+# model in-process instead. Each costs that process the full model load once.
+embedding_server_fallbacks = _counter(
+    "ultranews_embedding_server_fallbacks_total",
+    "Embedding calls served in-process because the embedding server failed.",
+)
+
+# Pending articles that skipped embedding because an earlier article was a
+# near-duplicate of them — mostly syndicated wire copy.
+near_duplicates_linked = _counter(
+    "ultranews_near_duplicates_linked_total",
+    "Pending articles linked to a near-duplicate twin before embedding.",
+)
+
 stories_promoted = _counter(
     "ultranews_stories_promoted_total",
     "Stories crossing a corroboration tier.",
     ("tier",),
 )
 
+# ==========================================================================
+# Feed
+# ==========================================================================
+
+feed_snapshot_requests = _counter(
+    "ultranews_feed_snapshot_requests_total",
+    "Pre-rendered edition requests, by how they were answered.",
+    ("result",),  # hit | rendered | not_modified
+)
+
+feed_snapshot_render_duration = _histogram(
+    "ultranews_feed_snapshot_render_seconds",
+    "Time to pre-render every feed edition after a clustering run.",
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+# Response cache misses, by how they were filled: built by this request
+# (leader), served the previous value while another rebuilt (stale), given
+# another request's fresh build (waited), or built anyway after waiting
+# (timed_out). Everything but leader is a query the database did not run.
+cache_fills = _counter(
+    "ultranews_cache_fills_total",
+    "Response cache misses by how they were filled.",
+    ("cache", "outcome"),  # leader | stale | waited | timed_out
+)
+
+cache_fill_wait = _histogram(
+    "ultranews_cache_fill_wait_seconds",
+    "Time a coalesced miss waited for another request's build.",
+    ("cache",),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.0),
+)
+
+# Reads through the two-tier cache (core/cache_tiers.py), by the tier asked and
+# whether it had the key. Every local miss is a Redis read, so the two tiers'
+# hit rates together say how often a request reached Redis at all.
+cache_tier_reads = _counter(
+    "ultranews_cache_tier_reads_total",
+    "Two-tier cache reads by tier and result.",
+    ("tier", "result"),  # local | redis x hit | miss
+)
+
 # ==========================================================================
 # AI
 # ==========================================================================
@@ -0,0 +1,216 @@
+"""
+Partitioned clustering — one run's pending articles split into groups that can
+be clustered at the same time.
+
+Clustering is sequential for a reason: each assignment can move a centroid the
+next article is scored against, and two concurrent runs can each open a story
+for the same event. But at a breaking-news peak most of a batch is unrelated to
+most of the rest of it. An article about a port strike and one about a transfer
+window cannot end up in the same story, or in each other's candidate stories, so
+the order in which they are processed does not matter.
+
+`partition_pending` finds those independent groups. Two articles are linked when
+they are close enough that one could join a story the other creates, and an
+article is linked to every existing story it could join; the connected
+components of that graph are the partitions. The link threshold sits a margin
+below the match threshold so that centroid drift inside a partition does not
+carry a story into range of an article in another.
+
+The margin narrows the gap but cannot close it: a run of articles can walk a
+centroid arbitrarily far. `merge_partition_duplicates` is the backstop — after
+the partitions finish, any new story that matches a story from a different
+partition is folded into it, so the run never leaves two stories for one event
+that sequential clustering would have kept as one.
+
+Everything is ordered by the input (published_date) order and by article id,
+never by completion order, so the same queue partitions and merges the same way
+on every run.
+"""
+import logging
+
+from django.db.models import Min
+
+from core.clustering import (
+    EMBEDDING_MATCH_THRESHOLD,
+    HAS_NUMPY,
+    MATCH_WINDOW,
+    CentroidIndex,
+    merge_stories,
+    np,
+)
+from core.models import Article, Story
+
+logger = logging.getLogger(__name__)
+
+# How far below EMBEDDING_MATCH_THRESHOLD two items still count as linked.
+# A running-mean centroid moves by at most 1/(n+1) of the distance to each new
+# article, so at 0.10 it takes a run of several same-partition articles all
+# pulling the same way to carry a story across — rare, and caught by the merge
+# pass when it happens. Wider margins glue unrelated stories of the same topic
+# into one partition (different events of the same topic score up to ~0.73)
+# and the run loses its parallelism.
+PARTITION_LINK_MARGIN = 0.10
+
+
+class _DisjointSet:
+    def __init__(self, size: int):
+        self._parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        root = item
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[item] != root:
+            self._parent[item], item = root, self._parent[item]
+        return root
+
+    def union(self, a: int, b: int) -> None:
+        a, b = self.find(a), self.find(b)
+        if a != b:
+            # Lower index wins, so roots do not depend on union order.
+            self._parent[max(a, b)] = min(a, b)
+
+
+def partition_pending(
+    articles: list[Article], index: CentroidIndex, buckets: int
+) -> list[tuple[list[Article], CentroidIndex]]:
+    """
+    Split `articles` into at most `buckets` groups no match can cross.
+
+    Returns (articles, index) pairs. Each index is a private copy holding only
+    the stories that group's articles can reach, so partitions can upsert
+    concurrently without sharing a matrix. Components are packed largest first
+    into the emptiest bucket; within a bucket articles keep their input order.
+    """
+    count = len(articles)
+    link = EMBEDDING_MATCH_THRESHOLD - PARTITION_LINK_MARGIN
+    window = MATCH_WINDOW.total_seconds()
+    components = _DisjointSet(count)
+
+    embedded = [i for i, a in enumerate(articles) if a.embedding is not None]
+    # Without a vector an article cannot be placed, so all such articles share
+    # one partition — they are clustered exactly as a sequential run would.
+    unplaced = [i for i, a in enumerate(articles) if a.embedding is None]
+    for i in unplaced[1:]:
+        components.union(unplaced[0], i)
+
+    if embedded:
+        matrix = np.asarray([articles[i].embedding for i in embedded], dtype=float)
+        norms = np.linalg.norm(matrix, axis=1)
+        norms[norms == 0] = 1.0
+        matrix = matrix / norms[:, None]
+        epochs = np.asarray([articles[i].published_date.timestamp() for i in embedded])
+
+        close = (matrix @ matrix.T >= link) & (
+            np.abs(epochs[:, None] - epochs[None, :]) <= window
+        )
+        for a, b in np.argwhere(np.triu(close, k=1)):
+            components.union(embedded[a], embedded[b])
+
+    # Article-to-story links. Two articles that could join the same existing
+    # story must be clustered in the same partition.
+    reachable: dict[int, set[int]] = {}
+    owner: dict[int, int] = {}
+    for i in embedded:
+        article = articles[i]
+        stories = reachable.setdefault(i, set())
+        for story_id, first_seen_at, distance in index.candidates(
+            article.embedding, article.published_date
+        ):
+            if 1.0 - distance < link:
+                break
+            if abs(article.published_date - first_seen_at) > MATCH_WINDOW:
+                continue
+            stories.add(story_id)
+            if story_id in owner:
+                components.union(owner[story_id], i)
+            else:
+                owner[story_id] = i
+
+    groups: dict[int, list[int]] = {}
+    for i in range(count):
+        groups.setdefault(components.find(i), []).append(i)
+
+    sizes = [0] * max(1, buckets)
+    members: list[list[int]] = [[] for _ in sizes]
+    stories: list[set[int]] = [set() for _ in sizes]
+    for group in sorted(groups.values(), key=lambda g: (-len(g), g[0])):
+        target = min(range(len(sizes)), key=lambda b: (sizes[b], b))
+        sizes[target] += len(group)
+        members[target].extend(group)
+        for i in group:
+            stories[target] |= reachable.get(i, set())
+
+    return [
+        ([articles[i] for i in sorted(group)], index.subset(story_ids))
+        for group, story_ids in zip(members, stories, strict=True)
+        if group
+    ]
+
+
+def merge_partition_duplicates(partition_of: dict[int, int], created: set[int]) -> int:
+    """
+    Fold each story created this run into its match from another partition.
+
+    `partition_of` maps every story the run touched to the partition that
+    touched it; `created` is the subset the run opened. Stories from the same
+    partition are never merged — sequential clustering would have kept them
+    apart too. Stories are visited oldest first by (first_seen_at, founding
+    article id), and each is merged into the best-scoring older story from a
+    different partition, so the older story always survives. Returns the number
+    of stories merged away.
+    """
+    if not created or not HAS_NUMPY:
+        return 0
+
+    ids = sorted(partition_of)
+    stories = {s.pk: s for s in Story.objects.filter(pk__in=ids, embedding__isnull=False)}
+    founders = dict(
+        Article.objects.filter(story_id__in=list(stories))
+        .values('story_id').annotate(first=Min('id')).order_by()
+        .values_list('story_id', 'first')
+    )
+    order = sorted(stories, key=lambda pk: (stories[pk].first_seen_at, founders.get(pk, pk)))
+    if len(order) < 2:
+        return 0
+
+    matrix = np.asarray([stories[pk].embedding for pk in order], dtype=float)
+    norms = np.linalg.norm(matrix, axis=1)
+    norms[norms == 0] = 1.0
+    matrix = matrix / norms[:, None]
+
+    merged = 0
+    alive = [True] * len(order)
+    for position, pk in enumerate(order):
+        if pk not in created or not position:
+            continue
+        story = stories[pk]
+        similarities = matrix[:position] @ matrix[position]
+        best, best_score = None, 0.0
+        for earlier in range(position):
+            target = stories[order[earlier]]
+            if (
+                not alive[earlier]
+                or partition_of[target.pk] == partition_of[pk]
+                or abs(story.first_seen_at - target.first_seen_at) > MATCH_WINDOW
+            ):
+                continue
+            score = float(similarities[earlier])
+            if score >= EMBEDDING_MATCH_THRESHOLD and score > best_score:
+                best, best_score = earlier, score
+        if best is None:
+            continue
+
+        keep = stories[order[best]]
+        logger.info(
+            "Merging partition duplicate story=%s into story=%s (score=%.3f)",
+            story.slug, keep.slug, best_score,
+        )
+        merge_stories(keep, story)
+        alive[position] = False
+        merged += 1
+        # The survivor's centroid moved; later stories are scored against it.
+        vector = np.asarray(keep.embedding, dtype=float)
+        matrix[best] = vector / (np.linalg.norm(vector) or 1.0)
+
+    return merged
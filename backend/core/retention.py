@@ -120,6 +120,21 @@ def delete_uncorroborated_stories(dry_run: bool = False) -> int:
     return count
 
 
+def trim_url_index(dry_run: bool = False) -> int:
+    """
+    Age out the ingest dedup index (core/dedup.py).
+
+    It is not archive data — only URLs a feed listed recently — so it follows
+    its own horizon rather than the article ones above. Dry runs report zero:
+    counting would cost a scan of every source's set for a number nobody acts
+    on.
+    """
+    if dry_run:
+        return 0
+    from core.dedup import trim_url_indexes
+    return trim_url_indexes()
+
+
 def run_retention(dry_run: bool = False) -> dict:
     """Apply every retention rule. Returns what was (or would be) affected."""
     if not getattr(settings, "RETENTION_ENABLED", True):
@@ -132,6 +147,7 @@ def run_retention(dry_run: bool = False) -> dict:
         "raw_documents_purged": purge_raw_documents(dry_run),
         "article_payloads_cleared": clear_stale_article_payloads(dry_run),
         "uncorroborated_stories_deleted": delete_uncorroborated_stories(dry_run),
+        "url_index_entries_trimmed": trim_url_index(dry_run),
     }
     logger.info("Retention pass: %s", result)
     return result
@@ -0,0 +1,132 @@
+"""
+When each source should next be fetched.
+
+Every active source used to be fetched on one fixed cadence,
+INGEST_INTERVAL_SECONDS. That suits nobody: a wire service publishing every few
+minutes waits up to the full interval for each item, and a think-tank feed that
+posts weekly is polled ~670 times between posts — nearly all of them 304s.
+
+Each source now carries its own interval, learned from two signals:
+
+  - **Publish rate.** How many of its articles were published in the last
+    RATE_WINDOW, from `Article.published_date`. The interval is half the mean
+    gap between items, so a new item waits on average a quarter of a gap.
+  - **Empty-fetch rate.** An exponentially weighted rate of fetches that
+    brought nothing new — a 304, or a 200 whose items were all stored already
+    (plenty of publishers ignore conditional GET). It stretches the interval up
+    to twice the publish-rate estimate, catching feeds whose dates are wrong or
+    that repost old items.
+
+The interval is clamped to [MIN_FETCH_INTERVAL, MAX_FETCH_INTERVAL] and stored
+with the next due time on the Source. The beat task then ticks often and
+dispatches only the sources that are due.
+
+A failed fetch is retried on its own backoff — doubling from
+MIN_FETCH_INTERVAL per consecutive failure, up to MAX_FAILURE_BACKOFF, and
+never later than the learned interval — which it leaves unchanged. A transient
+error on a quiet feed is retried within minutes rather than after up to six
+hours, and the circuit breaker, which decides when a failing source stops being
+fetched, trips within hours rather than days.
+"""
+import random
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+# Bounds on a learned interval. The floor protects publishers from a feed whose
+# dates make it look busier than it is; the ceiling bounds how stale a quiet
+# source can get before its next post is noticed.
+MIN_FETCH_INTERVAL = timedelta(minutes=5)
+MAX_FETCH_INTERVAL = timedelta(hours=6)
+
+# How far back the publish rate is measured. A week covers weekday/weekend
+# rhythms without remembering a source's behaviour from months ago.
+RATE_WINDOW = timedelta(days=7)
+
+# Weight of the latest fetch in the empty-fetch rate. ~5 fetches of memory:
+# quick to notice a feed going quiet, slow enough not to flap on one 304.
+EMPTY_FETCH_WEIGHT = 0.2
+
+# Ceiling on the retry delay after a failed fetch. Well below
+# MAX_FETCH_INTERVAL, so Source.FAILURE_THRESHOLD failures span hours.
+MAX_FAILURE_BACKOFF = timedelta(hours=1)
+
+# A dispatched source is pushed this far out before its fetch runs, so the
+# next tick does not dispatch it again while it is still in flight. Longer than
+# the async sweep's hard time limit; the fetch outcome replaces it.
+CLAIM_LEASE = timedelta(minutes=12)
+
+# Spread of next-due times, so sources learned to the same interval do not all
+# fall due on the same tick.
+JITTER = 0.1
+
+
+def learned_interval(published_in_window: int, empty_fetch_rate: float) -> timedelta:
+    """The poll interval for a source with this publish count and empty-fetch rate."""
+    if published_in_window <= 0:
+        return MAX_FETCH_INTERVAL
+    interval = (RATE_WINDOW / published_in_window) / 2 * (1 + empty_fetch_rate)
+    return max(MIN_FETCH_INTERVAL, min(MAX_FETCH_INTERVAL, interval))
+
+
+def failure_backoff(consecutive_failures: int, learned: timedelta) -> timedelta:
+    """The retry delay after the `consecutive_failures`th failed fetch in a row."""
+    backoff = MIN_FETCH_INTERVAL * 2 ** min(max(consecutive_failures - 1, 0), 10)
+    return min(learned, backoff, MAX_FAILURE_BACKOFF)
+
+
+def schedule_next(source, new_articles: int | None) -> list[str]:
+    """
+    Set `source`'s interval and next due time after a fetch. Returns the fields
+    changed, for the caller's save(update_fields=...).
+
+    `new_articles` is None for a failed fetch, which keeps the learned interval
+    and is retried after `failure_backoff` instead; `source.consecutive_failures`
+    must already count it.
+    """
+    from core.models import Article
+
+    now = timezone.now()
+    if new_articles is not None:
+        empty = 1.0 if new_articles == 0 else 0.0
+        source.empty_fetch_rate = (
+            (1 - EMPTY_FETCH_WEIGHT) * source.empty_fetch_rate + EMPTY_FETCH_WEIGHT * empty
+        )
+        published = Article.objects.filter(
+            source=source, published_date__gte=now - RATE_WINDOW
+        ).count()
+        interval = learned_interval(published, source.empty_fetch_rate)
+        source.fetch_interval_minutes = max(1, round(interval.total_seconds() / 60))
+
+    interval = timedelta(minutes=source.fetch_interval_minutes)
+    if new_articles is None:
+        interval = failure_backoff(source.consecutive_failures, interval)
+    source.next_fetch_at = now + interval * random.uniform(1 - JITTER, 1 + JITTER)  # noqa: S311 - load spreading, not a secret
+    return ['empty_fetch_rate', 'fetch_interval_minutes', 'next_fetch_at']
+
+
+def claim_due_sources(now=None) -> list[int]:
+    """
+    Ids of the active sources due for a fetch, leased so no overlapping tick
+    dispatches them again. With ADAPTIVE_FETCH_SCHEDULING off, every active source.
+    """
+    from core.models import Source
+
+    now = now or timezone.now()
+    sources = Source.objects.filter(is_active=True)
+    if not getattr(settings, 'ADAPTIVE_FETCH_SCHEDULING', True):
+        return list(sources.order_by('id').values_list('id', flat=True))
+
+    with transaction.atomic():
+        due = list(
+            sources.filter(Q(next_fetch_at__isnull=True) | Q(next_fetch_at__lte=now))
+            .order_by('next_fetch_at', 'id')
+            .select_for_update(skip_locked=True)
+            .values_list('id', flat=True)
+        )
+        if due:
+            Source.objects.filter(id__in=due).update(next_fetch_at=now + CLAIM_LEASE)
+    return due
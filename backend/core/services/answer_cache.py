@@ -15,15 +15,50 @@ Two conditions must both hold for a hit:
 
   1. The stored query is semantically near the new one.
   2. The corpus hasn't moved underneath it. A cached answer about a developing
-     story is wrong the moment new reporting lands, so entries are invalidated by
-     a generation counter that ingestion bumps — a stale answer on a news product
-     is worse than a slow one.
+     story is wrong the moment new reporting lands — a stale answer on a news
+     product is worse than a slow one. Each entry records the generation of
+     every scope it was grounded on (core/generations.py): the stories it cited
+     and their categories. Clustering advances those only when it touches them,
+     so an answer survives ingestion that could not have changed it.
+
+Storage is shaped for the first test, which runs on every /ask, and for
+writes that never contend:
+
+  ask:cache:entry:{id}      One entry's query vector, L2-normalised float32
+                            bytes, with what a lookup filters on (stored_at,
+                            scopes).
+  ask:cache:answer:{id}     The answer itself, fetched only on a hit.
+  ask:cache:entries         Sorted set of entry ids by time stored: the index.
+  ask:cache:usage           Sorted set of entry ids by hits, then last hit —
+                            eviction order.
+  ask:cache:version         Advanced by every change to the index.
+
+A write sets its own two keys and admits its id with one Lua script, which also
+drops expired ids and evicts the coldest past MAX_CACHED_ANSWERS. Nothing is
+read back and rewritten, so its cost does not grow with the cache, and two
+answers completing together both land. (The index used to be one pickled
+value, read, appended to and written back whole by every /ask: concurrent
+completions overwrote each other's entries.)
+
+Each process keeps the entries' vectors as one contiguous matrix, synced when
+the version moves by fetching only the ids it has not seen. A lookup is then
+one version read, one matrix-vector product over every entry (~0.5ms at
+MAX_CACHED_ANSWERS) and, on a hit, one answer read.
+
+Without django-redis (the locmem deployment, tests) the cache is per-process
+anyway: the index is a dict updated under a lock, and eviction is oldest-first.
 """
 import logging
+import threading
 import time
+import uuid
 
 from django.core.cache import cache
 
+from core.lazy import LazyModule
+
+np = LazyModule("numpy")
+
 logger = logging.getLogger(__name__)
 
 # Cosine similarity above which two questions are treated as the same question.
@@ -35,102 +70,254 @@ SEMANTIC_HIT_THRESHOLD = 0.95
 # Entries live at most this long even if the corpus is quiet.
 ANSWER_TTL_SECONDS = 30 * 60
 
-# How many recent (embedding, answer) pairs to scan. Small on purpose — this is a
-# linear scan in the request path, and the peak of the query distribution is
-# narrow enough that a long tail adds latency without adding hits.
-MAX_CACHED_ANSWERS = 60
+# Ceiling on stored answers. Not a scan length any more — lookup cost barely
+# moves with it — but the index is re-read by every API process after each
+# write, so it is bounded rather than left to grow with the TTL.
+MAX_CACHED_ANSWERS = 6000
+
+_INDEX_KEY = "ask:cache:entries"
+_USAGE_KEY = "ask:cache:usage"
+_VERSION_KEY = "ask:cache:version"
+
+# A usage score is hits * _HITS + time of last hit (whole seconds), so one
+# sorted set orders by hits and then recency. Exact in a double for any hit
+# count an entry can reach within its TTL.
+_HITS = 10**10
+
+# Admits ARGV[1], stored at ARGV[2]; returns the ids it removed.
+#   KEYS: index, usage, version    ARGV: id, now, ttl, max entries
+_ADMIT = """
+local id, now = ARGV[1], tonumber(ARGV[2])
+local removed = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', now - tonumber(ARGV[3]))
+local function drop(member)
+  redis.call('ZREM', KEYS[1], member)
+  redis.call('ZREM', KEYS[2], member)
+end
+-- Expired ids leave first, so they count toward making room rather than
+-- costing live entries on top of themselves.
+for _, member in ipairs(removed) do drop(member) end
+redis.call('ZADD', KEYS[1], now, id)
+local over = redis.call('ZCARD', KEYS[1]) - tonumber(ARGV[4])
+if over > 0 then
+  -- Scored before the new id joins, so it is never its own victim.
+  for _, victim in ipairs(redis.call('ZRANGE', KEYS[2], 0, over - 1)) do
+    drop(victim)
+    table.insert(removed, victim)
+  end
+end
+redis.call('ZADD', KEYS[2], math.floor(now), id)
+redis.call('INCR', KEYS[3])
+return removed
+"""
+
+# Counts a hit on ARGV[1] at ARGV[2], if it is still admitted.
+#   KEYS: usage    ARGV: id, now
+_HIT = """
+local score = redis.call('ZSCORE', KEYS[1], ARGV[1])
+if score then
+  local hits = math.floor(tonumber(score) / %d) + 1
+  redis.call('ZADD', KEYS[1], hits * %d + math.floor(tonumber(ARGV[2])), ARGV[1])
+end
+""" % (_HITS, _HITS)
 
-_INDEX_KEY = "ask:cache:index"
-_GENERATION_KEY = "ask:cache:generation"
 
+def _entry_key(entry_id: str) -> str:
+    return f"ask:cache:entry:{entry_id}"
 
-def current_generation() -> int:
-    """Corpus generation. Bumped whenever new reporting is clustered."""
+
+def _answer_key(entry_id: str) -> str:
+    return f"ask:cache:answer:{entry_id}"
+
+
+# This process's copy of the index: (version, matrix, rows), where rows[i] is
+# the metadata of matrix[i] and carries its id.
+_local_index = (None, None, [])
+_local_lock = threading.Lock()
+
+
+def _client():
     try:
-        return int(cache.get(_GENERATION_KEY) or 0)
-    except (TypeError, ValueError):
-        return 0
+        return cache.client.get_client(write=True)
+    except AttributeError:
+        # locmem has no raw client.
+        return None
 
 
-def invalidate_all() -> None:
-    """
-    Retire every cached answer by advancing the generation.
+def _normalise(vector):
+    v = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(v))
+    return v / norm if norm else v
 
-    Called when clustering lands new articles. Advancing a counter is O(1) and
-    leaves existing entries to expire on their own, rather than scanning and
-    deleting keys on the ingest path.
-    """
+
+def _admitted_ids(client) -> list[str]:
+    if client is None:
+        return list(cache.get(_INDEX_KEY) or {})
+    return [member.decode() for member in client.zrange(_INDEX_KEY, 0, -1)]
+
+
+def _current_index():
+    """(matrix, rows) for the admitted entries, fetching only ones not yet held."""
+    global _local_index
+
+    client = _client()
+    version = client.get(_VERSION_KEY) if client is not None else cache.get(_VERSION_KEY)
+    if version is None:
+        return None, []
+    local_version, matrix, rows = _local_index
+    if version == local_version:
+        return matrix, rows
+
+    # Read after the version, so at worst this holds a newer index than it
+    # records, and the next lookup syncs again.
+    ids = _admitted_ids(client)
+    held = {row["id"]: i for i, row in enumerate(rows)}
+    missing = [entry_id for entry_id in ids if entry_id not in held]
+    fetched = cache.get_many([_entry_key(entry_id) for entry_id in missing])
+
+    keep, vectors, new_rows = [], [], []
+    dim = matrix.shape[1] if matrix is not None else None
+    for entry_id in ids:
+        if entry_id in held:
+            keep.append(held[entry_id])
+            continue
+        entry = fetched.get(_entry_key(entry_id))
+        if entry is None:
+            continue  # Gone with its TTL before the index dropped it.
+        dim = dim or entry["dim"]
+        if entry["dim"] != dim:
+            continue  # Embedded by another model.
+        vectors.append(np.frombuffer(entry["vector"], dtype=np.float32))
+        new_rows.append({"id": entry_id, "stored_at": entry["stored_at"],
+                         "scopes": entry["scopes"]})
+
+    parts = ([matrix[keep]] if keep else []) + ([np.vstack(vectors)] if vectors else [])
+    matrix = np.ascontiguousarray(np.vstack(parts)) if parts else None
+    rows = [rows[i] for i in keep] + new_rows
+    with _local_lock:
+        _local_index = (version, matrix, rows)
+    return matrix, rows
+
+
+def _record_hit(entry_id: str) -> None:
+    client = _client()
+    if client is None:
+        return
     try:
-        cache.incr(_GENERATION_KEY)
-    except ValueError:
-        cache.set(_GENERATION_KEY, 1, timeout=None)
+        client.register_script(_HIT)(keys=[_USAGE_KEY], args=[entry_id, int(time.time())])
+    except Exception as e:
+        # Only eviction order depends on this.
+        logger.debug("Could not record answer cache hit: %s", e)
 
 
-def _cosine(a: list[float], b: list[float]) -> float:
-    import numpy as np
+def _admit(entry_id: str, now: float) -> list[str]:
+    """Add `entry_id` to the index; returns the ids expired or evicted to make room."""
+    client = _client()
+    if client is not None:
+        removed = client.register_script(_ADMIT)(
+            keys=[_INDEX_KEY, _USAGE_KEY, _VERSION_KEY],
+            args=[entry_id, now, ANSWER_TTL_SECONDS, MAX_CACHED_ANSWERS],
+        )
+        return [member.decode() for member in removed]
 
-    va, vb = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
-    denom = float(np.linalg.norm(va) * np.linalg.norm(vb))
-    return float(va @ vb / denom) if denom else 0.0
+    # locmem is this process's alone, so the lock makes the update atomic.
+    with _local_lock:
+        index = cache.get(_INDEX_KEY) or {}
+        removed = [i for i, stored_at in index.items() if now - stored_at > ANSWER_TTL_SECONDS]
+        for expired in removed:
+            del index[expired]
+        index[entry_id] = now
+        while len(index) > MAX_CACHED_ANSWERS:
+            oldest = next(iter(index))
+            del index[oldest]
+            removed.append(oldest)
+        cache.set(_INDEX_KEY, index, timeout=None)
+        cache.set(_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+    return removed
 
 
 def lookup(query_vector: list[float]) -> dict | None:
     """Return a cached answer for a semantically equivalent question, or None."""
+    from core.generations import tokens
+    from core.observability import answer_cache_events
+
     try:
-        index = cache.get(_INDEX_KEY) or []
+        matrix, rows = _current_index()
     except Exception as e:
         logger.debug("Answer cache unavailable: %s", e)
         return None
 
-    generation = current_generation()
-    now = time.time()
-    best, best_similarity = None, 0.0
-
-    for entry in index:
-        if entry.get("generation") != generation:
-            continue
-        if now - entry.get("stored_at", 0) > ANSWER_TTL_SECONDS:
-            continue
-        similarity = _cosine(query_vector, entry["vector"])
-        if similarity >= SEMANTIC_HIT_THRESHOLD and similarity > best_similarity:
-            best, best_similarity = entry, similarity
-
-    from core.observability import answer_cache_events
+    query = _normalise(query_vector)
+    best = None
+    if rows and query.shape[0] == matrix.shape[1]:
+        similarities = matrix @ query
+        near = np.flatnonzero(similarities >= SEMANTIC_HIT_THRESHOLD)
+        now = time.time()
+        # Generations are checked only for the near matches, best first: the
+        # first still fresh and whose scopes have not moved is the answer.
+        for i in near[np.argsort(-similarities[near])]:
+            row = rows[i]
+            if now - row["stored_at"] > ANSWER_TTL_SECONDS or tokens(row["scopes"]) != row["scopes"]:
+                continue
+            cached = cache.get(_answer_key(row["id"]))
+            if cached is not None:
+                best, best_similarity = (row, cached), float(similarities[i])
+                break
 
     if best is None:
         answer_cache_events.labels("miss").inc()
         return None
 
+    row, cached = best
+    _record_hit(row["id"])
     answer_cache_events.labels("hit").inc()
-    logger.info("Answer cache hit (similarity=%.3f) for %r", best_similarity, best["query"][:60])
+    logger.info("Answer cache hit (similarity=%.3f) for %r", best_similarity, cached["query"][:60])
     return {
-        "answer": best["answer"],
-        "context_sources": best["context_sources"],
-        "synthesis_type": best["synthesis_type"],
+        "answer": cached["answer"],
+        "context_sources": cached["context_sources"],
+        "synthesis_type": cached["synthesis_type"],
         "cached": True,
         "cached_similarity": round(best_similarity, 4),
     }
 
 
 def store(query: str, query_vector: list[float], answer: str,
-          context_sources: list[str], synthesis_type: str) -> None:
-    """Record an answer for reuse by later paraphrases of the same question."""
+          context_sources: list[str], synthesis_type: str,
+          scopes: dict[str, str] | None = None) -> None:
+    """
+    Record an answer for reuse by later paraphrases of the same question.
+
+    `scopes` maps each generation scope the answer was grounded on to its token
+    when the context was retrieved (`generations.tokens`); the answer is served
+    only while they all still hold.
+    """
     if not answer.strip():
         return
 
-    entry = {
-        "query": query[:200],
-        "vector": [float(x) for x in query_vector],
-        "answer": answer,
-        "context_sources": context_sources,
-        "synthesis_type": synthesis_type,
-        "generation": current_generation(),
-        "stored_at": time.time(),
-    }
+    entry_id = uuid.uuid4().hex
+    now = time.time()
+    vector = _normalise(query_vector)
 
     try:
-        index = cache.get(_INDEX_KEY) or []
-        index.insert(0, entry)
-        cache.set(_INDEX_KEY, index[:MAX_CACHED_ANSWERS], timeout=ANSWER_TTL_SECONDS * 2)
+        # The entry's own keys first, so an admitted id always has them.
+        cache.set_many({
+            _entry_key(entry_id): {
+                "vector": vector.tobytes(),
+                "dim": vector.shape[0],
+                "stored_at": now,
+                "scopes": dict(scopes or {}),
+            },
+            _answer_key(entry_id): {
+                "query": query[:200],
+                "answer": answer,
+                "context_sources": context_sources,
+                "synthesis_type": synthesis_type,
+            },
+        }, timeout=ANSWER_TTL_SECONDS)
+
+        removed = _admit(entry_id, now)
+        if removed:
+            cache.delete_many(
+                [_entry_key(i) for i in removed] + [_answer_key(i) for i in removed]
+            )
     except Exception as e:
         logger.debug("Could not store answer in cache: %s", e)
@@ -0,0 +1,360 @@
+"""
+Asynchronous feed fetching — one event loop, one connection pool, every feed.
+
+The synchronous scraper opens a fresh connection for each feed (`httpx.get`) and
+a fresh pooled client for each source's deep fetches, so every run re-does the
+TCP and TLS handshakes — and the DNS lookups — for hosts it talked to seconds
+earlier. Fanned out as one Celery task per source, that is also one worker slot
+per feed spent almost entirely waiting on the network.
+
+Here a single `httpx.AsyncClient` is shared by the whole run:
+
+  - **Keep-alive and HTTP/2.** Many feeds share a host (a publisher's section
+    feeds, the article pages behind them), so connections are reused and, where
+    the server speaks HTTP/2, requests to one host are multiplexed on one
+    connection. HTTP/2 needs the optional `h2` package; without it the client
+    speaks HTTP/1.1 with keep-alive.
+  - **A per-host limit.** Concurrency is bounded per host as well as overall,
+    so a run fetching hundreds of feeds is still only ever a handful of
+    simultaneous requests to any one publisher.
+  - **A DNS cache.** Fanning out overwhelmed the container's resolver before
+    (see RSSScraper._parse_feed); resolving each host once per TTL removes the
+    stampede rather than retrying through it.
+
+Parsing, enrichment and every error outcome are RSSScraper's own, so a feed
+behaves identically whichever path fetched it.
+"""
+import asyncio
+import logging
+import random
+import socket
+import ssl
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import certifi
+import httpcore
+import httpx
+from asgiref.sync import sync_to_async
+
+from core.services.scraper import (
+    ARTICLE_TIMEOUT_SECONDS,
+    DEEP_FETCH_CONCURRENCY,
+    FEED_FETCH_ATTEMPTS,
+    FEED_RETRY_BASE_DELAY,
+    FEED_TIMEOUT_SECONDS,
+    MAX_ARTICLE_BYTES,
+    TRANSIENT_ERRORS,
+    USER_AGENT,
+    FeedFetchError,
+    FeedResult,
+    RSSScraper,
+)
+
+try:
+    import h2  # noqa: F401 - presence check; httpx imports it itself
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Simultaneous requests to one host. Polite enough for a publisher's CDN, and
+# with HTTP/2 these share a single connection anyway.
+PER_HOST_CONCURRENCY = 4
+
+# Connections held open across the whole run. Bounded so a run over hundreds of
+# feeds cannot exhaust file descriptors.
+MAX_CONNECTIONS = 100
+KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+# How long a resolved address is reused. Feed hosts do not move between runs,
+# and a run is over in a few minutes.
+DNS_CACHE_TTL_SECONDS = 300.0
+
+
+class DNSCache:
+    """Resolved addresses per (host, port), reused for DNS_CACHE_TTL_SECONDS."""
+
+    def __init__(self, ttl: float = DNS_CACHE_TTL_SECONDS):
+        self._ttl = ttl
+        self._entries: dict[tuple[str, int], tuple[float, list[str]]] = {}
+        self._pending: dict[tuple[str, int], asyncio.Future] = {}
+
+    async def resolve(self, host: str, port: int) -> list[str]:
+        key = (host, port)
+        cached = self._entries.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        # Concurrent requests for one host share the lookup in flight.
+        if key in self._pending:
+            return await asyncio.shield(self._pending[key])
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                host, port, type=socket.SOCK_STREAM
+            )
+            addresses = list(dict.fromkeys(info[4][0] for info in infos))
+            self._entries[key] = (time.monotonic() + self._ttl, addresses)
+            future.set_result(addresses)
+            return addresses
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieved here so a lookup nobody else awaited does not warn.
+            future.exception()
+            raise
+        finally:
+            del self._pending[key]
+
+
+class _CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """httpcore's default backend, connecting to cached addresses."""
+
+    def __init__(self, dns: DNSCache):
+        self._dns = dns
+        self._backend = httpcore.AnyIOBackend()
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        try:
+            addresses = await self._dns.resolve(host, port)
+        except OSError as e:
+            # Surfaces as httpx.ConnectError, which the feed fetch retries as
+            # transient — the same path an uncached resolver failure takes.
+            raise httpcore.ConnectError(str(e)) from e
+
+        last_error: Exception | None = None
+        for address in addresses:
+            try:
+                # TLS still verifies against the request's hostname: httpcore
+                # takes server_hostname from the origin, not from this address.
+                return await self._backend.connect_tcp(
+                    address, port, timeout=timeout,
+                    local_address=local_address, socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                last_error = e
+        raise last_error or httpcore.ConnectError(f"No addresses for {host}")
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+def _httpx_error(exc: httpcore.TransportError) -> type[httpx.TransportError]:
+    """httpx's counterpart of an httpcore error: the two share class names."""
+    for cls in type(exc).__mro__:
+        mapped = getattr(httpx, cls.__name__, None)
+        if isinstance(mapped, type) and issubclass(mapped, httpx.TransportError):
+            return mapped
+    return httpx.TransportError
+
+
+class _ResponseStream(httpx.AsyncByteStream):
+    def __init__(self, stream, request: httpx.Request):
+        self._stream = stream
+        self._request = request
+
+    async def __aiter__(self):
+        try:
+            async for chunk in self._stream:
+                yield chunk
+        except httpcore.TransportError as e:
+            raise _httpx_error(e)(str(e), request=self._request) from e
+
+    async def aclose(self) -> None:
+        if hasattr(self._stream, "aclose"):
+            await self._stream.aclose()
+
+
+class _PoolTransport(httpx.AsyncBaseTransport):
+    """
+    An httpcore pool as an httpx transport.
+
+    httpx's own transport does not take a network backend, so the pool is
+    built here, through httpcore's public constructor, with the caching one.
+    Errors are raised as httpx's, which is what the fetch paths handle.
+    """
+
+    def __init__(self, pool: httpcore.AsyncConnectionPool):
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        try:
+            response = await self._pool.handle_async_request(core_request)
+        except httpcore.TransportError as e:
+            raise _httpx_error(e)(str(e), request=request) from e
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_ResponseStream(response.stream, request),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+def build_client(dns: Optional[DNSCache] = None) -> httpx.AsyncClient:
+    """The one client a fetch run shares across every feed and article page."""
+    pool = httpcore.AsyncConnectionPool(
+        ssl_context=ssl.create_default_context(cafile=certifi.where()),
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+        http1=True,
+        http2=HTTP2_AVAILABLE,
+        network_backend=_CachingNetworkBackend(dns or DNSCache()),
+    )
+    return httpx.AsyncClient(
+        transport=_PoolTransport(pool),
+        headers={"User-Agent": USER_AGENT},
+        follow_redirects=True,
+    )
+
+
+class HostLimiter:
+    """A semaphore per host, so no publisher sees more than `limit` requests at once."""
+
+    def __init__(self, limit: int = PER_HOST_CONCURRENCY):
+        self._limit = limit
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def __call__(self, url: str) -> asyncio.Semaphore:
+        host = (urlsplit(url).hostname or "").lower()
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self._limit)
+        return semaphore
+
+
+class AsyncRSSScraper(RSSScraper):
+    """RSSScraper's two phases over a shared async client."""
+
+    def __init__(self, client: httpx.AsyncClient, hosts: HostLimiter):
+        from core.services.extraction import backlog_limit
+
+        self._client = client
+        self._hosts = hosts
+        self._extracting = asyncio.Semaphore(backlog_limit())
+
+    async def fetch_articles(
+        self,
+        url: str,
+        skip_urls: Optional[set] = None,
+        etag: str = "",
+        last_modified: str = "",
+    ) -> FeedResult:
+        entries, new_etag, new_last_modified = await self._parse_feed(url, etag, last_modified)
+
+        if callable(skip_urls):
+            # The lookup reads the database, which must stay off the loop.
+            skip_urls = await sync_to_async(skip_urls)([e['url'] for e in entries if e['url']])
+
+        pending, skipped = self._select_pending(url, entries, skip_urls)
+        if pending:
+            await self._enrich_all(pending)
+
+        return self._result(url, entries, pending, skipped, new_etag, new_last_modified)
+
+    async def _parse_feed(self, url: str, etag: str = "", last_modified: str = ""):
+        """RSSScraper._parse_feed's retry policy, without blocking the loop."""
+        headers = self._feed_headers(etag, last_modified)
+
+        last_exception: Exception | None = None
+        for attempt in range(FEED_FETCH_ATTEMPTS):
+            try:
+                async with self._hosts(url):
+                    response = await self._client.get(
+                        url, headers=headers, timeout=FEED_TIMEOUT_SECONDS
+                    )
+                break
+            except TRANSIENT_ERRORS as e:
+                last_exception = e
+                if attempt < FEED_FETCH_ATTEMPTS - 1:
+                    await asyncio.sleep(
+                        FEED_RETRY_BASE_DELAY * (2 ** attempt) + random.uniform(0, 0.4)  # noqa: S311 - scheduling jitter, not a secret
+                    )
+                    continue
+            except httpx.HTTPError as e:
+                raise FeedFetchError(f"{type(e).__name__}: {str(e)[:120]}") from e
+        else:
+            raise FeedFetchError(
+                f"{type(last_exception).__name__} after {FEED_FETCH_ATTEMPTS} attempts: "
+                f"{str(last_exception)[:100]}"
+            ) from last_exception
+
+        # feedparser is CPU work on a body already in memory; large feeds take
+        # long enough to stall every other fetch if parsed on the loop.
+        return await asyncio.to_thread(self._parse_response, response)
+
+    async def _enrich_all(self, entries) -> None:
+        # The per-source cap the threaded scraper has, on top of the per-host one.
+        gate = asyncio.Semaphore(DEEP_FETCH_CONCURRENCY)
+
+        async def enrich(entry):
+            async with gate:
+                await self._enrich(entry)
+
+        await asyncio.gather(*(enrich(entry) for entry in entries))
+
+    async def _enrich(self, entry: Dict[str, Any]) -> None:
+        try:
+            headers, held = await asyncio.to_thread(self._conditional_request, entry['url'])
+            async with self._hosts(entry['url']):
+                response = await self._client.get(
+                    entry['url'], headers=headers, timeout=ARTICLE_TIMEOUT_SECONDS
+                )
+            if self._apply_not_modified(entry, response, held):
+                return
+            response.raise_for_status()
+            if len(response.content) > MAX_ARTICLE_BYTES:
+                logger.debug("Skipping oversized page %s", entry['url'][:80])
+                return
+            downloaded = response.text
+        except httpx.HTTPError as e:
+            logger.debug("Deep-fetch failed for %s: %s", entry['url'][:80], type(e).__name__)
+            return
+
+        await self._extract(entry, downloaded, response.headers)
+
+    async def _extract(self, entry: Dict[str, Any], downloaded: str, headers) -> None:
+        from core.services.extraction import extract_page, get_extraction_pool
+
+        pool = get_extraction_pool()
+        if pool is None:
+            # trafilatura and lxml hold the GIL for tens of milliseconds per page.
+            await asyncio.to_thread(self._apply_page, entry, downloaded, headers)
+            return
+
+        digest, extraction = await asyncio.to_thread(self._cached_extraction, downloaded)
+        if extraction is None and downloaded:
+            # The network slot was released when the download finished, so a
+            # page waiting here holds no connection. The semaphore is the
+            # backpressure: pages queue for extractors rather than all being
+            # shipped to the pool at once.
+            async with self._extracting:
+                extraction = await asyncio.get_running_loop().run_in_executor(
+                    pool, extract_page, downloaded
+                )
+        if extraction is not None:
+            await asyncio.to_thread(self._finish_page, entry, digest, extraction, headers)
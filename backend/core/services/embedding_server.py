@@ -0,0 +1,282 @@
+"""
+One embedding model per host, shared by every process that needs vectors.
+
+Each Celery worker, each API process and `run_pipeline` used to load its own
+fastembed ONNX session: ~11 s of start-up and a few hundred MB of memory apiece,
+for a model that spends most of its life idle. And every caller embedded alone —
+/ask a single query, clustering a few hundred headlines — so concurrent callers
+never shared an inference.
+
+With EMBEDDING_SERVER_URL set, `get_embedding_model()` hands out a client for a
+small local service instead (`manage.py serve_embeddings`). The service holds
+the one model and batches dynamically: requests arriving within
+BATCH_WINDOW_SECONDS of each other are embedded in one call, up to
+EMBED_BATCH_SIZE texts.
+
+The server is an optimisation, never a dependency. A client that cannot reach
+it falls back to loading the model in-process, exactly as before, and does not
+try the server again for RETRY_AFTER_SECONDS.
+
+    EMBEDDING_SERVER_URL=unix:///run/ultranews/embeddings.sock
+    EMBEDDING_SERVER_URL=http://127.0.0.1:8765
+"""
+import asyncio
+import json
+import logging
+import threading
+import time
+from urllib.parse import urlsplit
+
+import httpx
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# How long the batcher holds the first request of a batch for others to join.
+# Well under one embedding call (~30 ms for a short batch on CPU), so a lone
+# caller barely notices it.
+BATCH_WINDOW_SECONDS = 0.005
+
+# Clustering sends a few hundred headlines at a time; a cold CPU can take
+# seconds over those.
+REQUEST_TIMEOUT_SECONDS = 30.0
+
+# After a failed call, how long a process embeds in-process before it tries the
+# server again. Long enough that a down server costs one timeout per interval,
+# not one per article.
+RETRY_AFTER_SECONDS = 30.0
+
+
+def parse_server_url(url: str) -> tuple[str | None, str, int]:
+    """(unix socket path or None, host, port) for an EMBEDDING_SERVER_URL."""
+    parts = urlsplit(url)
+    if parts.scheme == "unix":
+        return parts.path, "", 0
+    return None, parts.hostname or "127.0.0.1", parts.port or 8765
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+class EmbeddingBatcher:
+    """Gathers concurrent requests into shared model calls."""
+
+    def __init__(self, model, window: float = BATCH_WINDOW_SECONDS, max_batch: int | None = None):
+        from core.clustering import EMBED_BATCH_SIZE
+
+        self._model = model
+        self._window = window
+        self._max_batch = max_batch or EMBED_BATCH_SIZE
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((texts, future))
+        return await future
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            size = len(batch[0][0])
+            deadline = loop.time() + self._window
+            while size < self._max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), remaining)
+                except TimeoutError:
+                    break
+                batch.append(item)
+                size += len(item[0])
+
+            texts = [text for request, _future in batch for text in request]
+            try:
+                # The model call is CPU work; the loop keeps accepting requests,
+                # which become the next batch.
+                vectors = await asyncio.to_thread(self._embed, texts)
+            except Exception as e:
+                for _request, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            offset = 0
+            for request, future in batch:
+                if not future.done():  # The caller may have gone.
+                    future.set_result(vectors[offset:offset + len(request)])
+                offset += len(request)
+
+    def _embed(self, texts: list[str]) -> list[list[float]]:
+        return [
+            [float(x) for x in vector]
+            for vector in self._model.embed(texts, batch_size=self._max_batch)
+        ]
+
+
+def create_app(window: float = BATCH_WINDOW_SECONDS):
+    """
+    The service as a bare ASGI app: POST /embed {"texts": [...]} returns
+    {"vectors": [...]}, GET /health returns 200 once the model is loaded.
+    """
+    state: dict = {}
+
+    async def respond(send, status: int, body: dict) -> None:
+        payload = json.dumps(body).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"),
+                        (b"content-length", str(len(payload)).encode())],
+        })
+        await send({"type": "http.response.body", "body": payload})
+
+    async def lifespan(receive, send) -> None:
+        from core.clustering import load_embedding_model
+
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                model = await asyncio.to_thread(load_embedding_model)
+                if model is None:
+                    await send({"type": "lifespan.startup.failed",
+                                "message": "fastembed is not installed"})
+                    return
+                state["batcher"] = EmbeddingBatcher(model, window)
+                state["task"] = asyncio.create_task(state["batcher"].run())
+                logger.info("Embedding server ready.")
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if "task" in state:
+                    state["task"].cancel()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def app(scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        if scope["path"] == "/health":
+            await respond(send, 200 if "batcher" in state else 503, {})
+            return
+        if scope["path"] != "/embed" or scope["method"] != "POST":
+            await respond(send, 404, {"error": "not found"})
+            return
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        try:
+            texts = json.loads(body)["texts"]
+            if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+                raise ValueError("texts must be a list of strings")
+        except (ValueError, KeyError, TypeError) as e:
+            await respond(send, 400, {"error": str(e)})
+            return
+
+        try:
+            vectors = await state["batcher"].embed(texts) if texts else []
+        except Exception as e:
+            logger.exception("Embedding failed for a batch")
+            await respond(send, 500, {"error": type(e).__name__})
+            return
+        await respond(send, 200, {"vectors": vectors})
+
+    return app
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+class EmbeddingUnavailable(Exception):
+    """The server failed and this process has no model to fall back to."""
+
+
+class RemoteEmbeddingModel:
+    """
+    Stands in for a fastembed TextEmbedding: `embed(texts)` yields one vector
+    per text. Falls back to the in-process model when the server fails, and
+    raises EmbeddingUnavailable when there is none.
+    """
+
+    def __init__(self, url: str):
+        uds, host, port = parse_server_url(url)
+        if uds:
+            transport = httpx.HTTPTransport(uds=uds)
+            base_url = "http://embedding-server"
+        else:
+            transport = httpx.HTTPTransport()
+            base_url = f"http://{host}:{port}"
+        self._client = httpx.Client(
+            transport=transport, base_url=base_url, timeout=REQUEST_TIMEOUT_SECONDS
+        )
+        self._down_until = 0.0
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def healthy(self) -> bool:
+        try:
+            ok = self._client.get("/health", timeout=2.0).status_code == 200
+        except httpx.HTTPError:
+            ok = False
+        if not ok:
+            self._down_until = time.monotonic() + RETRY_AFTER_SECONDS
+        return ok
+
+    def embed(self, texts, batch_size: int | None = None):
+        texts = list(texts)
+        if self.available:
+            try:
+                response = self._client.post("/embed", json={"texts": texts})
+                response.raise_for_status()
+                vectors = response.json()["vectors"]
+                if len(vectors) == len(texts):
+                    return iter(vectors)
+                logger.warning("Embedding server returned %d vectors for %d texts",
+                               len(vectors), len(texts))
+            except (httpx.HTTPError, ValueError, KeyError) as e:
+                logger.warning("Embedding server failed (%s); embedding in-process", e)
+            self._down_until = time.monotonic() + RETRY_AFTER_SECONDS
+
+        from core.clustering import load_embedding_model
+        from core.observability import embedding_server_fallbacks
+
+        embedding_server_fallbacks.inc()
+        model = load_embedding_model()
+        if model is None:
+            raise EmbeddingUnavailable("Embedding server unavailable and no in-process model")
+        return model.embed(texts, batch_size=batch_size or len(texts) or 1)
+
+
+_remote: RemoteEmbeddingModel | None = None
+_remote_lock = threading.Lock()
+
+
+def get_remote_model() -> RemoteEmbeddingModel | None:
+    """
+    The client for EMBEDDING_SERVER_URL, or None when it is unset or the server
+    is not answering — the caller then loads the model itself.
+    """
+    global _remote
+    url = getattr(settings, "EMBEDDING_SERVER_URL", "")
+    if not url:
+        return None
+    if _remote is None:
+        with _remote_lock:
+            if _remote is None:
+                remote = RemoteEmbeddingModel(url)
+                if not remote.healthy():
+                    logger.warning("Embedding server at %s not answering; loading in-process", url)
+                _remote = remote
+    return _remote if _remote.available else None
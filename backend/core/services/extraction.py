@@ -0,0 +1,115 @@
+"""
+Article-page extraction, off the fetch threads.
+
+`trafilatura.extract`, the nh3 clean of every paragraph and the lxml parse for
+og:image are pure CPU and hold the GIL while they run. Done on the deep-fetch
+threads, they serialised: eight fetchers became one extractor plus seven
+threads waiting for it, and a slow page held its network slot for the whole of
+its extraction.
+
+So deep fetching is two stages. Fetchers only download — they hand the page
+bytes to a bounded queue and move on to the next URL. A pool of worker
+processes extracts, in parallel across cores. The queue is the backpressure:
+when extraction falls behind, fetchers block on it rather than buffering an
+unbounded number of pages in memory.
+
+This module imports nothing from Django at import time, so worker processes
+start without loading the project.
+
+Worker processes cannot be started from a daemonic process, which is what a
+prefork Celery worker's children are. There `get_extraction_pool` returns None
+and extraction runs on the calling thread as before; the pool serves
+`run_pipeline`, and workers run with a threads or solo pool.
+"""
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+import nh3
+
+logger = logging.getLogger(__name__)
+
+# Downloaded pages allowed to wait for extraction, per worker process. Enough
+# to keep every extractor busy; small enough that a backlog of 4 MB pages
+# cannot balloon the fetch process.
+BACKLOG_PER_WORKER = 2
+
+
+def og_image(html: str) -> Optional[str]:
+    """The page's og:image (or twitter:image) value, unresolved."""
+    try:
+        from lxml import html as lxml_html
+
+        tree = lxml_html.fromstring(html)
+    except Exception:
+        return None
+
+    for xpath in (
+        '//meta[@property="og:image"]/@content',
+        '//meta[@name="twitter:image"]/@content',
+    ):
+        found = tree.xpath(xpath)
+        if found and found[0]:
+            return found[0].strip()
+    return None
+
+
+def extract_page(html: str) -> Dict[str, Any]:
+    """
+    The cacheable result of one page: main text, its sanitised paragraphs, and
+    the raw og:image value. Runs in a worker process.
+    """
+    full_text = None
+    try:
+        import trafilatura
+
+        full_text = trafilatura.extract(html, include_comments=False, include_tables=False)
+    except Exception as e:
+        logger.debug("Text extraction failed: %s", type(e).__name__)
+
+    content = ""
+    if full_text:
+        content = "".join(
+            f"<p>{nh3.clean(line, tags=set())}</p>"
+            for line in full_text.split('\n')
+            if line.strip()
+        )
+    return {'full_text': full_text, 'content': content, 'image': og_image(html)}
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def get_extraction_pool() -> Optional[ProcessPoolExecutor]:
+    """The process's extractor pool, or None to extract on the calling thread."""
+    global _pool, _pool_workers
+    if _pool is not None:
+        return _pool
+
+    from django.conf import settings
+
+    workers = int(getattr(settings, "EXTRACTION_WORKERS", 0))
+    if workers <= 0 or multiprocessing.current_process().daemon:
+        return None
+
+    with _pool_lock:
+        if _pool is None:
+            # Not fork: the fetch process has threads running, and forking a
+            # threaded process can copy a lock mid-acquire into the child.
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context(method)
+            )
+            _pool_workers = workers
+            logger.info("Started %d extraction processes (%s).", workers, method)
+    return _pool
+
+
+def backlog_limit() -> int:
+    """Pages that may wait for the pool before fetchers are made to wait."""
+    return max(1, _pool_workers or (os.cpu_count() or 1)) * BACKLOG_PER_WORKER
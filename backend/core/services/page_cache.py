@@ -0,0 +1,196 @@
+"""
+On-disk cache of deep-fetch extraction results.
+
+Deep-fetching an article page is a download plus `trafilatura.extract` plus an
+lxml parse for og:image — tens of milliseconds of CPU on top of the network.
+Pages are fetched again more often than it looks: an article dropped by
+retention and re-listed by its feed, a feed that rotates the same items in and
+out, syndicated copies of one page under two URLs. Each of those paid for the
+whole extraction again.
+
+Two layers, both plain files so any worker process on the host shares them:
+
+  objects/  Extraction results, content-addressed by the SHA-256 of the page
+            HTML. The same bytes are never extracted twice, whatever URL they
+            arrived under.
+  urls/     Per URL: the ETag and Last-Modified the page was served with, and
+            the hash of the body they describe. Replayed as a conditional GET,
+            so an unchanged page costs a 304 with no body and no extraction.
+
+The cache is bounded by DEEP_FETCH_CACHE_MAX_MB. Reads refresh a file's mtime,
+so eviction — oldest mtime first — is least-recently-used. Writes go through a
+temporary file and an atomic rename, so a concurrent reader sees a whole entry
+or none.
+
+Every failure degrades to a miss: the cache can make a fetch cheaper, never
+make it fail.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Evict down to this fraction of the limit, so a full cache is not swept again
+# on the very next write.
+_EVICT_TO = 0.9
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class PageCache:
+    def __init__(self, root, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+
+    # -- paths ---------------------------------------------------------------
+
+    def _object_path(self, content_hash: str) -> Path:
+        return self.root / "objects" / content_hash[:2] / f"{content_hash}.json"
+
+    def _url_path(self, url: str) -> Path:
+        key = _digest(url)
+        return self.root / "urls" / key[:2] / f"{key}.json"
+
+    # -- reads ---------------------------------------------------------------
+
+    def _read(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)  # The LRU clock.
+            return data
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("Unreadable page cache entry %s: %s", path.name, e)
+            return None
+
+    def revalidation(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        What a conditional GET of `url` needs: the ETag / Last-Modified to
+        replay and the extraction a 304 stands for, read together. None if we
+        hold no page for it, or its extraction has been evicted.
+
+        The caller keeps the extraction for the response: a 304 means the
+        server will not resend the page, so looking it up afterwards — when
+        eviction may have taken it in the meantime — would lose it for good.
+        """
+        entry = self._read(self._url_path(url))
+        if not entry or not (entry.get("etag") or entry.get("last_modified")):
+            return None
+        extraction = self.for_content(entry.get("content_hash", ""))
+        if extraction is None:
+            return None
+        return {
+            "etag": entry.get("etag", ""),
+            "last_modified": entry.get("last_modified", ""),
+            "extraction": extraction,
+        }
+
+    def for_content(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        return self._read(self._object_path(content_hash)) if content_hash else None
+
+    # -- writes --------------------------------------------------------------
+
+    def _write(self, path: Path, data: Dict[str, Any]) -> None:
+        payload = json.dumps(data).encode("utf-8")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        previous = path.stat().st_size if path.exists() else 0
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._grew(len(payload) - previous)
+
+    def put(self, url: str, content_hash: str, extraction: Dict[str, Any],
+            etag: str = "", last_modified: str = "") -> None:
+        """Store an extraction under its content hash, and point `url` at it."""
+        try:
+            if not self._object_path(content_hash).exists():
+                self._write(self._object_path(content_hash), extraction)
+            self._write(self._url_path(url), {
+                "etag": etag, "last_modified": last_modified, "content_hash": content_hash,
+            })
+        except OSError as e:
+            logger.debug("Could not write page cache entry for %s: %s", url[:80], e)
+
+    # -- eviction ------------------------------------------------------------
+
+    def _files(self):
+        for path in self.root.rglob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            yield stat.st_mtime, stat.st_size, path
+
+    def _grew(self, delta: int) -> None:
+        with self._lock:
+            if self._size is None:
+                # Sized once per process, then tracked incrementally.
+                self._size = sum(size for _, size, _ in self._files())
+            else:
+                self._size += delta
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        files = sorted(self._files())
+        total = sum(size for _, size, _ in files)
+        target = self.max_bytes * _EVICT_TO
+        removed = 0
+        for _mtime, size, path in files:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        # Other processes write here too; re-anchor to what is actually on disk.
+        self._size = total
+        logger.info("Page cache evicted %d entries; %.1f MB remain.", removed, total / 1e6)
+
+
+_page_cache = None
+_page_cache_lock = threading.Lock()
+
+
+def get_page_cache() -> Optional[PageCache]:
+    """The process's page cache, or None when disabled or unwritable."""
+    global _page_cache
+    if _page_cache is None:
+        with _page_cache_lock:
+            if _page_cache is None:
+                _page_cache = _build() or False
+    return _page_cache or None
+
+
+def _build() -> Optional[PageCache]:
+    from django.conf import settings
+
+    root = getattr(settings, "DEEP_FETCH_CACHE_DIR", "")
+    max_mb = int(getattr(settings, "DEEP_FETCH_CACHE_MAX_MB", 256))
+    if not root or max_mb <= 0:
+        return None
+    try:
+        Path(root).mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.warning("Deep-fetch cache disabled; cannot create %s: %s", root, e)
+        return None
+    return PageCache(root, max_mb * 1024 * 1024)
+
+
+def content_hash(html: str) -> str:
+    return _digest(html)
@@ -1,19 +1,23 @@
 import hashlib
 import html
 import logging
+import queue
 import random
 import re
+import threading
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from time import mktime, sleep
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import feedparser
 import httpx
 import nh3
 
+from core.near_duplicates import minhash
+
 logger = logging.getLogger(__name__)
 
 # HTML tags allowed in excerpts/content after sanitization
@@ -161,6 +165,11 @@ def generate_excerpt(full_text: str, max_words: int = EXCERPT_WORD_LIMIT) -> str
     return " ".join(words[:max_words]) + "…"
 
 
+# Set on a deep-fetch thread while it feeds the extraction pipeline; see
+# RSSScraper._enrich_pipelined.
+_fetch_stage = threading.local()
+
+
 class FeedFetchError(Exception):
     """
     The feed could not be retrieved or parsed.
@@ -214,10 +223,27 @@ class RSSScraper(BaseScraper):
         etag: str = "",
         last_modified: str = "",
     ) -> FeedResult:
-        skip_urls = skip_urls or set()
-
         entries, new_etag, new_last_modified = self._parse_feed(url, etag, last_modified)
 
+        pending, skipped = self._select_pending(url, entries, skip_urls)
+        if pending:
+            self._enrich_all(pending)
+
+        return self._result(url, entries, pending, skipped, new_etag, new_last_modified)
+
+    def _select_pending(
+        self, url: str, entries: List[Dict[str, Any]], skip_urls: Optional[set]
+    ) -> tuple[List[Dict[str, Any]], int]:
+        """
+        The entries worth deep-fetching, and how many were already stored.
+
+        `skip_urls` is a set of stored URLs, or a callable that is handed the
+        feed's URLs and returns the stored ones — so the caller can look up just
+        this feed instead of supplying the source's whole archive.
+        """
+        if callable(skip_urls):
+            skip_urls = skip_urls([e['url'] for e in entries if e['url']])
+        skip_urls = skip_urls or set()
         pending = [e for e in entries if e['url'] and e['url'] not in skip_urls]
         skipped = len(entries) - len(pending)
 
@@ -229,18 +255,17 @@ class RSSScraper(BaseScraper):
                 url, len(pending), MAX_DEEP_FETCH_PER_RUN,
             )
             pending = pending[:MAX_DEEP_FETCH_PER_RUN]
+        return pending, skipped
 
-        if pending:
-            self._enrich_all(pending)
-
+    def _result(self, url, entries, pending, skipped, etag, last_modified) -> FeedResult:
         logger.info(
             "Feed %s: %d entries, %d already stored, %d prepared.",
             url, len(entries), skipped, len(pending),
         )
         return FeedResult(
             articles=[self._finalize(entry) for entry in pending],
-            etag=new_etag,
-            last_modified=new_last_modified,
+            etag=etag,
+            last_modified=last_modified,
             entries_seen=len(entries),
         )
 
@@ -257,11 +282,7 @@ class RSSScraper(BaseScraper):
         Raises FeedFetchError on any transport or parse failure — the caller needs
         to record that as a failure, not silently treat it as "no new articles".
         """
-        headers = {"User-Agent": USER_AGENT, "Accept": "application/rss+xml, application/xml, text/xml, */*"}
-        if etag:
-            headers["If-None-Match"] = etag
-        if last_modified:
-            headers["If-Modified-Since"] = last_modified
+        headers = self._feed_headers(etag, last_modified)
 
         # Retry transient transport failures before blaming the source.
         #
@@ -297,6 +318,19 @@ class RSSScraper(BaseScraper):
                 f"{str(last_exception)[:100]}"
             ) from last_exception
 
+        return self._parse_response(response)
+
+    @staticmethod
+    def _feed_headers(etag: str = "", last_modified: str = "") -> Dict[str, str]:
+        headers = {"User-Agent": USER_AGENT, "Accept": "application/rss+xml, application/xml, text/xml, */*"}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _parse_response(self, response: httpx.Response):
+        """Turn a feed response into (entries, etag, last_modified), or raise."""
         if response.status_code == 304:
             raise FeedNotModified()
 
@@ -362,68 +396,188 @@ class RSSScraper(BaseScraper):
 
     def _enrich_all(self, entries: List[Dict[str, Any]]) -> None:
         """Deep-fetch article pages in parallel; mutates entries in place."""
+        from core.services.extraction import get_extraction_pool
+
+        pool = get_extraction_pool()
         with httpx.Client(
             headers={"User-Agent": USER_AGENT},
             timeout=ARTICLE_TIMEOUT_SECONDS,
             follow_redirects=True,
-        ) as client, ThreadPoolExecutor(max_workers=DEEP_FETCH_CONCURRENCY) as pool:
-            list(pool.map(lambda e: self._enrich(client, e), entries))
+        ) as client, ThreadPoolExecutor(max_workers=DEEP_FETCH_CONCURRENCY) as fetchers:
+            if pool is None:
+                list(fetchers.map(lambda e: self._enrich(client, e), entries))
+            else:
+                self._enrich_pipelined(client, fetchers, pool, entries)
 
     def _enrich(self, client: httpx.Client, entry: Dict[str, Any]) -> None:
+        page = self._download(client, entry)
+        if page is None:
+            return
+        handoff = getattr(_fetch_stage, 'pages', None)
+        if handoff is not None:
+            # Pipelined: leave extraction to the process pool.
+            handoff.put((entry, *page))
+        else:
+            self._apply_page(entry, *page)
+
+    def _download(self, client: httpx.Client, entry: Dict[str, Any]):
+        """
+        Fetch one article page: (html, headers), or None when there is nothing
+        to extract — a failure, an oversized page, or a 304 already applied.
+        """
         try:
-            response = client.get(entry['url'])
+            headers, held = self._conditional_request(entry['url'])
+            response = client.get(entry['url'], headers=headers)
+            if self._apply_not_modified(entry, response, held):
+                return None
             response.raise_for_status()
             if len(response.content) > MAX_ARTICLE_BYTES:
                 logger.debug("Skipping oversized page %s", entry['url'][:80])
-                return
-            downloaded = response.text
+                return None
+            return response.text, response.headers
         except httpx.HTTPError as e:
             logger.debug("Deep-fetch failed for %s: %s", entry['url'][:80], type(e).__name__)
-            return
+            return None
+
+    def _enrich_pipelined(self, client, fetchers, pool, entries) -> None:
+        """
+        Fetch on threads, extract in worker processes (core/services/extraction.py).
 
+        Fetchers put each page on a bounded queue and go straight back to the
+        network. This thread feeds the queue to the process pool, never holding
+        more than the backlog limit in flight — so when extraction lags, the
+        queue fills and the fetchers wait, instead of pages piling up in memory.
+        """
+        from core.services.extraction import backlog_limit, extract_page
+
+        limit = backlog_limit()
+        pages: queue.Queue = queue.Queue(maxsize=limit)
+
+        def fetch(entry):
+            _fetch_stage.pages = pages
+            try:
+                self._enrich(client, entry)
+            finally:
+                _fetch_stage.pages = None
+
+        fetching = [fetchers.submit(fetch, entry) for entry in entries]
+        extracting: dict = {}
+
+        while True:
+            if len(extracting) < limit:
+                try:
+                    entry, downloaded, headers = pages.get(block=not extracting, timeout=0.05)
+                except queue.Empty:
+                    pass
+                else:
+                    digest, extraction = self._cached_extraction(downloaded)
+                    if extraction is not None:
+                        self._finish_page(entry, digest, extraction, headers)
+                    elif downloaded:
+                        future = pool.submit(extract_page, downloaded)
+                        extracting[future] = (entry, digest, downloaded, headers)
+                    continue
+
+            if extracting:
+                done, _ = wait(extracting, timeout=0.05, return_when=FIRST_COMPLETED)
+                for future in done:
+                    entry, digest, downloaded, headers = extracting.pop(future)
+                    try:
+                        extraction = future.result()
+                    except Exception as e:
+                        # A broken pool must not cost the page its text.
+                        logger.warning("Extraction worker failed (%s); extracting inline", e)
+                        extraction = extract_page(downloaded)
+                    self._finish_page(entry, digest, extraction, headers)
+            elif pages.empty() and all(f.done() for f in fetching):
+                break
+
+        for future in fetching:
+            future.result()
+
+    # Article pages are conditional-GET'd against the page cache
+    # (core/services/page_cache.py): an unchanged page is a 304 whose stored
+    # extraction is replayed, and a changed page whose bytes were already
+    # extracted under any URL skips extraction.
+
+    @staticmethod
+    def _conditional_request(url: str) -> Tuple[Dict[str, str], Optional[Dict[str, Any]]]:
+        """(request headers, the extraction a 304 would stand for)."""
+        from core.services.page_cache import get_page_cache
+
+        cache = get_page_cache()
+        held = cache.revalidation(url) if cache else None
+        if not held:
+            return {}, None
+        headers = {}
+        if held['etag']:
+            headers["If-None-Match"] = held['etag']
+        if held['last_modified']:
+            headers["If-Modified-Since"] = held['last_modified']
+        return headers, held['extraction']
+
+    def _apply_not_modified(self, entry: Dict[str, Any], response, extraction) -> bool:
+        """
+        Apply a 304 from the extraction read with its validators. A 304 we did
+        not ask for — no extraction in hand — is left to fail as a non-2xx.
+        """
+        if response.status_code != 304 or extraction is None:
+            return False
+        self._apply_extraction(entry, extraction)
+        return True
+
+    def _apply_page(self, entry: Dict[str, Any], downloaded: str, headers=None) -> None:
+        """Take full text and og:image from a downloaded article page."""
         if not downloaded:
             return
 
-        try:
-            import trafilatura
+        digest, extraction = self._cached_extraction(downloaded)
+        if extraction is None:
+            from core.services.extraction import extract_page
+            extraction = extract_page(downloaded)
+        self._finish_page(entry, digest, extraction, headers)
 
-            full_text = trafilatura.extract(
-                downloaded, include_comments=False, include_tables=False
+    @staticmethod
+    def _cached_extraction(downloaded: str):
+        """(content hash, cached extraction or None). The hash is '' without a cache."""
+        from core.services.page_cache import content_hash, get_page_cache
+
+        cache = get_page_cache()
+        if not cache or not downloaded:
+            return "", None
+        digest = content_hash(downloaded)
+        return digest, cache.for_content(digest)
+
+    def _finish_page(self, entry, digest: str, extraction: Dict[str, Any], headers=None) -> None:
+        from core.services.page_cache import get_page_cache
+
+        cache = get_page_cache()
+        if cache and digest:
+            headers = headers or {}
+            cache.put(
+                entry['url'], digest, extraction,
+                etag=headers.get("ETag", "")[:300],
+                last_modified=headers.get("Last-Modified", "")[:120],
             )
-            if full_text and len(full_text) > len(entry['summary']):
-                entry['content'] = "".join(
-                    f"<p>{nh3.clean(line, tags=set())}</p>"
-                    for line in full_text.split('\n')
-                    if line.strip()
-                )
-                entry['deep_fetch_success'] = True
-        except Exception as e:
-            logger.debug("Text extraction failed for %s: %s", entry['url'][:80], type(e).__name__)
-
-        image = self._extract_og_image(downloaded, entry['url'])
-        if image:
-            entry['image_url'] = image
+        self._apply_extraction(entry, extraction)
 
     @staticmethod
-    def _extract_og_image(html: str, base_url: str) -> Optional[str]:
-        try:
-            from lxml import html as lxml_html
-
-            tree = lxml_html.fromstring(html)
-        except Exception:
-            return None
+    def _apply_extraction(entry: Dict[str, Any], extraction: Dict[str, Any]) -> None:
+        full_text = extraction.get('full_text')
+        if full_text and len(full_text) > len(entry['summary']):
+            entry['content'] = extraction.get('content') or "".join(
+                f"<p>{nh3.clean(line, tags=set())}</p>"
+                for line in full_text.split('\n')
+                if line.strip()
+            )
+            entry['deep_fetch_success'] = True
 
-        for xpath in (
-            '//meta[@property="og:image"]/@content',
-            '//meta[@name="twitter:image"]/@content',
-        ):
-            found = tree.xpath(xpath)
-            if found and found[0]:
-                candidate = found[0].strip()
-                if not candidate.startswith(('http://', 'https://')):
-                    candidate = urljoin(base_url, candidate)
-                return candidate
-        return None
+        image = extraction.get('image')
+        if image:
+            # Resolved per URL: the same page bytes can arrive under two URLs.
+            if not image.startswith(('http://', 'https://')):
+                image = urljoin(entry['url'], image)
+            entry['image_url'] = image
 
     # -- output ------------------------------------------------------------
 
@@ -436,6 +590,7 @@ class RSSScraper(BaseScraper):
             'content': sanitize_html(content),
             'excerpt': generate_excerpt(content),
             'content_hash': generate_content_hash(f"{entry['title']} {content}"),
+            'minhash': minhash(strip_to_text(content)),
             'published_date': entry['published_date'],
             'image_url': entry['image_url'],
             'deep_fetch_success': entry['deep_fetch_success'],
@@ -448,7 +603,9 @@ class ScraperService:
             'rss': RSSScraper()
         }
 
-    def scrape_source(self, source, skip_urls: Optional[Iterable[str]] = None) -> FeedResult:
+    def scrape_source(
+        self, source, skip_urls: Optional[Iterable[str] | Callable[[list], set]] = None
+    ) -> FeedResult:
         """
         Scrape one source, skipping URLs the caller already has stored.
 
@@ -462,7 +619,7 @@ class ScraperService:
 
         return scraper.fetch_articles(
             source.url,
-            skip_urls=set(skip_urls or ()),
+            skip_urls=skip_urls if callable(skip_urls) else set(skip_urls or ()),
             etag=source.etag,
             last_modified=source.last_modified,
         )
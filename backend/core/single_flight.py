@@ -0,0 +1,103 @@
+"""
+Single-flight cache fills.
+
+The response caches were all `cache.get` → build → `cache.set`, and nothing
+stopped concurrent misses on one key from all building it. They miss together
+by construction: a generation advance retires a scope's feed pages at once,
+and `invalidate_story` purges a story exactly when clustering has made it
+interesting — so the readers arriving next all queried Postgres for the same
+payload, which is the load the cache exists to absorb.
+
+A miss now takes a short lease on the key in the shared cache (an atomic
+`add`, so it holds across processes and hosts). The request holding it builds
+and stores the value; the others, while it does:
+
+  - serve the key's previous value, when the caller keeps one (`stale_key`) —
+    stale-while-revalidate, bounded by one rebuild; or
+  - wait briefly for the holder's value, polling the key.
+
+A holder that fails (a 404, an exception) drops the lease, and a holder that
+dies lets it expire, so waiters stop waiting and build for themselves rather
+than hang. Nothing here is worse than the old behaviour: the fallback is always
+to build, exactly as before.
+"""
+import time
+import uuid
+
+from django.core.cache import cache
+
+from core import cache_tiers
+
+# How long one request may hold the right to rebuild a key. Well above any
+# build; it only matters when the holder dies without releasing it.
+LEASE_SECONDS = 10
+
+# How long a request without the lease waits for the holder's value before
+# building its own. A feed page builds in tens of milliseconds warm.
+WAIT_SECONDS = 2.0
+_POLL_SECONDS = 0.05
+
+# How long a previous value stays available for stale-while-revalidate.
+STALE_SECONDS = 10 * 60
+
+
+def _lease_key(key: str) -> str:
+    return f"lease:{key}"
+
+
+def _store(key, value, timeout, stale_key) -> None:
+    cache_tiers.put(key, value, timeout)
+    if stale_key:
+        cache.set(stale_key, value, timeout=STALE_SECONDS)
+
+
+def get_or_build(key: str, build, *, timeout: int, stale_key: str | None = None,
+                 name: str = "other"):
+    """
+    `cache.get(key)`, with misses coalesced: one concurrent request calls
+    `build()` and stores it for `timeout` seconds, the rest reuse its value.
+
+    `stale_key` names where the last built value is kept across invalidations
+    of `key`, for waiters to serve while the rebuild runs. `name` labels the
+    metrics.
+    """
+    from core.observability import cache_fill_wait, cache_fills
+
+    value = cache_tiers.get(key)
+    if value is not None:
+        return value
+
+    lease, token = _lease_key(key), uuid.uuid4().hex
+    if cache.add(lease, token, timeout=LEASE_SECONDS):
+        cache_fills.labels(name, "leader").inc()
+        try:
+            value = build()
+            _store(key, value, timeout, stale_key)
+            return value
+        finally:
+            # Not atomic, but a lease expiring mid-build and being re-taken in
+            # this window only costs one extra build.
+            if cache.get(lease) == token:
+                cache.delete(lease)
+
+    if stale_key:
+        value = cache.get(stale_key)
+        if value is not None:
+            cache_fills.labels(name, "stale").inc()
+            return value
+
+    started = time.monotonic()
+    while time.monotonic() - started < WAIT_SECONDS:
+        time.sleep(_POLL_SECONDS)
+        value = cache_tiers.get(key)
+        if value is not None:
+            cache_fills.labels(name, "waited").inc()
+            cache_fill_wait.labels(name).observe(time.monotonic() - started)
+            return value
+        if cache.get(lease) is None:
+            break  # The holder gave up; waiting longer will not produce a value.
+
+    cache_fills.labels(name, "timed_out").inc()
+    value = build()
+    _store(key, value, timeout, stale_key)
+    return value
@@ -0,0 +1,160 @@
+"""
+The feed card projection — `StoryCard`, one row per story.
+
+A feed card shows, beyond the Story row: the lead image, up to CARD_SOURCES
+outlet names and CARD_FRAMINGS headlines for the framing switcher, all from the
+story's publishable articles in (published_date, id) order, plus its category
+slugs. `list_stories` used to derive them per request — a values() query over
+every publishable article on the page, a Python pass over the rows, and a
+categories prefetch — for an answer that only changes when clustering does.
+
+Clustering now maintains the card as articles join:
+
+  - An article published after everything already on the card is folded in
+    directly: it can only fill an empty slot, never displace an earlier outlet.
+    Once the card is full, a new article changes nothing and nothing is written.
+  - Anything else — a new story, an article older than the card's newest, a
+    merge — rebuilds the card from the story's articles.
+
+Category slugs are re-read for every touched story, since clustering merges
+article topics into the story in the same pass. Only changed cards are written.
+
+Synthesis rewrites `Story.summary`, which the feed reads from the story row
+itself, so it has nothing to maintain here.
+"""
+# Headlines shown per card in the framing switcher.
+CARD_FRAMINGS = 3
+# Outlet names listed under a card.
+CARD_SOURCES = 5
+
+_CARD_FIELDS = ['image_url', 'sources', 'framing_preview', 'category_slugs', 'last_article_at']
+
+
+def _new_card(story_id):
+    from core.models import StoryCard
+
+    return StoryCard(
+        story_id=story_id, image_url=None, sources=[], framing_preview=[],
+        category_slugs=[], last_article_at=None,
+    )
+
+
+def _fold(card, *, published, title, url, image_url, source) -> None:
+    """Add one publishable article to `card`. Articles must arrive oldest first."""
+    # First image encountered wins — articles arrive oldest-first, so this is
+    # the image from whichever outlet broke the story.
+    if card.image_url is None and image_url:
+        card.image_url = image_url
+    # While the card has room, every outlet seen so far is on it, so a name not
+    # on it is new.
+    if source not in card.sources and len(card.sources) < CARD_SOURCES:
+        card.sources.append(source)
+        if len(card.framing_preview) < CARD_FRAMINGS:
+            card.framing_preview.append({'source': source, 'title': title, 'url': url})
+    if card.last_article_at is None or published > card.last_article_at:
+        card.last_article_at = published
+
+
+def _category_slugs(story_ids) -> dict[int, list[str]]:
+    from core.models import Story
+
+    slugs: dict[int, list[str]] = {}
+    for story_id, slug in (
+        Story.categories.through.objects
+        .filter(story_id__in=story_ids)
+        .order_by('story_id', 'category__slug')
+        .values_list('story_id', 'category__slug')
+    ):
+        slugs.setdefault(story_id, []).append(slug)
+    return slugs
+
+
+def compute_cards(story_ids) -> dict:
+    """
+    Cards for `story_ids` built from their articles: one values() query over
+    the stories' publishable articles, no model instances.
+    Stories without a publishable article get an empty card.
+    """
+    from core.models import Article, Source
+
+    story_ids = list(story_ids)
+    cards = {story_id: _new_card(story_id) for story_id in story_ids}
+    if not story_ids:
+        return cards
+
+    rows = (
+        Article.objects
+        .filter(story_id__in=story_ids, source__trust_tier=Source.TrustTier.AUTO_PUBLISH)
+        .order_by('story_id', 'published_date', 'id')
+        .values_list('story_id', 'published_date', 'title', 'url', 'image_url', 'source__name')
+    )
+    for story_id, published, title, url, image_url, source in rows.iterator(chunk_size=500):
+        _fold(cards[story_id], published=published, title=title, url=url,
+              image_url=image_url, source=source)
+
+    for story_id, slugs in _category_slugs(story_ids).items():
+        cards[story_id].category_slugs = slugs
+    return cards
+
+
+def refresh_story_cards(story_ids, articles=(), rebuild: bool = False) -> int:
+    """
+    Bring the cards of `story_ids` up to date after `articles` joined them.
+    With `rebuild`, every card is recomputed from articles. Returns how many
+    cards were written.
+    """
+    from core.models import Source, StoryCard
+
+    story_ids = set(story_ids)
+    if not story_ids:
+        return 0
+
+    joined: dict[int, list] = {}
+    for article in articles:
+        if article.story_id in story_ids and (
+            article.source.trust_tier == Source.TrustTier.AUTO_PUBLISH
+        ):
+            joined.setdefault(article.story_id, []).append(article)
+
+    existing = StoryCard.objects.in_bulk(story_ids)
+    cards, stale = {}, set()
+    for story_id in story_ids:
+        card = existing.get(story_id)
+        new = sorted(joined.get(story_id, ()), key=lambda a: (a.published_date, a.pk or 0))
+        if rebuild or card is None or (
+            new and card.last_article_at is not None
+            and new[0].published_date <= card.last_article_at
+        ):
+            stale.add(story_id)
+            continue
+        card = StoryCard(**{f: getattr(card, f) for f in _CARD_FIELDS}, story_id=story_id)
+        # Copies, so the comparison below sees the stored lists unchanged.
+        card.sources = list(card.sources)
+        card.framing_preview = list(card.framing_preview)
+        for article in new:
+            _fold(card, published=article.published_date, title=article.title,
+                  url=article.url, image_url=article.image_url, source=article.source.name)
+        cards[story_id] = card
+
+    if cards:
+        slugs = _category_slugs(list(cards))
+        for story_id, card in cards.items():
+            card.category_slugs = slugs.get(story_id, [])
+    cards.update(compute_cards(stale))
+
+    # `last_article_at` alone moving is not a change worth a write: an article
+    # that changed nothing on the card reads the same folded in either order
+    # with any earlier one, so the stored, older bound stays correct.
+    changed = [
+        card for story_id, card in cards.items()
+        if story_id not in existing
+        or any(getattr(card, f) != getattr(existing[story_id], f) for f in _CARD_FIELDS[:-1])
+    ]
+    if changed:
+        StoryCard.objects.bulk_create(
+            changed,
+            update_conflicts=True,
+            unique_fields=['story'],
+            update_fields=_CARD_FIELDS + ['updated_at'],
+        )
+    return len(changed)
@@ -1,20 +1,35 @@
 import logging
+from dataclasses import dataclass, field
 
 from celery import group, shared_task
+from django.conf import settings
 from django.core.cache import cache
-from django.db import IntegrityError, transaction
+from django.db import transaction
 from django.utils import timezone
 
-from core.clustering import cluster_article, compute_velocity
+from core.clustering import (
+    AssignmentBatch,
+    assign_topics_batch,
+    build_centroid_index,
+    cluster_article,
+    compute_velocity,
+    embed_articles,
+)
 from core.models import Article, RawDocument, Source, Story
+from core.near_duplicates import inherit_embeddings, link_near_duplicates, lsh_bands
 from core.observability import (
     articles_ingested,
     articles_pending_clustering,
     clustering_duration,
+    clustering_embed_duration,
     clustering_outcomes,
+    clustering_partition_merges,
+    feed_snapshot_render_duration,
     ingest_outcomes,
+    near_duplicates_linked,
     observe,
 )
+from core.scheduling import claim_due_sources, schedule_next
 from core.services.scraper import FeedFetchError, FeedNotModified, ScraperService
 
 logger = logging.getLogger(__name__)
@@ -24,6 +39,165 @@ logger = logging.getLogger(__name__)
 # next 5-minute cycle rather than overrunning the lock.
 MAX_ARTICLES_PER_CLUSTER_RUN = 500
 
+# Articles per clustering transaction when assignments are batched. Large enough
+# that a syndicated story's copies land in one recount; small enough that a
+# failed chunk costs little to redo and a deadline stop keeps most of the run.
+CLUSTER_COMMIT_CHUNK = 50
+
+
+@dataclass
+class _ClusterProgress:
+    processed: int = 0
+    stopped: bool = False
+    touched: set = field(default_factory=set)
+    # Stories opened by this pass, for the partitioned run's merge step.
+    created: set = field(default_factory=set)
+
+
+def _cluster_sequence(articles, index, out_of_time, partitioned=False) -> _ClusterProgress:
+    """
+    Cluster `articles` in order: a chunk per transaction when assignments can be
+    batched, article by article otherwise.
+    """
+    progress = _ClusterProgress()
+
+    # Batching needs the index, which is the only place a deferred centroid is
+    # visible to the next match.
+    batch = (
+        AssignmentBatch()
+        if index is not None and getattr(settings, "CLUSTER_BATCH_COMMIT", True)
+        else None
+    )
+    chunk_size = CLUSTER_COMMIT_CHUNK if batch is not None else 1
+
+    def record(article, story, outcome):
+        clustering_outcomes.labels(outcome).inc()
+        progress.touched.add(article.story_id)
+        if outcome == "created":
+            progress.created.add(story.pk)
+        progress.processed += 1
+
+    def cluster_one(article):
+        try:
+            # Cluster assigns the story, computes and persists the embedding,
+            # and updates the cluster's counts, tier and velocity.
+            with observe(clustering_duration):
+                story = cluster_article(article, index=index)
+        except Exception:
+            # One poisoned article must not abort the whole batch.
+            clustering_outcomes.labels("failed").inc()
+            logger.exception("Failed to cluster article %d", article.pk)
+            return
+        record(article, story, "matched" if story.source_count > 1 else "created")
+
+    # A cursor rather than a range: a failed chunk can drop the batch, and
+    # with it the chunk size, part way through.
+    start = 0
+    while start < len(articles):
+        if out_of_time():
+            progress.stopped = True
+            break
+        chunk_start = start
+        chunk = articles[start:start + chunk_size]
+        start += len(chunk)
+
+        if batch is None:
+            cluster_one(chunk[0])
+            continue
+
+        assigned = []
+        try:
+            with transaction.atomic():
+                for article in chunk:
+                    with observe(clustering_duration):
+                        story = cluster_article(article, index=index, batch=batch)
+                    assigned.append(
+                        (article, story, "matched" if story.source_count > 1 else "created")
+                    )
+                batch.flush()
+        except Exception:
+            # The chunk rolled back, stories it created included, and the index
+            # holds centroids that were never written. Rebuild the index from
+            # the database and redo the chunk article by article, so one
+            # poisoned article costs only itself.
+            logger.exception(
+                "Batched clustering failed for a chunk of %d; retrying it per article",
+                len(chunk),
+            )
+            batch.discard()
+            # From the failed chunk on: its articles are the oldest left, and
+            # the index's window starts from the oldest article it is given.
+            fresh = build_centroid_index(articles[chunk_start:])
+            if fresh is not None and partitioned:
+                # Stay inside the partition's own stories; the rest belong to
+                # other threads.
+                fresh = fresh.subset(index)
+            index = fresh
+            for article in chunk:
+                cluster_one(article)
+            if index is None:
+                batch = None
+                chunk_size = 1
+            continue
+
+        for article, story, outcome in assigned:
+            record(article, story, outcome)
+
+    return progress
+
+
+def _cluster_partitioned(articles, index, workers, out_of_time) -> _ClusterProgress:
+    """
+    Cluster independent partitions of `articles` concurrently, then merge any
+    duplicate stories they opened for one event. See core/partitioning.py.
+
+    Threads rather than processes: a prefork Celery child is daemonic and may
+    not fork a pool of its own, and once embedding is done up front what is
+    left is mostly database round-trips, which release the GIL anyway.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from django.db import connections
+
+    from core.partitioning import merge_partition_duplicates, partition_pending
+
+    partitions = partition_pending(articles, index, workers)
+    if len(partitions) < 2:
+        return _cluster_sequence(articles, index, out_of_time)
+    logger.info(
+        "Clustering %d articles in %d partitions (%s).",
+        len(articles), len(partitions), ", ".join(str(len(p)) for p, _ in partitions),
+    )
+
+    def run(partition):
+        members, part_index = partition
+        try:
+            return _cluster_sequence(members, part_index, out_of_time, partitioned=True)
+        finally:
+            # Database connections are thread-local; close this thread's.
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # map() yields in submission order, so the merge below sees the
+        # partitions in the same order however the threads were scheduled.
+        results = list(pool.map(run, partitions))
+
+    total = _ClusterProgress()
+    partition_of = {}
+    for number, progress in enumerate(results):
+        total.processed += progress.processed
+        total.stopped = total.stopped or progress.stopped
+        total.touched |= progress.touched
+        total.created |= progress.created
+        for story_id in sorted(progress.touched):
+            partition_of.setdefault(story_id, number)
+
+    merged = merge_partition_duplicates(partition_of, total.created)
+    if merged:
+        clustering_partition_merges.inc(merged)
+        logger.info("Merged %d duplicate stories across partitions.", merged)
+    return total
+
 
 @shared_task(bind=True, max_retries=2, soft_time_limit=180, time_limit=240, queue='fetch')
 def scrape_single_source(self, source_id):
@@ -43,90 +217,184 @@ def scrape_single_source(self, source_id):
 
     logger.info("Scraping %s...", source.name)
     service = ScraperService()
-    count = 0
 
     try:
-        # Hand the scraper the URLs we already have so it deep-fetches only new
-        # articles instead of re-downloading the whole feed every 30 minutes.
-        known_urls = set(
-            Article.objects.filter(source=source).values_list('url', flat=True)
-        )
+        # Hand the scraper a lookup of the URLs we already have so it
+        # deep-fetches only new articles instead of re-downloading the whole
+        # feed every 30 minutes. It checks the feed's URLs against the source's
+        # bounded index rather than loading the source's entire archive.
         try:
-            result = service.scrape_source(source, skip_urls=known_urls)
+            result = service.scrape_source(source, skip_urls=_url_index(source).known)
         except FeedNotModified:
-            # 304: the publisher confirmed nothing changed. A success, and the
-            # cheapest possible one — no body transferred at all.
-            ingest_outcomes.labels("not_modified").inc()
-            _record_source_success(source)
-            logger.info("%s unchanged since last fetch (304).", source.name)
+            _record_not_modified(source)
             return 0
         except FeedFetchError as e:
-            ingest_outcomes.labels("failure").inc()
-            _record_source_failure(source, str(e))
+            _record_fetch_failure(source, str(e))
             return 0
 
-        articles_data = result.articles
-
-        for data in articles_data:
-            try:
-                # Atomic: check + create to prevent TOCTOU race condition
-                with transaction.atomic():
-                    if Article.objects.filter(url=data['url']).exists():
-                        continue
-
-                    # Slug generation and collision handling live on the model,
-                    # so every write path gets a unique slug — not just this one.
-                    article = Article.objects.create(
-                        source=source,
-                        title=data['title'],
-                        url=data['url'],
-                        content=data['content'],
-                        excerpt=data.get('excerpt', ''),
-                        content_hash=data.get('content_hash', ''),
-                        published_date=data['published_date'],
-                        image_url=data.get('image_url'),
-                        story=None,  # Explicitly unset; clustered later
-                    )
+        return _store_feed_result(source, result)
 
-                    # Only save RawDocument if deep_fetch succeeded
-                    if data.get('deep_fetch_success'):
-                        RawDocument.objects.create(
-                            source=source,
-                            article=article,
-                            url=data['url'],
-                            raw_content=data['content'],
-                        )
+    except Exception as e:
+        logger.exception("Unexpected error scraping %s", source.name)
+        _record_fetch_failure(source, f"{type(e).__name__}: {str(e)[:120]}")
+        return 0
 
-                    # Topics are NOT assigned here. Classification is semantic
-                    # and needs the embedding, which clustering computes — see
-                    # core.clustering._assign_topics. Keyword matching used to
-                    # run at this point over the full article body, then get
-                    # overwritten minutes later by the semantic pass: duplicate
-                    # work whose result was discarded, against a keyword table
-                    # still naming retired slugs.
 
-                    count += 1
+# The steps of one source's ingest either side of the network fetch. Shared by
+# scrape_single_source and the async engine (core/ingest_engine.py), so both
+# record health, outcomes and articles identically.
+
+def _url_index(source):
+    from core.dedup import SourceUrlIndex
+    return SourceUrlIndex(source.id)
+
+
+def _record_not_modified(source) -> None:
+    # 304: the publisher confirmed nothing changed. A success, and the
+    # cheapest possible one — no body transferred at all.
+    ingest_outcomes.labels("not_modified").inc()
+    _record_source_success(source, new_articles=0)
+    logger.info("%s unchanged since last fetch (304).", source.name)
+
+
+def _record_fetch_failure(source, reason: str) -> None:
+    ingest_outcomes.labels("failure").inc()
+    _record_source_failure(source, reason)
+
+
+def _insert_articles(source, entries) -> None:
+    Article.objects.bulk_create(
+        [
+            Article(
+                source=source,
+                title=data['title'],
+                slug=slug,
+                url=data['url'],
+                content=data['content'],
+                excerpt=data.get('excerpt', ''),
+                content_hash=data.get('content_hash', ''),
+                minhash=data.get('minhash', []),
+                minhash_bands=lsh_bands(data.get('minhash', [])),
+                published_date=data['published_date'],
+                image_url=data.get('image_url'),
+                story=None,  # Explicitly unset; clustered later
+            )
+            for data, slug in zip(
+                entries, Article.unique_slugs(d['title'] for d in entries), strict=True
+            )
+        ],
+        ignore_conflicts=True,
+    )
 
-            except IntegrityError:
-                logger.debug("Duplicate article skipped: %s", data['url'][:80])
-                continue
 
-        ingest_outcomes.labels("success").inc()
-        articles_ingested.inc(count)
-        _record_source_success(source, etag=result.etag, last_modified=result.last_modified)
+def _landed(source, entries) -> dict[str, int]:
+    """{url: id} for those of `entries` now stored for `source`."""
+    return dict(
+        Article.objects.filter(source=source, url__in=[d['url'] for d in entries])
+        .values_list('url', 'id')
+    )
 
-        logger.info("Saved %d new articles for %s", count, source.name)
-        return count
 
-    except Exception as e:
-        logger.exception("Unexpected error scraping %s", source.name)
-        ingest_outcomes.labels("failure").inc()
-        _record_source_failure(source, f"{type(e).__name__}: {str(e)[:120]}")
-        return 0
+def _store_feed_result(source, result) -> int:
+    """
+    Persist a successful fetch's new articles and mark the source healthy.
 
+    One feed is a handful of statements, not a handful per entry: one lookup of
+    the URLs already stored, one slug lookup, one bulk insert of articles, one
+    read-back of what landed, and one bulk insert of their raw documents. Per
+    entry this used to be an atomic block, an exists(), a create, a RawDocument
+    create and up to five slug probes — ~100 statements for a 25-item feed.
+    """
+    # First occurrence wins when a feed repeats a link.
+    entries, seen = [], set()
+    for data in result.articles:
+        if data['url'] not in seen:
+            seen.add(data['url'])
+            entries.append(data)
+
+    if entries:
+        stored = set(
+            Article.objects.filter(url__in=[d['url'] for d in entries])
+            .values_list('url', flat=True)
+        )
+        entries = [d for d in entries if d['url'] not in stored]
+
+    count, lost = 0, False
+    if entries:
+        with transaction.atomic():
+            # ignore_conflicts covers the race the per-entry exists() check used
+            # to: another worker storing the same URL between our lookup and
+            # this insert. Conflicting rows are skipped, not raised.
+            _insert_articles(source, entries)
+            # Postgres returns no ids for skipped rows, so read back which of
+            # ours actually landed.
+            created = _landed(source, entries)
+
+            # A row can also be skipped for its slug: another worker storing a
+            # same-titled copy. Its URL is then stored nowhere, and nothing
+            # would retry it — the validators below make the next fetch a 304.
+            # Retry those once under slugs drawn after that worker's landed.
+            missing = [d for d in entries if d['url'] not in created]
+            if missing:
+                elsewhere = set(
+                    Article.objects.filter(url__in=[d['url'] for d in missing])
+                    .values_list('url', flat=True)
+                )
+                retry = [d for d in missing if d['url'] not in elsewhere]
+                if retry:
+                    _insert_articles(source, retry)
+                    created = _landed(source, entries)
+                    lost = any(d['url'] not in created for d in retry)
+
+            count = len(created)
+            _url_index(source).add(created)
+
+            # Only save RawDocument if deep_fetch succeeded
+            RawDocument.objects.bulk_create(
+                [
+                    RawDocument(
+                        source=source,
+                        article_id=created[data['url']],
+                        url=data['url'],
+                        raw_content=data['content'],
+                    )
+                    for data in entries
+                    if data.get('deep_fetch_success') and data['url'] in created
+                ],
+                ignore_conflicts=True,
+            )
 
-def _record_source_success(source, etag: str = "", last_modified: str = "") -> None:
-    """Mark a fetch as healthy and store the cache validators for next time."""
+    # Topics are NOT assigned here. Classification is semantic and needs the
+    # embedding, which clustering computes — see core.clustering._assign_topics.
+    # Keyword matching used to run at this point over the full article body,
+    # then get overwritten minutes later by the semantic pass: duplicate work
+    # whose result was discarded, against a keyword table still naming retired
+    # slugs.
+
+    if lost:
+        # Keep the old validators, so the next fetch sees these entries again
+        # rather than a 304.
+        logger.warning("Could not store every new article for %s; refetching next run.",
+                       source.name)
+    ingest_outcomes.labels("success").inc()
+    articles_ingested.inc(count)
+    _record_source_success(
+        source,
+        etag="" if lost else result.etag,
+        last_modified="" if lost else result.last_modified,
+        new_articles=count,
+    )
+
+    logger.info("Saved %d new articles for %s", count, source.name)
+    return count
+
+
+def _record_source_success(source, etag: str = "", last_modified: str = "",
+                           new_articles: int = 0) -> None:
+    """
+    Mark a fetch as healthy, store the cache validators for next time, and
+    schedule the next fetch from what this one brought.
+    """
     now = timezone.now()
     source.last_fetched_at = now
     source.last_success_at = now
@@ -140,6 +408,7 @@ def _record_source_success(source, etag: str = "", last_modified: str = "") -> N
         source.last_modified = last_modified
         fields += ['etag', 'last_modified']
 
+    fields += schedule_next(source, new_articles)
     source.save(update_fields=fields)
 
 
@@ -156,6 +425,7 @@ def _record_source_failure(source, reason: str) -> None:
     source.consecutive_failures += 1
     source.last_error = reason[:300]
     fields = ['last_fetched_at', 'consecutive_failures', 'last_error']
+    fields += schedule_next(source, None)
 
     if source.consecutive_failures >= Source.FAILURE_THRESHOLD and source.is_active:
         source.is_active = False
@@ -181,6 +451,10 @@ def cluster_pending_articles(fetch_results=None, deadline_seconds=None):
     """
     Cluster articles with story=None, sequentially so cluster dedup has no races.
 
+    With CLUSTER_PARTITION_WORKERS above 1, the queue is split into partitions
+    no match can cross and those run concurrently; a merge pass afterwards
+    removes any duplicate story two partitions opened for one event.
+
     `deadline_seconds` bounds the run by TIME rather than only by count. A fixed
     batch size assumes you know the per-article cost, and that assumption broke:
     the cost moved from under a second to twenty when a queue the deployment did
@@ -202,60 +476,111 @@ def cluster_pending_articles(fetch_results=None, deadline_seconds=None):
     try:
         # Bounded batch: the lock expires after 5 minutes, so a run must finish
         # well inside that. Leftovers are picked up by the next cycle.
-        pending_articles = (
+        pending_articles = list(
             Article.objects.filter(story__isnull=True)
             .select_related('source')
             .order_by('published_date')[:MAX_ARTICLES_PER_CLUSTER_RUN]
         )
 
-        processed = 0
-        stories_touched = set()
-        stopped_early = False
-
-        for article in pending_articles:
-            if deadline_seconds and (_time.monotonic() - started) > deadline_seconds:
-                stopped_early = True
-                logger.info(
-                    "Clustering hit its %ss budget after %d articles; "
-                    "the rest stay queued for the next run.",
-                    deadline_seconds, processed,
-                )
-                break
-            try:
-                # Cluster assigns the story, computes and persists the embedding,
-                # and updates the cluster's counts, tier and velocity.
-                with observe(clustering_duration):
-                    story = cluster_article(article)
-                clustering_outcomes.labels(
-                    "matched" if story and story.source_count > 1 else "created"
-                ).inc()
-            except Exception:
-                # One poisoned article must not abort the whole batch.
-                clustering_outcomes.labels("failed").inc()
-                logger.exception("Failed to cluster article %d", article.pk)
-                continue
-            if article.story_id:
-                stories_touched.add(article.story_id)
-            processed += 1
+        # Embed the whole batch up front. Per article this was one single-row
+        # ONNX inference each — most of the per-article clustering time, and
+        # the one part of the run that batches well. The vectors stay on the
+        # instances, so cluster_article reuses them and persists them with the
+        # story assignment.
+        #
+        # A failure here is not fatal: anything left without a vector is
+        # embedded individually by cluster_article, exactly as before.
+        #
+        # Near-duplicates of an earlier article — syndicated copies, mostly —
+        # are not embedded at all: they take their twin's vector, and join its
+        # story without a vector query (core/near_duplicates.py).
+        try:
+            twins = link_near_duplicates(pending_articles)
+            if twins:
+                near_duplicates_linked.inc(twins)
+                logger.info("Linked %d pending articles to a near-duplicate.", twins)
+        except Exception:
+            logger.exception("Near-duplicate lookup failed; embedding every article")
+            for article in pending_articles:
+                article.near_duplicate_of = None
+
+        try:
+            with observe(clustering_embed_duration):
+                embedded = embed_articles([
+                    a for a in pending_articles if getattr(a, 'near_duplicate_of', None) is None
+                ])
+            if embedded:
+                logger.info("Embedded %d pending articles in batch.", embedded)
+        except Exception:
+            logger.exception("Batch embedding failed; falling back to per-article")
+        inherit_embeddings(pending_articles)
+
+        # Topics for the whole batch in one classification and one insert,
+        # rather than three round trips per article inside cluster_article.
+        assign_topics_batch(pending_articles)
+
+        # Story centroids for the whole run, matched in memory rather than with
+        # one pgvector query per article. None falls back to pgvector.
+        index = build_centroid_index(pending_articles)
+
+        def out_of_time():
+            return bool(deadline_seconds) and (_time.monotonic() - started) > deadline_seconds
+
+        workers = getattr(settings, "CLUSTER_PARTITION_WORKERS", 1)
+        if workers > 1 and index is not None and len(pending_articles) > CLUSTER_COMMIT_CHUNK:
+            progress = _cluster_partitioned(pending_articles, index, workers, out_of_time)
+        else:
+            progress = _cluster_sequence(pending_articles, index, out_of_time)
+
+        processed = progress.processed
+        stories_touched = progress.touched
+        stopped_early = progress.stopped
+        if stopped_early:
+            logger.info(
+                "Clustering hit its %ss budget after %d articles; "
+                "the rest stay queued for the next run.",
+                deadline_seconds, processed,
+            )
 
         # Velocity decays with age, so refresh it for every touched story even if
         # its article count did not change this cycle. compute_velocity() is the
         # single definition — this used to use a different formula than
         # clustering.py, so the feed ranking disagreed with the story page.
-        for story in Story.objects.filter(id__in=stories_touched).only(
-            'id', 'independent_count', 'first_seen_at'
-        ):
+        touched = list(
+            Story.objects.filter(id__in=stories_touched).only(
+                'id', 'independent_count', 'first_seen_at'
+            )
+        )
+        for story in touched:
             story.velocity_score = compute_velocity(
                 story.independent_count, story.first_seen_at
             )
-            story.save(update_fields=['velocity_score'])
-
-        # New reporting invalidates cached answers. A cached response about a
-        # developing story is wrong the moment fresh coverage lands, and on a
-        # news product a stale answer is worse than a slow one.
+        Story.objects.bulk_update(touched, ['velocity_score'], batch_size=500)
+
+        # New reporting invalidates cached answers and feed pages. A cached
+        # response about a developing story is wrong the moment fresh coverage
+        # lands, and on a news product a stale answer is worse than a slow one.
+        # Only the generations this run's stories belong to are advanced
+        # (core/generations.py): the rest of the cache is still right.
+        #
+        # The hot feed editions among them are rendered first, so the readers
+        # arriving after the advance find them built instead of all missing at
+        # once (api/editions.py). A failure only costs that: the editions are
+        # then rendered by the first reader of each.
         if processed:
-            from core.services.answer_cache import invalidate_all
-            invalidate_all()
+            from api.editions import render_editions
+            from core import generations
+
+            advanced = generations.advance(
+                generations.scopes_changed_by(stories_touched, progress.created)
+            )
+            try:
+                with observe(feed_snapshot_render_duration):
+                    rendered = render_editions(advanced)
+                logger.info("Pre-rendered %d feed editions.", rendered)
+            except Exception:
+                logger.exception("Feed edition pre-render failed; readers will render them")
+            generations.publish(advanced)
 
         # Backlog depth is the single best health signal here: an article that
         # is never clustered is invisible to every reader, and no request-level
@@ -278,21 +603,54 @@ def cluster_pending_articles(fetch_results=None, deadline_seconds=None):
 @shared_task(queue='celery')
 def scrape_all_sources():
     """
-    Dispatcher task: Fans out fetching across all active sources in parallel.
+    Dispatcher task: Fans out fetching across the sources that are due, in parallel.
     Clustering is decoupled and runs on its own Celery Beat schedule (every 5 min).
     This avoids the chord fragility where one failed source blocks all clustering.
+
+    Each source is due on its own learned interval (core/scheduling.py), so this
+    ticks every INGEST_TICK_SECONDS and most ticks dispatch only a few sources.
+
+    With INGEST_ENGINE=async the fan-out is one task rather than one per source:
+    scrape_sources_async fetches them all concurrently from a single process.
     """
-    logger.info("Starting parallel ingestion...")
-    sources = Source.objects.filter(is_active=True)
-    if not sources.exists():
-        return "No active sources"
+    source_ids = claim_due_sources()
+    if not source_ids:
+        return "No sources due"
+
+    if getattr(settings, "INGEST_ENGINE", "async") == "async":
+        scrape_sources_async.delay(source_ids)
+        logger.info("Dispatched async ingestion of %d due sources.", len(source_ids))
+        return f"Dispatched async fetch of {len(source_ids)} sources"
 
     # Fire-and-forget parallel fetch — no chord callback
-    fetch_group = group(scrape_single_source.s(s.id) for s in sources)
+    fetch_group = group(scrape_single_source.s(source_id) for source_id in source_ids)
     fetch_group.apply_async()
 
-    logger.info("Dispatched %d source fetch tasks.", sources.count())
-    return f"Dispatched {sources.count()} fetch tasks"
+    logger.info("Dispatched %d source fetch tasks.", len(source_ids))
+    return f"Dispatched {len(source_ids)} fetch tasks"
+
+
+@shared_task(queue='fetch', soft_time_limit=600, time_limit=660)
+def scrape_sources_async(source_ids=None):
+    """
+    Fetch every active source from this one task, concurrently.
+
+    Per-source outcomes — articles, 304s, failures and the circuit breaker —
+    are recorded exactly as scrape_single_source records them. The time limit
+    covers hundreds of feeds at the per-host pace. Sweeps may overlap now that
+    the dispatcher ticks often, but never on a source: each is leased when
+    dispatched (scheduling.CLAIM_LEASE, longer than this limit).
+    """
+    from core.ingest_engine import ingest_sources
+
+    outcomes = ingest_sources(source_ids)
+    saved = sum(count for count, _ in outcomes.values())
+    failed = sum(1 for _, error in outcomes.values() if error)
+    logger.info(
+        "Async ingestion: %d sources, %d new articles, %d failed.",
+        len(outcomes), saved, failed,
+    )
+    return f"Fetched {len(outcomes)} sources: {saved} new articles, {failed} failed"
 
 
 @shared_task(queue='celery', bind=True, max_retries=2, soft_time_limit=15)
@@ -310,10 +668,21 @@ def revalidate_frontend_story(self, slug: str):
 @shared_task(queue='cluster', soft_time_limit=120)
 def refresh_momentum_scores():
     """
-    Recompute momentum and let it decay.
+    Let momentum decay.
 
     Momentum falls as the window slides with no write to the story, so without
     this pass yesterday's news would stay pinned to the top of Developing.
+    Clustering records publishers as they join; this only expires them.
+    """
+    from core.momentum import expire_momentum
+    return expire_momentum()
+
+
+@shared_task(queue='cluster', soft_time_limit=300)
+def reconcile_momentum():
+    """
+    Recompute momentum from articles, correcting anything the incremental path
+    cannot see: a source changing trust tier, a publisher domain re-derived.
     """
     from core.momentum import refresh_momentum
     return refresh_momentum()
@@ -0,0 +1,55 @@
+"""
+The per-process tier in front of the shared cache.
+
+A local copy is only worth having if it cannot outlive the shared one: deleted
+with it, expired by its TTL, and bounded in number.
+"""
+import pytest
+from django.core.cache import cache
+
+from core import cache_tiers
+
+
+@pytest.fixture(autouse=True)
+def local_tier(settings):
+    settings.LOCAL_CACHE_MAX_ENTRIES = 3
+    settings.LOCAL_CACHE_TTL_SECONDS = 60
+    cache.clear()
+    cache_tiers.clear_local()
+    yield
+    cache_tiers.clear_local()
+
+
+def test_reads_are_answered_locally_once_fetched():
+    cache.set("k", "shared")
+    assert cache_tiers.get("k") == "shared"
+
+    cache.set("k", "changed behind the tier's back")
+    assert cache_tiers.get("k") == "shared", "the second read went to the shared cache"
+
+
+def test_delete_drops_the_local_copy():
+    cache_tiers.put("story:a", "v1", 300)
+    cache_tiers.delete("story:a")
+    cache.set("story:a", "v2")
+
+    assert cache_tiers.get("story:a") == "v2"
+
+
+def test_local_copies_expire(settings):
+    settings.LOCAL_CACHE_TTL_SECONDS = 0
+    cache_tiers.put("k", "v1", 300)
+    cache.set("k", "v2")
+
+    assert cache_tiers.get("k") == "v2"
+
+
+def test_least_recently_used_copies_are_evicted():
+    for key in ("a", "b", "c"):
+        cache_tiers.put(key, key, 300)
+    cache_tiers.get("a")          # a is now the most recent
+    cache_tiers.put("d", "d", 300)  # evicts b
+    for key in "abcd":
+        cache.set(key, f"shared {key}")
+
+    assert [cache_tiers.get(key) for key in "cadb"] == ["c", "a", "d", "shared b"]
@@ -0,0 +1,52 @@
+"""
+The keyword matcher's single-pass automaton against the regex scan it replaced.
+
+Speed is measured by `manage.py benchmark_keywords`; what is locked in here is
+that the automaton finds exactly what one `\\bkeyword\\b` search per keyword did.
+"""
+import pytest
+
+from core.categorization import (
+    KeywordAutomaton,
+    _regex_hit_counts,
+    keyword_hit_counts,
+    match_category_slugs,
+)
+
+BOUNDARY_CASES = [
+    # Substrings of longer words never count: "art" is not in "apartment".
+    "Apartment prices climb as smartphones and artistic startups multiply",
+    # Punctuated and multi-word keywords, at the edges of the text.
+    "Semi-final: Formula 1 team wins; peer-reviewed study says G7 summit",
+    "formula 10 semi-finals g7s",
+    # Case folds; underscores are word characters, as they are for \b.
+    "NASA telescope spots Mars dust. _nasa nasa_ Cyber-attack",
+    # "startup" is a keyword of two categories.
+    "A startup raises funding for a startup accelerator",
+    # Case folding that str.lower gets wrong: "İ" lowers to two characters,
+    # the second a non-word one, and "ſ"/"ı" fold to "s"/"i" only under re.
+    "İnasa ſummit, İNTERNATİONAL treaty Sanctıons",
+    "",
+]
+
+
+@pytest.mark.parametrize("text", BOUNDARY_CASES)
+def test_automaton_counts_match_the_regex_scan(text):
+    assert keyword_hit_counts(text) == _regex_hit_counts(text)
+
+
+def test_each_keyword_counts_once_however_often_it_appears():
+    automaton = KeywordAutomaton({"a": ["he", "she", "hers"], "b": ["his", "she"]})
+
+    assert automaton.hit_counts("she said hers, she said his, she") == {"a": 2, "b": 2}
+    assert automaton.hit_counts("ushers") == {}
+
+
+def test_match_category_slugs_applies_the_threshold():
+    scored = match_category_slugs(
+        "Premier League club sacks coach after semi-final defeat",
+        "The goalkeeper and the midfielder were both injured.",
+    )
+
+    assert scored[0] == ("sports", 5)
+    assert all(hits >= 2 for _slug, hits in scored)
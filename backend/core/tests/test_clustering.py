@@ -12,6 +12,10 @@ from core.clustering import (
 from core.models import Article, Category, Source, Story
 
 
+def _no_topics(embeddings, *args, **kwargs):
+    return [[] for _ in embeddings]
+
+
 @pytest.fixture
 def base_source():
     return Source.objects.create(name="Test Source", url="http://test.com")
@@ -192,3 +196,595 @@ def test_dispatch_never_raises_into_the_caller():
 
     with override_settings(CELERY_DISPATCH_ENABLED=True):
         assert dispatch(task, 1) is False
+
+
+# ==========================================================================
+# Batched embedding
+# ==========================================================================
+
+class _RecordingModel:
+    """Stands in for fastembed: one orthogonal unit vector per text, calls recorded."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def embed(self, texts, batch_size=256):
+        texts = list(texts)
+        self.calls.append(texts)
+        offset = sum(len(c) for c in self.calls[:-1])
+        for i, _text in enumerate(texts):
+            vector = [0.0] * 384
+            vector[(offset + i) % 384] = 1.0
+            yield vector
+
+
+@pytest.mark.django_db
+def test_pending_articles_are_embedded_in_one_batch(base_source):
+    """
+    The clustering run embeds its whole batch up front.
+
+    Each article used to be embedded inside cluster_article with a single-item
+    list — one ONNX inference per article, which was most of the run.
+    """
+    from core.tasks import cluster_pending_articles
+
+    now = timezone.now()
+    for i in range(5):
+        Article.objects.create(
+            source=base_source,
+            title=f"Unrelated headline number {i}",
+            excerpt="Body text.",
+            url=f"http://test.com/batch/{i}",
+            published_date=now + timedelta(minutes=i),
+        )
+
+    model = _RecordingModel()
+    with patch("core.clustering.get_embedding_model", return_value=model), \
+            patch("core.topics.classify_batch", side_effect=_no_topics):
+        cluster_pending_articles()
+
+    assert len(model.calls) == 1, f"expected one batched call, got {len(model.calls)}"
+    assert len(model.calls[0]) == 5
+    assert not Article.objects.filter(story__isnull=True).exists()
+    assert not Article.objects.filter(embedding__isnull=True).exists()
+
+
+def test_embed_texts_keeps_positions_for_blank_input():
+    from core.clustering import embed_texts
+
+    model = _RecordingModel()
+    with patch("core.clustering.get_embedding_model", return_value=model):
+        vectors = embed_texts(["first", "   ", "third"])
+
+    assert model.calls == [["first", "third"]]
+    assert vectors[0] is not None and vectors[2] is not None
+    assert vectors[1] is None
+
+
+# ==========================================================================
+# In-memory centroid index
+# ==========================================================================
+
+def _unit(vector):
+    import numpy as np
+
+    vector = np.asarray(vector, dtype=float)
+    return vector / np.linalg.norm(vector)
+
+
+@pytest.mark.django_db
+def test_centroid_index_matches_the_pgvector_path(base_source):
+    """
+    The in-memory index must pick exactly the story pgvector would.
+
+    Stories are scattered around a handful of event vectors, some of them
+    outside the 72-hour window, and articles are drawn at varying distances
+    from those events so the set spans clear matches, near-threshold cases and
+    misses. Every article must resolve to the same story, at the same score,
+    by both routes.
+    """
+    import numpy as np
+
+    from core.clustering import CentroidIndex, EmbeddingScorer, _find_best_match
+
+    rng = np.random.default_rng(7)
+    now = timezone.now()
+    events = [_unit(rng.normal(size=384)) for _ in range(6)]
+
+    for i in range(40):
+        event = events[i % len(events)]
+        # Noise of norm ~0.3: each centroid sits at cosine ~0.96 from its event.
+        centroid = _unit(event + rng.normal(size=384) / np.sqrt(384) * 0.3)
+        Story.objects.create(
+            title=f"Story {i}",
+            slug=f"story-{i}",
+            first_seen_at=now - timedelta(hours=int(rng.integers(0, 24 * 6))),
+            embedding=[float(x) for x in centroid],
+        )
+
+    articles = []
+    for i in range(30):
+        event = events[i % len(events)]
+        # Cosine 0.74–0.98 from the event, so article-to-story similarity
+        # straddles the 0.80 threshold.
+        noise = rng.normal(size=384) / np.sqrt(384) * rng.uniform(0.2, 0.9)
+        articles.append(Article(
+            source=base_source,
+            title=f"Article {i}",
+            url=f"http://test.com/ann/{i}",
+            published_date=now,
+            embedding=[float(x) for x in _unit(event + noise)],
+        ))
+
+    index = CentroidIndex.for_articles(articles)
+    scorer = EmbeddingScorer()
+    matched = 0
+
+    for article in articles:
+        via_db, db_score = _find_best_match(article, scorer)
+        via_index, index_score = _find_best_match(article, scorer, index)
+
+        assert (via_db and via_db.pk) == (via_index and via_index.pk), article.title
+        assert index_score == pytest.approx(db_score, abs=1e-5)
+        matched += via_db is not None
+
+    # Guard against a vacuous pass where nothing clears the threshold.
+    assert 0 < matched < len(articles)
+
+
+@pytest.mark.django_db
+def test_centroid_index_tracks_centroids_clustering_changes(base_source):
+    """A story created mid-run must be matchable by the very next article."""
+    from core.clustering import CentroidIndex, EmbeddingScorer, _find_best_match
+
+    now = timezone.now()
+    vector = [1.0] + [0.0] * 383
+    first = Article(
+        source=base_source, title="First", url="http://test.com/ix/1",
+        published_date=now, embedding=vector,
+    )
+    index = CentroidIndex.for_articles([first])
+    assert len(index) == 0
+
+    story = Story.objects.create(
+        title="First", slug="first", first_seen_at=now, embedding=vector,
+    )
+    index.upsert(story.pk, story.first_seen_at, story.embedding)
+
+    second = Article(
+        source=base_source, title="Second", url="http://test.com/ix/2",
+        published_date=now, embedding=vector,
+    )
+    match, score = _find_best_match(second, EmbeddingScorer(), index)
+    assert match.pk == story.pk
+    assert score == pytest.approx(1.0)
+
+
+# ==========================================================================
+# Batched assignment writes
+# ==========================================================================
+
+class _SameVectorModel:
+    """Every text embeds to the same unit vector, so every article matches."""
+
+    def embed(self, texts, batch_size=256):
+        for _text in texts:
+            yield [1.0] + [0.0] * 383
+
+
+@pytest.mark.django_db
+def test_batched_run_lands_syndicated_copies_in_one_recount(base_source):
+    """
+    Copies of one story arriving in a single run are written as one chunk.
+
+    The story must end up exactly where per-article writes left it — counts,
+    tier, primary source — with its cache purged once rather than per copy.
+    """
+    from core.tasks import cluster_pending_articles
+
+    now = timezone.now()
+    vector = [1.0] + [0.0] * 383
+    story = Story.objects.create(
+        title="Port strike enters second week",
+        slug="port-strike",
+        first_seen_at=now - timedelta(hours=2),
+        embedding=vector,
+    )
+    Article.objects.create(
+        source=base_source, story=story, is_primary_source=True,
+        title="Port strike enters second week", url="http://test.com/strike",
+        published_date=now - timedelta(hours=2), embedding=vector,
+    )
+
+    copies = []
+    for i in range(4):
+        outlet = Source.objects.create(name=f"Outlet {i}", url=f"http://outlet{i}.com")
+        copies.append(Article.objects.create(
+            source=outlet,
+            title="Port strike enters second week",
+            url=f"http://outlet{i}.com/strike",
+            # The third copy predates the story's founding article.
+            published_date=now - timedelta(hours=3 if i == 2 else 1),
+        ))
+
+    with patch("core.clustering.get_embedding_model", return_value=_SameVectorModel()), \
+            patch("core.topics.classify_batch", side_effect=_no_topics), \
+            patch("core.invalidation.invalidate_story") as invalidate:
+        cluster_pending_articles()
+
+    story.refresh_from_db()
+    assert Story.objects.count() == 1
+    assert story.source_count == 5
+    assert story.independent_count == 5
+    assert story.status == Story.Status.CORROBORATED
+    assert list(
+        Article.objects.filter(is_primary_source=True).values_list('pk', flat=True)
+    ) == [copies[2].pk]
+    assert invalidate.call_count == 1
+
+
+@pytest.mark.django_db
+def test_a_failed_chunk_without_an_index_still_clusters_every_article():
+    """
+    Losing the index drops the run to per-article writes part way through;
+    every remaining article must still be clustered, not one per chunk.
+    """
+    from core.tasks import CLUSTER_COMMIT_CHUNK, _cluster_sequence
+
+    articles = [MagicMock(pk=i, story_id=i) for i in range(CLUSTER_COMMIT_CHUNK * 2 + 20)]
+    clustered = []
+
+    def cluster(article, index=None, batch=None):
+        if batch is not None:
+            raise RuntimeError("poisoned chunk")
+        clustered.append(article.pk)
+        return MagicMock(pk=article.pk, source_count=1)
+
+    with patch("core.tasks.cluster_article", side_effect=cluster), \
+            patch("core.tasks.build_centroid_index", return_value=None):
+        progress = _cluster_sequence(articles, MagicMock(), lambda: False)
+
+    assert clustered == [article.pk for article in articles]
+    assert progress.processed == len(articles)
+
+
+@pytest.mark.django_db
+def test_a_rebuilt_index_still_covers_the_failed_chunks_stories(base_source):
+    """
+    The index rebuilt after a failed chunk must reach back as far as that
+    chunk's own articles, or they miss their story on the retry and open
+    duplicates.
+    """
+    from core import tasks
+    from core.clustering import cluster_article as real_cluster_article
+
+    now = timezone.now()
+    vector = [1.0] + [0.0] * 383
+    story = Story.objects.create(
+        title="Port strike enters second week", slug="port-strike",
+        first_seen_at=now - timedelta(days=10), embedding=vector,
+    )
+    outlet = Source.objects.create(name="Outlet", url="http://outlet.com")
+    # Only the older article's window reaches back to the story.
+    older = Article.objects.create(
+        source=outlet, title="Port strike enters second week", url="http://outlet.com/strike",
+        published_date=now - timedelta(days=9),
+    )
+    newer = Article.objects.create(
+        source=outlet, title="Port strike ends", url="http://outlet.com/ends",
+        published_date=now,
+    )
+    failed = []
+
+    def cluster(article, index=None, batch=None):
+        if batch is not None and not failed:
+            failed.append(article.pk)
+            raise RuntimeError("poisoned chunk")
+        return real_cluster_article(article, index=index, batch=batch)
+
+    with patch("core.clustering.get_embedding_model", return_value=_SameVectorModel()), \
+            patch("core.invalidation.invalidate_story"), \
+            patch.object(tasks, "CLUSTER_COMMIT_CHUNK", 1), \
+            patch("core.tasks.cluster_article", side_effect=cluster):
+        articles = [older, newer]
+        tasks._cluster_sequence(articles, tasks.build_centroid_index(articles), lambda: False)
+
+    assert failed == [older.pk]
+    older.refresh_from_db()
+    assert older.story_id == story.pk
+
+
+# ==========================================================================
+# Partitioned clustering
+# ==========================================================================
+
+def _near(vector, rng, spread):
+    import numpy as np
+
+    return [float(x) for x in _unit(vector + rng.normal(size=384) / np.sqrt(384) * spread)]
+
+
+@pytest.mark.django_db
+def test_partitions_keep_every_possible_match_together(base_source):
+    """
+    No article may be separated from an article or story it could join, and
+    unrelated events must land in different partitions.
+    """
+    import numpy as np
+
+    from core.clustering import CentroidIndex
+    from core.partitioning import partition_pending
+
+    rng = np.random.default_rng(11)
+    now = timezone.now()
+    events = [_unit(rng.normal(size=384)) for _ in range(4)]
+    existing = Story.objects.create(
+        title="Existing", slug="existing", first_seen_at=now - timedelta(hours=1),
+        embedding=_near(events[0], rng, 0.2),
+    )
+
+    articles = [
+        Article(
+            source=base_source, pk=i + 1, title=f"Article {i}",
+            url=f"http://test.com/part/{i}", published_date=now + timedelta(minutes=i),
+            embedding=_near(events[i % 4], rng, 0.2),
+        )
+        for i in range(12)
+    ]
+    partitions = partition_pending(articles, CentroidIndex.for_articles(articles), 4)
+
+    assert len(partitions) == 4
+    for members, index in partitions:
+        events_seen = {int(a.title.split()[-1]) % 4 for a in members}
+        assert len(events_seen) == 1
+        assert (existing.pk in index) == (events_seen == {0})
+        # Input order is kept inside a partition.
+        assert [a.pk for a in members] == sorted(a.pk for a in members)
+
+
+@pytest.mark.django_db
+def test_merge_pass_folds_a_cross_partition_duplicate_into_the_older_story(
+    base_source, secondary_source
+):
+    from core.partitioning import merge_partition_duplicates
+
+    now = timezone.now()
+    vector = [1.0] + [0.0] * 383
+    older = Story.objects.create(
+        title="Older", slug="older", first_seen_at=now - timedelta(hours=1),
+        source_count=1, independent_count=1, embedding=vector,
+    )
+    newer = Story.objects.create(
+        title="Newer", slug="newer", first_seen_at=now,
+        source_count=1, independent_count=1, embedding=vector,
+    )
+    Article.objects.create(
+        source=base_source, story=older, is_primary_source=True, title="Older",
+        url="http://test.com/m/1", published_date=older.first_seen_at, embedding=vector,
+    )
+    Article.objects.create(
+        source=secondary_source, story=newer, is_primary_source=True, title="Newer",
+        url="http://another.com/m/2", published_date=newer.first_seen_at, embedding=vector,
+    )
+
+    # Same partition: left alone, as sequential clustering would have.
+    assert merge_partition_duplicates({older.pk: 0, newer.pk: 0}, {older.pk, newer.pk}) == 0
+
+    with patch("core.invalidation.invalidate_story"):
+        merged = merge_partition_duplicates({older.pk: 0, newer.pk: 1}, {older.pk, newer.pk})
+
+    assert merged == 1
+    assert not Story.objects.filter(pk=newer.pk).exists()
+    older.refresh_from_db()
+    assert older.source_count == 2
+    assert older.independent_count == 2
+    assert older.articles.filter(is_primary_source=True).get().title == "Older"
+
+
+# ==========================================================================
+# Near-duplicates
+# ==========================================================================
+
+def _report(seed, words=150):
+    import random
+
+    rng = random.Random(seed)  # noqa: S311 - test text, not a secret
+    return " ".join(f"w{rng.randrange(3000)}" for _ in range(words))
+
+
+def test_minhash_separates_wire_copies_from_other_reports():
+    from core.near_duplicates import (
+        NEAR_DUPLICATE_SIMILARITY,
+        lsh_bands,
+        minhash,
+        similarity,
+    )
+
+    original = minhash(_report(1))
+    copy = minhash("By Jane Doe, Reuters. " + _report(1) + " Additional reporting by Sam Lee.")
+    other = minhash(_report(2))
+
+    assert similarity(original, copy) >= NEAR_DUPLICATE_SIMILARITY
+    assert set(lsh_bands(original)) & set(lsh_bands(copy))
+    assert similarity(original, other) < NEAR_DUPLICATE_SIMILARITY
+    # A summary is too short to sign.
+    assert minhash("Port strike enters second week") == []
+
+
+@pytest.mark.django_db
+def test_near_duplicates_join_their_twins_story_without_being_embedded(base_source):
+    """
+    A copy of a clustered article, and a copy of an article earlier in the same
+    run, each join their twin's story. Only the one original text is embedded.
+    """
+    from core.near_duplicates import lsh_bands, minhash
+    from core.tasks import cluster_pending_articles
+
+    now = timezone.now()
+
+    def article(text, url, minutes, **fields):
+        signature = minhash(text)
+        return Article.objects.create(
+            source=Source.objects.create(name=url, url=f"http://{url}.com"),
+            title=f"Headline {url}", url=f"http://{url}.com/a",
+            published_date=now + timedelta(minutes=minutes),
+            minhash=signature, minhash_bands=lsh_bands(signature), **fields,
+        )
+
+    vector = [0.0] * 383 + [1.0]
+    story = Story.objects.create(
+        title="Earlier report", slug="earlier", first_seen_at=now - timedelta(hours=1),
+        embedding=vector, source_count=1, independent_count=1,
+    )
+    article(_report(1), "wire", -60, story=story, embedding=vector, is_primary_source=True)
+
+    copy = article("Reuters. " + _report(1), "copy", 0)
+    fresh = article(_report(2), "fresh", 1)
+    fresh_copy = article(_report(2) + " Additional reporting by Sam Lee.", "fresh-copy", 2)
+
+    model = _RecordingModel()
+    with patch("core.clustering.get_embedding_model", return_value=model), \
+            patch("core.topics.classify_batch", side_effect=_no_topics):
+        cluster_pending_articles()
+
+    assert [len(call) for call in model.calls] == [1]
+    copy.refresh_from_db()
+    fresh.refresh_from_db()
+    fresh_copy.refresh_from_db()
+    assert copy.story_id == story.pk
+    assert fresh_copy.story_id == fresh.story_id != story.pk
+    assert fresh_copy.embedding is not None
+
+
+# ==========================================================================
+# Shared embedding server
+# ==========================================================================
+
+def test_embedding_server_batches_concurrent_callers_into_one_call():
+    import asyncio
+
+    from core.services.embedding_server import EmbeddingBatcher
+
+    model = _RecordingModel()
+
+    async def run():
+        batcher = EmbeddingBatcher(model, window=0.05)
+        worker = asyncio.create_task(batcher.run())
+        try:
+            return await asyncio.gather(
+                batcher.embed(["first query"]),
+                batcher.embed(["headline one", "headline two"]),
+                batcher.embed(["second query"]),
+            )
+        finally:
+            worker.cancel()
+
+    first, headlines, second = asyncio.run(run())
+
+    assert [len(call) for call in model.calls] == [4]
+    assert (len(first), len(headlines), len(second)) == (1, 2, 1)
+    # Each caller gets its own rows back, in order.
+    assert headlines[0].index(1.0) == 1 and second[0].index(1.0) == 3
+
+
+def test_embedding_client_falls_back_to_the_in_process_model(settings):
+    from core.services import embedding_server
+
+    settings.EMBEDDING_SERVER_URL = "unix:///nonexistent/embeddings.sock"
+    model = _RecordingModel()
+    with patch.object(embedding_server, "_remote", None), \
+            patch("core.clustering.load_embedding_model", return_value=model):
+        from core.clustering import embed_text
+
+        assert embedding_server.get_remote_model() is None
+        assert embed_text("Port strike enters second week") is not None
+
+        # A server that dies between calls degrades the same way.
+        remote = embedding_server.RemoteEmbeddingModel(settings.EMBEDDING_SERVER_URL)
+        assert len(list(remote.embed(["one", "two"]))) == 2
+        assert not remote.available
+
+    assert [len(call) for call in model.calls] == [1, 2]
+
+
+def test_embedding_client_without_a_local_model_reports_embeddings_offline():
+    """/ask answers "offline" rather than a 500 when neither model is there."""
+    from core.clustering import embed_text
+    from core.services import embedding_server
+
+    remote = embedding_server.RemoteEmbeddingModel("unix:///nonexistent/embeddings.sock")
+    with patch("core.clustering.get_embedding_model", return_value=remote), \
+            patch("core.clustering.load_embedding_model", return_value=None):
+        assert embed_text("Port strike enters second week") is None
+
+
+def test_configured_embedding_model_must_match_the_stored_width(settings):
+    """A model of another width is refused at load, not on the first insert."""
+    from core import embedding_backends
+
+    class _WideModel:
+        def embed(self, texts, batch_size=256):
+            for _text in texts:
+                yield [0.0] * 768
+
+    settings.EMBEDDING_MODEL = "onnx:/models/bge-base-int8"
+    with patch.object(embedding_backends, "build_embedding_model", return_value=_WideModel()) as build:
+        assert embedding_backends.load_configured_model() is None
+    assert build.call_args.args == ("onnx:/models/bge-base-int8",)
+
+    with patch.object(embedding_backends, "build_embedding_model", return_value=_RecordingModel()):
+        assert embedding_backends.load_configured_model() is not None
+
+
+def test_a_model_that_fails_at_inference_is_disabled_once(settings):
+    """It loads but cannot embed: logged and cached as a failure, not raised per call."""
+    from core import clustering, embedding_backends
+
+    class _BrokenExport:
+        def embed(self, texts, batch_size=256):
+            raise RuntimeError("Required inputs (['token_type_ids']) are missing")
+
+    with patch.object(clustering, "_embedding_model", None), \
+            patch.object(embedding_backends, "build_embedding_model",
+                         return_value=_BrokenExport()) as build:
+        assert clustering.load_embedding_model() is None
+        assert clustering.load_embedding_model() is None
+    assert build.call_count == 1
+
+
+@pytest.mark.django_db
+def test_topics_for_a_batch_are_written_in_one_insert(base_source, category):
+    """
+    A clustering run classifies its whole batch up front and writes every
+    article's topics at once, replacing what an article had — as categories.set
+    did — and leaving untagged articles alone.
+    """
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from core.clustering import assign_topics_batch
+
+    other = Category.objects.create(name="Other", slug="other")
+    now = timezone.now()
+    articles = [
+        Article.objects.create(
+            source=base_source, title=f"Headline {i}", url=f"http://test.com/topics/{i}",
+            published_date=now, embedding=[float(i + 1)] + [0.0] * 383,
+        )
+        for i in range(3)
+    ]
+    articles[0].categories.add(other)
+    articles[2].categories.add(other)
+
+    chosen = [[("test", 0.7)], [("test", 0.6), ("other", 0.58)], []]
+    with patch("core.topics.classify_batch", return_value=chosen) as classify_batch, \
+            CaptureQueriesContext(connection) as queries:
+        assert assign_topics_batch(articles) == 2
+
+    classify_batch.assert_called_once()
+    inserts = [q for q in queries if q["sql"].startswith("INSERT")]
+    assert len(inserts) == 1
+    assert set(articles[0].categories.values_list('slug', flat=True)) == {"test"}
+    assert set(articles[1].categories.values_list('slug', flat=True)) == {"test", "other"}
+    assert set(articles[2].categories.values_list('slug', flat=True)) == {"other"}
+    assert all(a.topics_assigned for a in articles)
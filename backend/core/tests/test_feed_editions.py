@@ -0,0 +1,99 @@
+"""
+Pre-rendered feed editions.
+
+A snapshot must be the page the live path would have built, served as stored
+bytes, and revalidate to a 304 for as long as its contents are unchanged —
+including across a generation advance that did not change it.
+"""
+import gzip
+import json
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from api.editions import SNAPSHOT_EDITIONS, render_editions
+from core import generations
+from core.models import Category, Story
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_editions_are_served_as_stored_bytes(client, django_assert_num_queries):
+    business = Category.objects.create(name="Business", slug="business")
+    stories = [
+        Story.objects.create(title=f"Story {i}", slug=f"story-{i}", first_seen_at=timezone.now())
+        for i in range(3)
+    ]
+    stories[0].categories.add(business)
+
+    advanced = generations.advance(generations.scopes_changed_by([s.pk for s in stories]))
+    # Every edition but momentum, which no story here qualifies for.
+    assert render_editions(advanced) == 2 * sum(
+        1 for sort, _, _ in SNAPSHOT_EDITIONS if sort != "momentum"
+    )
+    generations.publish(advanced)
+
+    with django_assert_num_queries(0):
+        compressed = client.get("/api/v1/stories", HTTP_ACCEPT_ENCODING="gzip")
+    assert compressed["Content-Encoding"] == "gzip"
+    page = json.loads(gzip.decompress(compressed.content))
+    assert [item["slug"] for item in page["items"]] == ["story-2", "story-1", "story-0"]
+
+    plain = client.get("/api/v1/stories")
+    assert "Content-Encoding" not in plain
+    assert plain.json() == page
+    assert plain["ETag"] == compressed["ETag"]
+
+    # Nothing on the page changed, so an advance keeps the ETag and the 304.
+    generations.bump([generations.feed_scope("latest", None)])
+    revalidated = client.get("/api/v1/stories", HTTP_IF_NONE_MATCH=plain["ETag"])
+    assert revalidated.status_code == 304
+
+    new = Story.objects.create(title="Story 3", slug="story-3", first_seen_at=timezone.now())
+    generations.bump(generations.scopes_changed_by([new.pk], [new.pk]))
+    changed = client.get("/api/v1/stories", HTTP_IF_NONE_MATCH=plain["ETag"])
+    assert changed.status_code == 200
+    assert changed.json()["items"][0]["slug"] == "story-3"
+
+
+@pytest.mark.django_db
+def test_other_pages_use_the_live_feed(client):
+    Story.objects.create(title="Story", slug="story", first_seen_at=timezone.now())
+
+    response = client.get("/api/v1/stories?sort=velocity&limit=20")
+
+    assert response.status_code == 200
+    assert "ETag" not in response
+    assert response.json()["items"][0]["slug"] == "story"
+
+
+@pytest.mark.django_db
+def test_a_run_advances_only_the_scopes_it_changed():
+    """One wire article in Sport must not retire the Politics momentum edition."""
+    sport = Category.objects.create(name="Sport", slug="sport")
+    politics = Category.objects.create(name="Politics", slug="politics")
+    quiet = Story.objects.create(title="Match", slug="match", first_seen_at=timezone.now())
+    quiet.categories.add(sport)
+    developing = Story.objects.create(
+        title="Vote", slug="vote", first_seen_at=timezone.now(), momentum_outlets=3,
+    )
+    developing.categories.add(politics)
+
+    joined = generations.scopes_changed_by([quiet.pk])
+    assert generations.feed_scope("latest", "sport") in joined
+    assert generations.feed_scope("latest", None) in joined
+    assert generations.feed_scope("momentum", "sport") not in joined
+    assert generations.feed_scope("momentum", None) not in joined
+    assert not any("politics" in scope for scope in joined)
+    # Joining an existing story is covered by its story scope alone.
+    assert generations.category_scope("sport") not in joined
+
+    opened = generations.scopes_changed_by([developing.pk], [developing.pk])
+    assert generations.feed_scope("momentum", "politics") in opened
+    assert generations.category_scope("politics") in opened
+    assert generations.story_scope(developing.pk) in opened
@@ -143,6 +143,76 @@ def test_rss_ingestion_deduplication(test_source, mock_network):
     assert Article.objects.count() == 2
 
 
+@pytest.mark.django_db
+def test_feed_is_stored_in_a_fixed_number_of_statements(
+    test_source, mock_feed, mock_network, django_assert_max_num_queries
+):
+    """
+    Storing a feed is a bulk write whose statement count does not grow with the
+    number of entries. Per entry it used to be an atomic block, an exists(), a
+    create and up to five slug probes.
+    """
+    mock_feed.entries = [
+        _entry(f"http://example.com/bulk/{i}", f"Bulk headline {i}", "Body text.")
+        for i in range(25)
+    ]
+    with django_assert_max_num_queries(12):
+        assert scrape_single_source(test_source.id) == 25
+
+
+@pytest.mark.django_db
+def test_bulk_insert_keeps_slugs_unique_and_skips_stored_urls(test_source, mock_network):
+    """A taken slug gets a suffix; a URL another source already stored is skipped."""
+    other = Source.objects.create(name="Other", url="http://other.com/rss")
+    Article.objects.create(
+        source=other, title="A Breaking Tech Story", url="http://other.com/tech",
+        published_date=timezone.now(),
+    )
+    Article.objects.create(
+        source=other, title="Syndicated", url="http://example.com/article/2",
+        published_date=timezone.now(),
+    )
+
+    assert scrape_single_source(test_source.id) == 1
+
+    stored = Article.objects.get(url="http://example.com/article/1")
+    assert stored.slug.startswith("a-breaking-tech-story-")
+    assert Article.objects.filter(url="http://example.com/article/2").get().source == other
+
+
+@pytest.mark.django_db
+def test_a_slug_taken_during_the_insert_is_retried_not_lost(test_source, mock_feed):
+    """
+    Another worker can store a same-titled copy between our slug lookup and
+    our insert. The skipped entry must still land, since the validators we
+    store make the next fetch a 304.
+    """
+    from core.services import scraper as scraper_module
+
+    other = Source.objects.create(name="Other", url="http://other.com/rss")
+    Article.objects.create(
+        source=other, title="A Breaking Tech Story", slug="a-breaking-tech-story",
+        url="http://other.com/tech", published_date=timezone.now(),
+    )
+    # The first lookup predates the other worker's row.
+    unique_slugs = Article.unique_slugs
+    stale = iter([["a-breaking-tech-story", "another-science-update"]])
+
+    response = _feed_response()
+    response.headers = {'ETag': 'W/"xyz"'}
+    with patch('httpx.get', return_value=response), \
+         patch('feedparser.parse', return_value=mock_feed), \
+         patch.object(scraper_module.RSSScraper, '_enrich', lambda self, c, e: None), \
+         patch.object(Article, 'unique_slugs',
+                      side_effect=lambda titles: next(stale, None) or unique_slugs(titles)):
+        assert scrape_single_source(test_source.id) == 2
+
+    stored = Article.objects.get(url="http://example.com/article/1")
+    assert stored.slug.startswith("a-breaking-tech-story-")
+    test_source.refresh_from_db()
+    assert test_source.etag == 'W/"xyz"'
+
+
 @pytest.mark.django_db
 def test_known_urls_are_not_deep_fetched(test_source, mock_feed):
     """
@@ -295,6 +365,63 @@ def test_not_modified_counts_as_success(test_source):
     assert test_source.last_success_at is not None
 
 
+def test_learned_interval_tracks_publish_rate_within_bounds():
+    from datetime import timedelta
+
+    from core.scheduling import MAX_FETCH_INTERVAL, MIN_FETCH_INTERVAL, learned_interval
+
+    # ~100 items a day: half the mean gap of 14.4 minutes.
+    assert learned_interval(700, 0.0) == timedelta(minutes=7.2)
+    # Empty fetches stretch it, up to double.
+    assert learned_interval(700, 1.0) == timedelta(minutes=14.4)
+    assert learned_interval(10_000, 0.0) == MIN_FETCH_INTERVAL
+    assert learned_interval(1, 0.0) == MAX_FETCH_INTERVAL
+    assert learned_interval(0, 0.0) == MAX_FETCH_INTERVAL
+
+
+@pytest.mark.django_db
+def test_a_failed_fetch_is_retried_on_its_own_backoff(test_source):
+    """A quiet feed's transient error must not wait out its six-hour interval."""
+    from datetime import timedelta
+
+    from core.scheduling import MAX_FAILURE_BACKOFF, MAX_FETCH_INTERVAL, failure_backoff
+
+    test_source.fetch_interval_minutes = int(MAX_FETCH_INTERVAL.total_seconds() // 60)
+    test_source.save(update_fields=['fetch_interval_minutes'])
+
+    with patch('httpx.get', return_value=_error_response(500)):
+        scrape_single_source(test_source.id)
+
+    test_source.refresh_from_db()
+    assert test_source.next_fetch_at - timezone.now() < timedelta(minutes=6)
+    assert test_source.fetch_interval_minutes == int(MAX_FETCH_INTERVAL.total_seconds() // 60)
+
+    assert failure_backoff(3, MAX_FETCH_INTERVAL) == timedelta(minutes=20)
+    assert failure_backoff(11, MAX_FETCH_INTERVAL) == MAX_FAILURE_BACKOFF
+    # Never later than a busy feed's own cadence.
+    assert failure_backoff(3, timedelta(minutes=7)) == timedelta(minutes=7)
+
+
+def test_only_due_sources_are_claimed_and_not_twice(test_source):
+    """
+    A quiet source is pushed out after a 304; a never-fetched one is due, and
+    once claimed is not handed out again while its fetch is in flight.
+    """
+    from core.scheduling import claim_due_sources
+
+    fresh = Source.objects.create(name="Fresh", url="http://fresh.example.com/rss")
+
+    with patch('httpx.get', return_value=_error_response(304)):
+        scrape_single_source(test_source.id)
+
+    test_source.refresh_from_db()
+    assert test_source.next_fetch_at > timezone.now()
+    assert test_source.empty_fetch_rate > 0
+
+    assert claim_due_sources() == [fresh.id]
+    assert claim_due_sources() == []
+
+
 @pytest.mark.django_db
 def test_cache_validators_are_stored_for_the_next_request(test_source, mock_feed):
     """ETag/Last-Modified are captured so the next fetch can be conditional."""
@@ -311,3 +438,279 @@ def test_cache_validators_are_stored_for_the_next_request(test_source, mock_feed
     test_source.refresh_from_db()
     assert test_source.etag == 'W/"xyz"'
     assert test_source.last_modified == 'Wed, 21 Oct 2026 07:28:00 GMT'
+
+
+# ==========================================================================
+# Async ingestion engine
+# ==========================================================================
+
+@pytest.mark.django_db(transaction=True)
+def test_async_engine_records_the_same_outcomes(test_source, mock_feed):
+    """
+    One engine run over three sources — new articles, a 304 and a 404 — must
+    leave each source exactly as scrape_single_source would have.
+
+    transaction=True because the engine runs the ORM on sync_to_async's thread,
+    which cannot see a test transaction it did not open.
+    """
+    from core.ingest_engine import ingest_sources
+    from core.services import async_fetch
+
+    unchanged = Source.objects.create(
+        name="Unchanged", url="http://unchanged.example.com/rss", etag='W/"v1"',
+        consecutive_failures=2,
+    )
+    dead = Source.objects.create(
+        name="Dead", url="http://dead.example.com/rss",
+        consecutive_failures=Source.FAILURE_THRESHOLD - 1,
+    )
+    responses = {
+        test_source.url: _feed_response(),
+        unchanged.url: _error_response(304),
+        dead.url: _error_response(404),
+    }
+    sent = {}
+
+    async def fake_get(self, url, headers=None, timeout=None):
+        sent[url] = headers or {}
+        return responses[url]
+
+    async def no_enrich(self, entry):
+        return None
+
+    with patch('httpx.AsyncClient.get', fake_get), \
+         patch('feedparser.parse', return_value=mock_feed), \
+         patch.object(async_fetch.AsyncRSSScraper, '_enrich', no_enrich):
+        outcomes = ingest_sources()
+
+    assert outcomes[test_source.id] == (2, None)
+    assert outcomes[unchanged.id] == (0, None)
+    assert "404" in outcomes[dead.id][1]
+    assert Article.objects.filter(source=test_source).count() == 2
+    assert sent[unchanged.url]['If-None-Match'] == 'W/"v1"'
+
+    unchanged.refresh_from_db()
+    assert unchanged.consecutive_failures == 0
+    dead.refresh_from_db()
+    assert dead.is_active is False
+
+
+def test_host_limiter_shares_one_semaphore_per_host():
+    from core.services.async_fetch import HostLimiter
+
+    hosts = HostLimiter(limit=2)
+    assert hosts("https://Example.com/a") is hosts("https://example.com/b")
+    assert hosts("https://example.com/a") is not hosts("https://other.com/a")
+
+
+# ==========================================================================
+# URL dedup index
+# ==========================================================================
+
+class _FakeSortedSets:
+    """Just the sorted-set commands SourceUrlIndex uses, in memory."""
+
+    def __init__(self):
+        self.sets: dict[str, dict[str, float]] = {}
+
+    def exists(self, key):
+        return key in self.sets
+
+    def zmscore(self, key, members):
+        scores = self.sets.get(key, {})
+        return [scores.get(m) for m in members]
+
+    def pipeline(self, transaction=False):
+        client = self
+
+        class _Pipe:
+            def zadd(self, key, mapping):
+                client.sets.setdefault(key, {}).update(mapping)
+
+            def zremrangebyrank(self, *args):
+                pass
+
+            def expire(self, *args):
+                pass
+
+            def execute(self):
+                pass
+
+        return _Pipe()
+
+
+@pytest.mark.django_db
+def test_url_index_confirms_only_probable_hits(test_source, django_assert_num_queries):
+    """
+    A feed is checked against the source's digest index; the database is asked
+    only about the URLs the index thinks it has seen, never the whole archive.
+    """
+    from core.dedup import SourceUrlIndex
+
+    Article.objects.create(
+        source=test_source, title="Stored", url="http://example.com/stored",
+        published_date=timezone.now(),
+    )
+    index = SourceUrlIndex(test_source.id)
+    fake = _FakeSortedSets()
+
+    with patch("core.dedup._client", return_value=fake):
+        # Cold index: every URL is a candidate, and what is stored seeds it.
+        assert index.known(["http://example.com/stored", "http://example.com/new"]) == {
+            "http://example.com/stored"
+        }
+        assert len(fake.sets[index.key]) == 1
+
+        # Warm index: a feed of unseen URLs costs no query at all.
+        with django_assert_num_queries(0):
+            assert index.known(["http://example.com/a", "http://example.com/b"]) == set()
+
+        assert index.known(["http://example.com/stored"]) == {"http://example.com/stored"}
+
+
+# ==========================================================================
+# Deep-fetch page cache
+# ==========================================================================
+
+def _page_response(status, body=b"", headers=None):
+    response = MagicMock()
+    response.status_code = status
+    response.content = body
+    response.text = body.decode()
+    response.headers = headers or {}
+    response.raise_for_status = MagicMock()
+    return response
+
+
+def test_unchanged_article_page_is_not_downloaded_or_extracted_again(tmp_path):
+    """
+    The second deep fetch of a page replays its ETag; the 304 is answered from
+    the cache without running trafilatura.
+    """
+    from core.services import scraper as scraper_module
+    from core.services.page_cache import PageCache
+
+    cache = PageCache(tmp_path, 1024 * 1024)
+    page = b'<html><head><meta property="og:image" content="/lead.jpg"></head></html>'
+    client = MagicMock()
+    client.get.side_effect = [
+        _page_response(200, page, {"ETag": 'W/"p1"'}),
+        _page_response(304),
+    ]
+
+    def entry():
+        return {'url': "http://example.com/a/1", 'summary': "Short.", 'content': "Short.",
+                'image_url': None, 'deep_fetch_success': False}
+
+    scraper = scraper_module.RSSScraper()
+    with patch("core.services.page_cache.get_page_cache", return_value=cache), \
+         patch("trafilatura.extract", return_value="Full text of the article.") as extract:
+        first, second = entry(), entry()
+        scraper._enrich(client, first)
+        scraper._enrich(client, second)
+
+    assert extract.call_count == 1
+    assert client.get.call_args_list[1].kwargs['headers'] == {"If-None-Match": 'W/"p1"'}
+    assert second['content'] == first['content'] == "<p>Full text of the article.</p>"
+    assert second['deep_fetch_success'] is True
+    assert second['image_url'] == "http://example.com/lead.jpg"
+
+
+def test_a_304_keeps_the_extraction_read_with_its_validators(tmp_path):
+    """
+    The server will not resend an unchanged page, so a 304 must be answered
+    from the extraction held when the validators were sent — even if the
+    cache evicted it while the request was in flight.
+    """
+    import shutil
+
+    from core.services import scraper as scraper_module
+    from core.services.page_cache import PageCache
+
+    cache = PageCache(tmp_path, 1024 * 1024)
+    page = b'<html><head><meta property="og:image" content="/lead.jpg"></head></html>'
+    responses = iter([_page_response(200, page, {"ETag": 'W/"p1"'}), _page_response(304)])
+
+    def get(url, headers=None):
+        response = next(responses)
+        if response.status_code == 304:
+            shutil.rmtree(tmp_path / "objects")  # Evicted mid-request.
+        return response
+
+    client = MagicMock()
+    client.get.side_effect = get
+    first = {'url': "http://example.com/a/1", 'summary': "Short.", 'content': "Short.",
+             'image_url': None, 'deep_fetch_success': False}
+    second = dict(first)
+
+    scraper = scraper_module.RSSScraper()
+    with patch("core.services.page_cache.get_page_cache", return_value=cache), \
+         patch("trafilatura.extract", return_value="Full text of the article."):
+        scraper._enrich(client, first)
+        scraper._enrich(client, second)
+
+    assert second['content'] == "<p>Full text of the article.</p>"
+    assert second['image_url'] == "http://example.com/lead.jpg"
+
+
+def test_page_cache_evicts_least_recently_used_entries(tmp_path):
+    import os
+
+    from core.services.page_cache import PageCache
+
+    cache = PageCache(tmp_path, 2000)
+    for i in range(12):
+        cache.put(f"http://example.com/{i}", f"{i:064x}", {'full_text': "x" * 100, 'image': None})
+        # Distinct, increasing mtimes without sleeping.
+        for path in tmp_path.rglob("*.json"):
+            if path.stem in (f"{i:064x}",):
+                os.utime(path, (i, i))
+
+    assert sum(p.stat().st_size for p in tmp_path.rglob("*.json")) <= 2000
+    assert cache.for_content(f"{11:064x}") is not None
+    assert cache.for_content(f"{0:064x}") is None
+
+
+def test_pipelined_extraction_applies_every_page_within_the_backlog():
+    """
+    Fetchers hand pages to the extraction pool without ever having more than
+    the backlog limit in flight, and every page still gets its text.
+    """
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from core.services import extraction
+    from core.services import scraper as scraper_module
+
+    in_flight, peak = 0, 0
+    lock = threading.Lock()
+
+    def slow_extract(html):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return {'full_text': html, 'content': f"<p>{html}</p>", 'image': None}
+
+    client = MagicMock()
+    client.get.side_effect = lambda url, headers: _page_response(200, url.encode())
+    entries = [
+        {'url': f"http://example.com/a/{i}", 'summary': "", 'content': "",
+         'image_url': None, 'deep_fetch_success': False}
+        for i in range(12)
+    ]
+
+    scraper = scraper_module.RSSScraper()
+    with patch("core.services.page_cache.get_page_cache", return_value=None), \
+         patch.object(extraction, "extract_page", slow_extract), \
+         patch.object(extraction, "backlog_limit", return_value=2), \
+         ThreadPoolExecutor(max_workers=4) as fetchers, \
+         ThreadPoolExecutor(max_workers=4) as pool:
+        scraper._enrich_pipelined(client, fetchers, pool, entries)
+
+    assert peak <= 2
+    assert all(e['deep_fetch_success'] for e in entries)
+    assert entries[3]['content'] == "<p>http://example.com/a/3</p>"
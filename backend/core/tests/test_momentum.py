@@ -151,3 +151,74 @@ def test_developing_edition_reads_the_materialised_column(client, outlets):
     assert slugs[:2] == ["hot", "warm"], slugs
     assert "cold" not in slugs, "a story outside the window is not developing"
     assert payload["items"][0]["recent_outlets"] == 4
+
+
+@pytest.mark.django_db
+def test_momentum_is_maintained_incrementally(outlets):
+    """
+    Joining articles add their publishers; the periodic pass expires them. Each
+    writes only the stories whose count changed.
+    """
+    from core.models import StoryPublisher
+    from core.momentum import expire_momentum, record_publishers
+
+    published = timezone.now() - timedelta(hours=1)
+    story = Story.objects.create(
+        title="Incremental", slug="incremental", first_seen_at=published,
+    )
+    articles = [
+        Article.objects.create(
+            source=outlets[i % 2], story=story, title=f"Incremental {i}",
+            url=f"https://outlet{i}.test/incremental", published_date=published,
+        )
+        for i in range(3)
+    ]
+    steady = _story("steady", outlets, published_hours_ago=1, count=2)
+    refresh_momentum([steady.pk])
+    steady.refresh_from_db()
+    steady_computed_at = steady.momentum_computed_at
+
+    assert record_publishers(articles) == {"updated": 1}
+    story.refresh_from_db()
+    assert story.momentum_outlets == 2, "three articles from two publishers"
+
+    # A publisher already counted changes nothing, so nothing is written.
+    assert record_publishers(articles[:1]) == {"updated": 0}
+
+    StoryPublisher.objects.filter(story=story).update(
+        last_published_at=timezone.now() - timedelta(hours=MOMENTUM_WINDOW_HOURS + 1)
+    )
+    result = expire_momentum()
+
+    assert result == {"expired": 2, "updated": 1, "zeroed": 1}
+    story.refresh_from_db()
+    steady.refresh_from_db()
+    assert story.momentum_outlets == 0
+    assert steady.momentum_outlets == 2
+    assert steady.momentum_computed_at == steady_computed_at
+
+
+@pytest.mark.django_db
+def test_refresh_upserts_rows_and_drops_only_unsupported_pairs(outlets):
+    """
+    A refresh runs alongside clustering, which upserts these same rows. It must
+    not delete and re-insert them all, or a pair written in between fails its
+    unique constraint and rolls the whole pass back.
+    """
+    from core.models import StoryPublisher
+    from core.momentum import record_publishers
+
+    story = _story("shared", outlets, published_hours_ago=1, count=2)
+    record_publishers(list(story.articles.all()))
+    kept = set(StoryPublisher.objects.filter(story=story).values_list('pk', flat=True))
+    StoryPublisher.objects.create(
+        story=story, publisher="gone.test", last_published_at=timezone.now(),
+    )
+
+    refresh_momentum()
+
+    rows = StoryPublisher.objects.filter(story=story)
+    assert set(rows.values_list('pk', flat=True)) == kept
+    assert not rows.filter(publisher="gone.test").exists()
+    story.refresh_from_db()
+    assert story.momentum_outlets == 2
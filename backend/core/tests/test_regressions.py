@@ -359,3 +359,32 @@ def test_ranked_editions_do_not_repeat_rows_across_pages(client):
             f"{sort} advertised a next cursor; paginating a mutable ranking "
             f"with an immutable-key cursor repeats rows"
         )
+
+
+# ==========================================================================
+# importtime only saw what the boot script imported directly
+# ==========================================================================
+
+def test_importtime_counts_packages_imported_under_the_boot_module():
+    """
+    Everything the API loads is nested under `config.asgi`; a heavy package
+    there must still count as imported, or --fail-on can never fire.
+    """
+    from core.management.commands.importtime import parse_importtime
+
+    report = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 | encodings",
+        "import time:        40 |         40 |     numpy.core",
+        "import time:        60 |        100 |   numpy",
+        "import time:       900 |        900 |     onnxruntime",
+        "import time:        50 |        950 |   fastembed",
+        "import time:        30 |       1080 | config.asgi",
+    ])
+
+    boot, packages = parse_importtime(report)
+
+    assert boot == {"encodings": 120, "config": 1080}
+    assert packages["numpy"] == 100
+    assert packages["onnxruntime"] == 900
+    assert packages["fastembed"] == 50
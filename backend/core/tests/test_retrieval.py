@@ -174,16 +174,71 @@ def test_new_reporting_invalidates_cached_answers(embed):
     A cached answer about a developing story is wrong the moment fresh coverage
     lands. On a news product a stale answer is worse than a slow one.
     """
+    from core import generations
     from core.services import answer_cache
 
+    scopes = generations.tokens([generations.story_scope(1), generations.category_scope("world")])
     query = "What is the latest on Ukraine drone strikes?"
-    answer_cache.store(query, embed(query), "Five were killed.", ["BBC"], "llm")
+    answer_cache.store(query, embed(query), "Five were killed.", ["BBC"], "llm", scopes)
     assert answer_cache.lookup(embed(query)) is not None
 
-    answer_cache.invalidate_all()
+    # Reporting elsewhere leaves it standing...
+    generations.bump([generations.story_scope(2), generations.category_scope("sport")])
+    assert answer_cache.lookup(embed(query)) is not None
+
+    # ...reporting on a story it cited does not.
+    generations.bump([generations.story_scope(1)])
     assert answer_cache.lookup(embed(query)) is None
 
 
+@pytest.mark.django_db
+def test_a_full_cache_evicts_rather_than_refusing_answers(embed, monkeypatch):
+    """
+    Entries are bounded by eviction, not by how many a lookup can afford to
+    scan; the newest answer is always kept.
+    """
+    from core.services import answer_cache
+
+    monkeypatch.setattr(answer_cache, "MAX_CACHED_ANSWERS", 2)
+    questions = [
+        "What is the latest on Ukraine drone strikes?",
+        "What did the central bank decide about interest rates?",
+        "Who won the football final last night?",
+    ]
+    for question in questions:
+        answer_cache.store(question, embed(question), f"About: {question}", ["BBC"], "llm")
+
+    assert answer_cache.lookup(embed(questions[0])) is None
+    for question in questions[1:]:
+        assert answer_cache.lookup(embed(question))["answer"] == f"About: {question}"
+
+
+@pytest.mark.django_db
+def test_concurrent_answers_are_all_kept():
+    """
+    /ask completions land together under load. Each must be admitted on its
+    own, not rewrite an index another request is writing at the same time.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from core.services import answer_cache
+
+    def basis(i):
+        vector = [0.0] * 384
+        vector[i] = 1.0
+        return vector
+
+    def answer(i):
+        answer_cache.store(f"Question {i}", basis(i), f"Answer {i}", ["BBC"], "llm")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(answer, range(32)))
+
+    assert [answer_cache.lookup(basis(i))["answer"] for i in range(32)] == [
+        f"Answer {i}" for i in range(32)
+    ]
+
+
 # ==========================================================================
 # Synthesis regeneration policy
 # ==========================================================================
@@ -0,0 +1,58 @@
+"""
+Single-flight cache fills.
+
+The lease is held by another request in each of these; what matters is what the
+rest do meanwhile — and that none of them hangs when the holder never delivers.
+"""
+import threading
+
+import pytest
+from django.core.cache import cache
+
+from core import single_flight
+from core.single_flight import _lease_key, get_or_build
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+def _never_called():
+    raise AssertionError("a coalesced miss built the value itself")
+
+
+def test_a_miss_builds_once_and_stores():
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {"page": 1}
+
+    assert get_or_build("k", build, timeout=60) == {"page": 1}
+    assert get_or_build("k", build, timeout=60) == {"page": 1}
+    assert len(calls) == 1
+    assert cache.get(_lease_key("k")) is None, "the lease outlived the build"
+
+
+def test_waiters_get_the_stale_value_while_another_request_builds():
+    cache.set("k:stale", {"page": "previous"})
+    cache.add(_lease_key("k"), "another request")
+
+    assert get_or_build("k", _never_called, timeout=60, stale_key="k:stale") == {"page": "previous"}
+
+
+def test_waiters_without_a_stale_value_wait_for_the_holder():
+    cache.add(_lease_key("k"), "another request")
+    threading.Timer(0.1, cache.set, ("k", {"page": "fresh"})).start()
+
+    assert get_or_build("k", _never_called, timeout=60) == {"page": "fresh"}
+
+
+def test_waiters_build_when_the_holder_gives_up(monkeypatch):
+    monkeypatch.setattr(single_flight, "WAIT_SECONDS", 5.0)
+    cache.add(_lease_key("k"), "another request")
+    threading.Timer(0.1, cache.delete, (_lease_key("k"),)).start()
+
+    assert get_or_build("k", lambda: {"page": "own"}, timeout=60) == {"page": "own"}
+    assert cache.get("k") == {"page": "own"}
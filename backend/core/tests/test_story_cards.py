@@ -0,0 +1,79 @@
+"""
+The feed card projection.
+
+A card must say exactly what the per-request derivation said — earliest
+outlets first, the first image, one headline per outlet — while a newer article
+joining a full card costs no read of the story's coverage at all.
+"""
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from core.models import Article, Category, Source, Story, StoryCard
+from core.story_cards import CARD_FRAMINGS, refresh_story_cards
+
+
+@pytest.fixture
+def outlets(db):
+    return [
+        Source.objects.create(
+            name=f"Outlet {i}",
+            url=f"https://feeds.outlet{i}.test/rss",
+            trust_tier=Source.TrustTier.AUTO_PUBLISH,
+        )
+        for i in range(4)
+    ]
+
+
+def _article(story, source, minutes, image_url=None):
+    return Article.objects.create(
+        source=source, story=story, title=f"{source.name} at {minutes}",
+        url=f"https://{source.name.replace(' ', '')}.test/{story.slug}/{minutes}",
+        published_date=story.first_seen_at + timedelta(minutes=minutes),
+        image_url=image_url,
+    )
+
+
+@pytest.mark.django_db
+def test_card_is_maintained_as_articles_join(client, outlets):
+    story = Story.objects.create(title="Port strike", slug="port-strike",
+                                 first_seen_at=timezone.now() - timedelta(hours=1))
+    story.categories.add(Category.objects.create(name="Business", slug="business"))
+
+    first = [
+        _article(story, outlets[0], 0),
+        _article(story, outlets[1], 5, image_url="https://img.test/lead.jpg"),
+        _article(story, outlets[0], 10),
+    ]
+    assert refresh_story_cards([story.pk], first) == 1
+    card = StoryCard.objects.get(story=story)
+    assert card.sources == ["Outlet 0", "Outlet 1"]
+    assert card.image_url == "https://img.test/lead.jpg"
+    assert [f["source"] for f in card.framing_preview] == ["Outlet 0", "Outlet 1"]
+    assert card.category_slugs == ["business"]
+
+    # A newer article is folded in without reading the story's coverage.
+    later = _article(story, outlets[2], 20)
+    with CaptureQueriesContext(connection) as queries:
+        assert refresh_story_cards([story.pk], [later]) == 1
+    assert not any('"core_article"' in q["sql"] for q in queries)
+    card.refresh_from_db()
+    assert card.sources == ["Outlet 0", "Outlet 1", "Outlet 2"]
+    assert len(card.framing_preview) == CARD_FRAMINGS
+
+    # An outlet already on the card changes nothing, so nothing is written.
+    assert refresh_story_cards([story.pk], [_article(story, outlets[1], 30)]) == 0
+
+    # An earlier report takes the lead, which only a rebuild can place.
+    _article(story, outlets[3], -30)
+    assert refresh_story_cards([story.pk], Article.objects.filter(story=story, title__endswith="-30")) == 1
+    card.refresh_from_db()
+    assert card.sources[0] == "Outlet 3"
+
+    item = client.get("/api/v1/stories").json()["items"][0]
+    assert item["sources"] == card.sources
+    assert item["framing_preview"] == card.framing_preview
+    assert item["categories"] == ["business"]
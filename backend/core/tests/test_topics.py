@@ -99,6 +99,19 @@ def test_feed_boilerplate_is_not_force_fitted_to_a_topic(embed, text):
     )
 
 
+def test_batch_classification_matches_one_at_a_time(embed):
+    """classify_batch is the same decision as classify, one matrix product for all."""
+    from core.topics import classify_batch
+
+    texts = [h for h, _ in LABELLED_HEADLINES] + FEED_BOILERPLATE
+    vectors = [embed(t) for t in texts]
+    batched = classify_batch(vectors)
+
+    for text, vector, chosen in zip(texts, vectors, batched, strict=True):
+        single = classify(vector)
+        assert [slug for slug, _ in chosen] == [slug for slug, _ in single], text
+        assert [s for _, s in chosen] == pytest.approx([s for _, s in single]), text
+
 def test_distinctiveness_gate_sits_in_the_measured_gap(embed):
     """
     The gate must separate real headlines from feed boilerplate, with margin on
@@ -172,3 +185,63 @@ def test_frontend_taxonomy_matches_backend():
         f"taxonomy drift — only in frontend: {frontend_slugs - backend_slugs}; "
         f"only in backend: {backend_slugs - frontend_slugs}"
     )
+
+
+def test_prototypes_are_persisted_and_keyed_by_model(settings, tmp_path, monkeypatch):
+    """
+    A process with the persisted matrix loads it instead of re-embedding every
+    prototype sentence; a different model is a different key, and rebuilds.
+    """
+    from unittest.mock import patch
+
+    import numpy as np
+
+    from core import topics
+
+    class _CountingModel:
+        calls = 0
+
+        def embed(self, texts, batch_size=None):
+            _CountingModel.calls += 1
+            return (np.eye(384)[len(t) % 384] for t in texts)
+
+    settings.TOPIC_PROTOTYPE_CACHE_DIR = str(tmp_path)
+    settings.EMBEDDING_MODEL = "fastembed:test/model-a"
+    monkeypatch.setattr(topics, "_prototype_matrix", None)
+
+    with patch("core.clustering.get_embedding_model", return_value=_CountingModel()):
+        built, slugs = topics.get_prototypes()
+        built_calls = _CountingModel.calls
+        assert built_calls > 0
+        assert len(list(tmp_path.glob("prototypes-*.npy"))) == 1
+
+        # A fresh process: nothing in memory, the file on disk.
+        monkeypatch.setattr(topics, "_prototype_matrix", None)
+        loaded, loaded_slugs = topics.get_prototypes()
+        assert _CountingModel.calls == built_calls
+        assert loaded_slugs == slugs
+        np.testing.assert_allclose(loaded, built)
+
+        monkeypatch.setattr(topics, "_prototype_matrix", None)
+        settings.EMBEDDING_MODEL = "fastembed:test/model-b"
+        topics.get_prototypes()
+        assert _CountingModel.calls > built_calls
+        assert len(list(tmp_path.glob("prototypes-*.npy"))) == 2
+
+
+def test_prototypes_are_unavailable_while_no_model_can_embed(settings, tmp_path, monkeypatch):
+    """A down embedding server with no local model is "no model", not an error."""
+    from unittest.mock import patch
+
+    from core import topics
+    from core.services import embedding_server
+
+    settings.TOPIC_PROTOTYPE_CACHE_DIR = str(tmp_path)
+    monkeypatch.setattr(topics, "_prototype_matrix", None)
+    remote = embedding_server.RemoteEmbeddingModel("unix:///nonexistent/embeddings.sock")
+
+    with patch("core.clustering.get_embedding_model", return_value=remote), \
+            patch("core.clustering.load_embedding_model", return_value=None):
+        assert topics.get_prototypes() == (None, [])
+        assert topics.score_topics([1.0] + [0.0] * 383) == []
+    assert topics._prototype_matrix is None
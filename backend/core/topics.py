@@ -192,6 +192,89 @@ _prototype_matrix = None
 _prototype_slugs: list[str] = []
 
 
+def prototype_key(model_spec: str | None = None) -> str:
+    """
+    Identifies one set of prototype vectors: every topic's prototype sentences
+    and the model that embeds them. Editing a prototype or switching model
+    changes the key, so a stale matrix is never loaded.
+    """
+    import hashlib
+    import json
+
+    from django.conf import settings
+
+    from core.embedding_backends import DEFAULT_EMBEDDING_SPEC
+
+    if model_spec is None:
+        model_spec = getattr(settings, "EMBEDDING_MODEL", "") or DEFAULT_EMBEDDING_SPEC
+    definition = {
+        "model": model_spec,
+        # Pooling changes the vectors an onnx: backend produces.
+        "pooling": getattr(settings, "EMBEDDING_POOLING", "cls"),
+        "topics": [[t.slug, list(t.prototypes)] for t in TOPICS if t.prototypes],
+    }
+    return hashlib.sha256(json.dumps(definition, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def _prototype_cache_path():
+    """Where this key's matrix lives, or None when the cache is disabled."""
+    from pathlib import Path
+
+    from django.conf import settings
+
+    root = getattr(settings, "TOPIC_PROTOTYPE_CACHE_DIR", "")
+    if not root:
+        return None
+    return Path(root) / f"prototypes-{prototype_key()}.npy"
+
+
+def _load_prototypes():
+    """The persisted matrix for the current key, or None to build it."""
+    global _prototype_matrix, _prototype_slugs
+
+    import numpy as np
+
+    path = _prototype_cache_path()
+    if path is None or not path.exists():
+        return None
+    slugs = [t.slug for t in TOPICS if t.prototypes]
+    try:
+        matrix = np.load(path, allow_pickle=False)
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable topic prototypes at %s: %s", path, e)
+        return None
+    if matrix.ndim != 2 or matrix.shape[0] != len(slugs):
+        logger.warning("Ignoring topic prototypes at %s: shape %s", path, matrix.shape)
+        return None
+
+    _prototype_matrix, _prototype_slugs = matrix, slugs
+    logger.info("Loaded topic prototypes for %d topics from %s.", len(slugs), path)
+    return _prototype_matrix, _prototype_slugs
+
+
+def _save_prototypes(matrix, slugs) -> None:
+    """Persist a freshly built matrix. Best effort: a read-only disk costs a rebuild."""
+    import os
+    import tempfile
+
+    import numpy as np
+
+    path = _prototype_cache_path()
+    # The file carries no slugs; they are implied by TOPICS order, so a matrix
+    # that skipped a topic cannot be stored.
+    if path is None or slugs != [t.slug for t in TOPICS if t.prototypes]:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written aside and renamed, so a concurrent reader never sees half a file.
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, matrix, allow_pickle=False)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning("Could not persist topic prototypes to %s: %s", path, e)
+
+
 def _build_prototypes():
     """Embed every topic prototype once and average per topic."""
     global _prototype_matrix, _prototype_slugs
@@ -199,6 +282,7 @@ def _build_prototypes():
     import numpy as np
 
     from core.clustering import get_embedding_model
+    from core.services.embedding_server import EmbeddingUnavailable
 
     model = get_embedding_model()
     if model is None:
@@ -208,7 +292,14 @@ def _build_prototypes():
     for topic in TOPICS:
         if not topic.prototypes:
             continue
-        embedded = np.array(list(model.embed(list(topic.prototypes))), dtype=float)
+        try:
+            embedded = np.array(list(model.embed(list(topic.prototypes))), dtype=float)
+        except EmbeddingUnavailable as e:
+            # The embedding server went down with no local model behind it:
+            # no model, so no prototypes — and nothing cached, so the next
+            # call tries again.
+            logger.warning("%s; topic prototypes unavailable.", e)
+            return None, []
         centroid = embedded.mean(axis=0)
         norm = np.linalg.norm(centroid)
         if norm == 0:
@@ -219,16 +310,27 @@ def _build_prototypes():
     _prototype_matrix = np.vstack(vectors) if vectors else None
     _prototype_slugs = slugs
     logger.info("Built topic prototypes for %d topics.", len(slugs))
+    if _prototype_matrix is not None:
+        _save_prototypes(_prototype_matrix, slugs)
     return _prototype_matrix, _prototype_slugs
 
 
 def get_prototypes():
-    global _prototype_matrix
+    """
+    The prototype matrix and its slugs. Embedding every prototype sentence took
+    seconds at the first classification in each process, so the matrix is
+    persisted under TOPIC_PROTOTYPE_CACHE_DIR and later processes load it.
+    """
     if _prototype_matrix is None:
-        return _build_prototypes()
+        return _load_prototypes() or _build_prototypes()
     return _prototype_matrix, _prototype_slugs
 
 
+def rebuild_prototypes():
+    """Re-embed the prototypes now, replacing both the in-process and the persisted matrix."""
+    return _build_prototypes()
+
+
 def score_topics(embedding) -> list[tuple[str, float]]:
     """
     Score an article embedding against every topic prototype.
@@ -281,14 +383,63 @@ def classify(
     first — genuinely cross-cutting stories get two tags, everything else gets
     one, and filler gets none.
     """
-    ranked = score_topics(embedding)
-    if not ranked or ranked[0][1] < threshold:
-        return []
-    if distinctiveness(ranked) < min_distinctiveness:
+    if embedding is None:
         return []
+    return classify_batch([embedding], threshold, min_distinctiveness)[0]
+
+
+def classify_batch(
+    embeddings,
+    threshold: float = TOPIC_SCORE_FLOOR,
+    min_distinctiveness: float = TOPIC_DISTINCTIVENESS_MIN,
+) -> list[list[tuple[str, float]]]:
+    """
+    `classify` for N embeddings at once: one (N, dim) @ (dim, topics) product.
+
+    Classifying one article at a time cost a matrix-vector product, a Python
+    sort of every topic and a list-based mean per article. Only the top
+    MAX_TOPICS_PER_ARTICLE are ever used, so argpartition picks them per row,
+    and distinctiveness — the best score against the mean of the rest — falls
+    out of the row sum without ranking the rest at all.
+
+    Returns one list per row, in order. Zero vectors classify as nothing.
+    """
+    import numpy as np
 
-    chosen = [ranked[0]]
-    for slug, score in ranked[1:MAX_TOPICS_PER_ARTICLE]:
-        if (ranked[0][1] - score) <= SECONDARY_TOPIC_MARGIN:
-            chosen.append((slug, score))
-    return chosen
+    vectors = np.asarray(embeddings, dtype=float)
+    if vectors.ndim != 2 or not len(vectors):
+        return [[] for _ in range(len(vectors))]
+    matrix, slugs = get_prototypes()
+    if matrix is None:
+        return [[] for _ in range(len(vectors))]
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    valid = norms[:, 0] > 0
+    similarities = (vectors / np.where(norms > 0, norms, 1.0)) @ matrix.T
+
+    n_topics = len(slugs)
+    k = min(MAX_TOPICS_PER_ARTICLE, n_topics)
+    top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(similarities, top, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind='stable')
+    top = np.take_along_axis(top, order, axis=1)
+    top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+    best = top_scores[:, 0]
+    if n_topics < 2:
+        distinct = np.zeros(len(vectors))
+    else:
+        distinct = best - (similarities.sum(axis=1) - best) / (n_topics - 1)
+    keep = valid & (best >= threshold) & (distinct >= min_distinctiveness)
+
+    results: list[list[tuple[str, float]]] = []
+    for row in range(len(vectors)):
+        if not keep[row]:
+            results.append([])
+            continue
+        chosen = [(slugs[top[row, 0]], float(best[row]))]
+        for col in range(1, k):
+            if best[row] - top_scores[row, col] <= SECONDARY_TOPIC_MARGIN:
+                chosen.append((slugs[top[row, col]], float(top_scores[row, col])))
+        results.append(chosen)
+    return results